@@ -7,23 +7,40 @@ can work without internet connectivity.
 
 import os
 import sys
+import json
 import logging
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 import yaml
 
-logging.basicConfig(level=logging.INFO)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Sidecar recording the model files found in the cache directory
+MODEL_INDEX_FILE = '.model_index'
+
+# Blank test image used to verify downloaded models
+_WARMUP_IMAGE = np.full((100, 300, 3), 255, dtype=np.uint8)
 
+
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.yml."""
+    """Load configuration from config.yml.
+
+    The result is cached, so callers must not mutate it.
+    """
     config_path = Path("config.yml")
     if not config_path.exists():
         logger.warning("config.yml not found, using default cache directory")
         return {}
     
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def get_cache_directory(config: dict) -> str:
@@ -80,10 +97,9 @@ def download_paddleocr_models():
         
         # Test the model
         logger.info("\nTesting English model...")
-        import numpy as np
-        test_image = np.ones((100, 300, 3), dtype=np.uint8) * 255
-        result = ocr_en.ocr(test_image)
+        result = ocr_en.ocr(_WARMUP_IMAGE)
         logger.info("✓ English model downloaded and tested successfully!")
+        write_model_index(cache_dir)
         
         # Display cache location
         logger.info(f"\nModels are cached in: {cache_dir}")
@@ -103,15 +119,92 @@ def download_paddleocr_models():
         return False
 
 
+def iter_model_files(directory: str):
+    """Lazily yield paths of PaddleOCR weight files under a directory.
+
+    Uses os.scandir so callers that only need to know whether any model
+    exists can stop at the first hit instead of walking the whole tree.
+
+    Args:
+        directory: Directory to search recursively
+
+    Yields:
+        Paths of '*.pdparams' files
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_model_files(entry.path)
+                elif entry.name.endswith('.pdparams'):
+                    yield entry.path
+    except OSError:
+        return
+
+
+def write_model_index(cache_dir: str) -> None:
+    """Record the cached model files so later checks can skip the walk.
+
+    The index stores the cache directory's mtime and the model file
+    paths; read_model_index checks both before trusting it.
+
+    Args:
+        cache_dir: PaddleOCR cache directory
+    """
+    index_path = Path(cache_dir) / MODEL_INDEX_FILE
+    try:
+        files = sorted(iter_model_files(cache_dir))
+        # Create the sidecar first so its own creation is reflected in the
+        # recorded mtime; rewriting it below does not touch the directory
+        index_path.touch()
+        index = {
+            'mtime_ns': os.stat(cache_dir).st_mtime_ns,
+            'count': len(files),
+            'files': files
+        }
+        index_path.write_text(json.dumps(index), encoding='utf-8')
+    except OSError as e:
+        logger.warning(f"Could not write model index: {e}")
+
+
+def read_model_index(cache_dir: str):
+    """Return the model index if it is still current, else None.
+
+    The cache directory's mtime only changes when a top-level entry is
+    added or removed, so every indexed file is also checked to still
+    exist; a model deleted inside a subdirectory invalidates the index.
+
+    Args:
+        cache_dir: PaddleOCR cache directory
+
+    Returns:
+        Index dictionary, or None if missing, unreadable or stale
+    """
+    try:
+        index = json.loads((Path(cache_dir) / MODEL_INDEX_FILE).read_text(encoding='utf-8'))
+        if (os.stat(cache_dir).st_mtime_ns == index['mtime_ns']
+                and all(os.path.exists(path) for path in index['files'])):
+            return index
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
 def check_existing_models():
     """Check if PaddleOCR models are already downloaded."""
     config = load_config()
     cache_dir = get_cache_directory(config)
     
+    index = read_model_index(cache_dir)
+    if index is not None and index['count'] > 0:
+        logger.info(f"Found {index['count']} cached model files in: {cache_dir}")
+        return True
+    
     if os.path.exists(cache_dir):
-        model_files = list(Path(cache_dir).rglob('*.pdparams'))
-        if model_files:
-            logger.info(f"Found {len(model_files)} cached model files in: {cache_dir}")
+        if next(iter_model_files(cache_dir), None) is not None:
+            if logger.isEnabledFor(logging.INFO):
+                count = sum(1 for _ in iter_model_files(cache_dir))
+                logger.info(f"Found {count} cached model files in: {cache_dir}")
             return True
     
     logger.info("No cached models found.")
@@ -120,6 +213,7 @@ def check_existing_models():
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=logging.INFO)
     logger.info("PaddleOCR Model Downloader")
     logger.info("=" * 50)
     
@@ -4,10 +4,11 @@ __version__ = "0.1.0"
 __author__ = "Caption Extractor Team"
 __description__ = "OCR text extraction from images using PaddleOCR PP-OCRv5"
 
-from .ocr.ocr_processor import OCRProcessor
-from .config_manager import ConfigManager
-from .pipeline.image_processor import ImageProcessor
-from .pipeline.batch_processor.batch_processor_by_steps import BatchProcessorBySteps
+import logging
+
+# Logging is configured by the application (see logging_config.setup_logging);
+# as a library the package only installs a NullHandler.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __all__ = [
     "OCRProcessor",
@@ -15,3 +16,27 @@ __all__ = [
     "ImageProcessor",
     "BatchProcessorBySteps",
 ]
+
+# Public names are imported on first access so that importing the package
+# (e.g. for `caption-extractor --help`) does not pull in OpenCV/PaddleOCR.
+_LAZY_IMPORTS = {
+    "OCRProcessor": ".ocr.ocr_processor",
+    "ConfigManager": ".config_manager",
+    "ImageProcessor": ".pipeline.image_processor",
+    "BatchProcessorBySteps": ".pipeline.batch_processor.batch_processor_by_steps",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
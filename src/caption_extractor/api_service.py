@@ -1,19 +1,25 @@
 """FastAPI service for image processing API."""
 
 import os
+import json
+import hashlib
 import logging
 import tempfile
+import time
 import uuid
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+import cv2
+import numpy as np
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Request
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, load_config_file
+from .logging_config import setup_logging
 from .pipeline.step_processor.single_image_processor import SingleImageProcessor
 from .performance import PerformanceStatsManager
 
@@ -21,10 +27,24 @@ from .performance import PerformanceStatsManager
 # Get logger - logging will be configured by ConfigManager
 logger = logging.getLogger(__name__)
 
+# Environment variable used by run_server to pass the config path to workers
+CONFIG_PATH_ENV = 'CAPTION_EXTRACTOR_CONFIG'
+
+# Size of chunks used to stream uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Marker written to the OCR model cache after a successful warmup
+WARMUP_STAMP_FILE = '.warmup_stamp'
+
+# Blank image used for OCR warmup passes
+_WARMUP_IMAGE = np.full((640, 640, 3), 255, dtype=np.uint8)
+
 
 # Request/Response Models
 class ProcessingOptions(BaseModel):
     """Processing pipeline options."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     enable_ocr: Optional[bool] = Field(
         None, 
         description="Enable OCR text extraction (default: from config)"
@@ -53,6 +73,8 @@ class ProcessingOptions(BaseModel):
 
 class HealthResponse(BaseModel):
     """Health check response."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     status: str = Field(..., description="Service status")
     version: str = Field(..., description="API version")
     config_loaded: bool = Field(..., description="Configuration status")
@@ -60,19 +82,68 @@ class HealthResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Error response model."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Error details")
 
 
+def resolve_config_path() -> str:
+    """Locate the configuration file for this worker.
+
+    Uses the path passed by run_server, else looks for config.yml in the
+    current directory or the project root.
+    """
+    config_path = os.environ.get(CONFIG_PATH_ENV, "config.yml")
+    if not os.path.exists(config_path):
+        # Try parent directory
+        parent_config = Path(__file__).parent.parent.parent / "config.yml"
+        if parent_config.exists():
+            config_path = str(parent_config)
+    return config_path
+
+
+def create_app(enable_docs: bool = True) -> FastAPI:
+    """Create the FastAPI application.
+
+    Args:
+        enable_docs: Serve Swagger UI, ReDoc and the OpenAPI schema
+
+    Returns:
+        FastAPI application
+    """
+    if enable_docs:
+        docs_urls = {
+            'docs_url': "/docs",
+            'redoc_url': "/redoc",
+            'openapi_url': "/openapi.json"
+        }
+    else:
+        docs_urls = {'docs_url': None, 'redoc_url': None, 'openapi_url': None}
+
+    return FastAPI(
+        title="Caption Extractor API",
+        description="Extract and analyze text from images using OCR and AI agents",
+        version="1.0.0",
+        **docs_urls
+    )
+
+
+def _docs_enabled() -> bool:
+    """Read api.enable_docs from the config passed by run_server."""
+    config_path = os.environ.get(CONFIG_PATH_ENV)
+    if not config_path:
+        return True
+    try:
+        config = load_config_file(config_path) or {}
+    except Exception as e:
+        logger.warning(f"Could not read api.enable_docs, keeping docs enabled: {e}")
+        return True
+    return bool(config.get('api', {}).get('enable_docs', True))
+
+
 # Initialize FastAPI app
-app = FastAPI(
-    title="Caption Extractor API",
-    description="Extract and analyze text from images using OCR and AI agents",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json"
-)
+app = create_app(_docs_enabled())
 
 
 # Global state
@@ -104,7 +175,9 @@ def initialize_services(config_path: str = "config.yml"):
         
         logger.info("Initializing image processor")
         image_processor = SingleImageProcessor(config_manager, performance_stats)
-        
+
+        _warmup_image_processor()
+
         logger.info("Services initialized successfully")
         
     except Exception as e:
@@ -112,6 +185,91 @@ def initialize_services(config_path: str = "config.yml"):
         raise
 
 
+def _warmup_image_processor() -> None:
+    """Run dummy OCR passes so the first request doesn't pay PaddleOCR init.
+
+    PaddleOCR loads weights and sets up kernels lazily on the first
+    inference. Running it on a blank image at startup moves that cost off
+    the request path. Failures are logged and ignored.
+    """
+    warmup_config = config_manager.get_warmup_config()
+    pipeline_config = config_manager.config.get('pipeline', {})
+    if not warmup_config['enabled'] or not pipeline_config.get('enable_ocr', False):
+        logger.info("OCR warmup skipped")
+        return
+
+    try:
+        # Models unchanged since the last warmup: one pass is enough to load
+        # them into this process, skip the extra iterations
+        cache_dir = config_manager.get_ocr_cache_dir()
+        fingerprint = _model_files_fingerprint(cache_dir)
+        iterations = warmup_config['iterations']
+        if _read_warmup_stamp(cache_dir) == fingerprint:
+            iterations = 1
+
+        logger.info(f"Warming up OCR pipeline ({iterations} iteration(s))")
+        for _ in range(iterations):
+            image_processor.process_image_array(
+                _WARMUP_IMAGE,
+                'warmup.jpg',
+                enable_ocr=True,
+                enable_image_agent=False,
+                enable_text_agent=False,
+                enable_translation=False
+            )
+
+        # Warmup passes are not real requests; keep them out of the stats
+        if performance_stats:
+            performance_stats.reset_stats()
+        _write_warmup_stamp(cache_dir, fingerprint)
+        logger.info("OCR warmup completed")
+
+    except Exception as e:
+        logger.warning(f"OCR warmup failed, first request may be slow: {e}")
+
+
+def _model_files_fingerprint(cache_dir: str) -> str:
+    """Hash the paths and modification times of cached model files.
+
+    Args:
+        cache_dir: PaddleOCR model cache directory
+
+    Returns:
+        Hex digest identifying the current set of model files
+    """
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(cache_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name == WARMUP_STAMP_FILE:
+                continue
+            path = os.path.join(root, name)
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            digest.update(f"{path}:{mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _read_warmup_stamp(cache_dir: str) -> Optional[str]:
+    """Read the model fingerprint recorded by the last successful warmup."""
+    try:
+        with open(os.path.join(cache_dir, WARMUP_STAMP_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f).get('fingerprint')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_warmup_stamp(cache_dir: str, fingerprint: str) -> None:
+    """Record the model fingerprint after a successful warmup."""
+    try:
+        with open(os.path.join(cache_dir, WARMUP_STAMP_FILE), 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint, 'warmed_at': time.time()}, f)
+    except OSError as e:
+        logger.debug(f"Could not write warmup stamp: {e}")
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
@@ -120,15 +278,12 @@ async def startup_event():
         static_path = get_project_root() / "static"
         app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
-        # Look for config.yml in current directory or parent directories
-        config_path = "config.yml"
-        if not os.path.exists(config_path):
-            # Try parent directory
-            parent_config = Path(__file__).parent.parent.parent / "config.yml"
-            if parent_config.exists():
-                config_path = str(parent_config)
-        
-        initialize_services(config_path)
+        initialize_services(resolve_config_path())
+
+        # Build the OpenAPI schema now rather than on the first /openapi.json
+        # hit; app.openapi() caches it on app.openapi_schema
+        if app.openapi_url:
+            app.openapi()
         
         # Start periodic performance logging if enabled
         if performance_stats:
@@ -215,38 +370,65 @@ async def process_image(
             detail=f"Invalid file type: {file.content_type}. Please upload an image file."
         )
     
+    if vision_model == "string": 
+        vision_model = "gemma3:latest"
+    if text_model == "string":
+        text_model = "mistral:latest"
+    
+    options = {
+        'enable_ocr': enable_ocr,
+        'enable_image_agent': enable_image_agent,
+        'enable_text_agent': enable_text_agent,
+        'enable_translation': enable_translation,
+        'vision_model': vision_model,
+        'text_model': text_model
+    }
+    
     temp_file_path = None
     
     try:
-        # Create temporary file to store uploaded image
-        suffix = Path(file.filename).suffix if file.filename else '.jpg'
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-            temp_file_path = temp_file.name
+        if image_processor.needs_image_file(enable_image_agent):
+            # Create temporary file to store uploaded image
+            suffix = Path(file.filename).suffix if file.filename else '.jpg'
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+                temp_file_path = temp_file.name
+                
+                # Stream uploaded file to disk without buffering it whole
+                total_bytes = 0
+                while True:
+                    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    temp_file.write(chunk)
+                    total_bytes += len(chunk)
+                
+                logger.info(
+                    f"Processing uploaded image: {file.filename} "
+                    f"({total_bytes} bytes) -> {temp_file_path}"
+                )
             
-            # Write uploaded file to disk
+            # Process the image
+            result = image_processor.process_image(
+                image_path=temp_file_path, **options
+            )
+        else:
+            # No step needs a file on disk: decode the upload in memory
             content = await file.read()
-            temp_file.write(content)
+            image = cv2.imdecode(np.frombuffer(content, np.uint8), cv2.IMREAD_COLOR)
+            if image is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Could not decode image: {file.filename}"
+                )
             
             logger.info(
-                f"Processing uploaded image: {file.filename} "
-                f"({len(content)} bytes) -> {temp_file_path}"
+                f"Processing uploaded image in memory: {file.filename} "
+                f"({len(content)} bytes)"
+            )
+            
+            result = image_processor.process_image_array(
+                image, file.filename or 'upload', **options
             )
-
-            if vision_model == "string": 
-                vision_model = "gemma3:latest"
-            if text_model == "string":
-                text_model = "mistral:latest"
-        
-        # Process the image
-        result = image_processor.process_image(
-            image_path=temp_file_path,
-            enable_ocr=enable_ocr,
-            enable_image_agent=enable_image_agent,
-            enable_text_agent=enable_text_agent,
-            enable_translation=enable_translation,
-            vision_model=vision_model,
-            text_model=text_model
-        )
         
         # Update image filename in result
         if result:
@@ -257,6 +439,9 @@ async def process_image(
         
         return result
         
+    except HTTPException:
+        raise
+        
     except Exception as e:
         logger.error(f"Error processing image: {e}", exc_info=True)
         raise HTTPException(
@@ -471,10 +656,13 @@ def run_server(config_path: str = "config.yml"):
     """
     import uvicorn
     
-    # Load config to get port
+    # Only the api section and logging are needed here; the full
+    # ConfigManager is built once per worker in startup_event
     try:
-        cfg_mgr = ConfigManager(config_path)
-        api_config = cfg_mgr.config.get('api', {})
+        config = load_config_file(config_path) or {}
+        setup_logging(config)
+        os.environ[CONFIG_PATH_ENV] = os.path.abspath(config_path)
+        api_config = config.get('api', {})
         host = api_config.get('host', '0.0.0.0')
         port = api_config.get('port', 8000)
         reload = api_config.get('reload', False)
@@ -486,8 +674,9 @@ def run_server(config_path: str = "config.yml"):
         reload_excludes = api_config.get('reload_excludes', None)
         
         logger.info(f"Starting Caption Extractor API server on {host}:{port}")
-        logger.info(f"Swagger UI: http://{host}:{port}/docs")
-        logger.info(f"ReDoc: http://{host}:{port}/redoc")
+        if api_config.get('enable_docs', True):
+            logger.info(f"Swagger UI: http://{host}:{port}/docs")
+            logger.info(f"ReDoc: http://{host}:{port}/redoc")
         
         # Build uvicorn.run arguments
         run_args = {
@@ -1,12 +1,63 @@
 """Configuration management for Caption Extractor."""
 
 import os
+import copy
 import yaml
 import logging
-from typing import Dict, Any, List
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 
 from .logging_config import setup_logging
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+DEFAULT_SUPPORTED_FORMATS = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp']
+
+DEFAULT_IMAGE_RESIZE = {
+    'enabled': True,
+    'max_size': [1024, 1024],
+    'keep_aspect': True,
+    'interpolation': 'area'
+}
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file; cached per (path, mtime) so edits are picked up."""
+    with open(config_path, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
+
+def load_config_file(config_path: str) -> Dict[str, Any]:
+    """Parse a YAML configuration file.
+
+    Repeated loads of an unchanged file reuse the cached parse. Callers get
+    their own copy, since the CLI mutates the returned configuration.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        Configuration dictionary
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        yaml.YAMLError: If config file is invalid
+    """
+    try:
+        config_path = os.path.abspath(config_path)
+        config = _parse_config_file(config_path, os.stat(config_path).st_mtime_ns)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    except yaml.YAMLError as e:
+        raise yaml.YAMLError(f"Error parsing configuration file: {e}")
+    return copy.deepcopy(config)
+
 
 class ConfigManager:
     """Manages configuration loading and validation."""
@@ -19,6 +70,12 @@ class ConfigManager:
         """
         self.config_path = config_path
         self.config = self._load_config()
+        # Keep references to the sections read by the getters. They are the
+        # same dicts as in self.config, so CLI overrides stay visible.
+        self._model = self.config.setdefault('model', {})
+        self._data = self.config.setdefault('data', {})
+        self._processing = self.config.setdefault('processing', {})
+        self._performance = self.config.setdefault('performance', {})
         self._setup_logging()
         self._create_directories()
         self.logger = logging.getLogger(__name__)
@@ -33,14 +90,7 @@ class ConfigManager:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If config file is invalid
         """
-        try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                return config
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-        except yaml.YAMLError as e:
-            raise yaml.YAMLError(f"Error parsing configuration file: {e}")
+        return load_config_file(self.config_path)
     
     def _setup_logging(self) -> None:
         """Setup logging based on configuration."""
@@ -51,57 +101,100 @@ class ConfigManager:
         """Create necessary directories based on configuration."""
         logger = logging.getLogger(__name__)
         
-        # Create model directory
-        model_dir = self.get_model_dir()
-        os.makedirs(model_dir, exist_ok=True)
-        logger.debug(f"Model directory created/verified: {model_dir}")
-        
-        # Create data directory if it doesn't exist
-        data_dir = self.get_input_folder()
-        os.makedirs(data_dir, exist_ok=True)
-        logger.debug(f"Data directory created/verified: {data_dir}")
+        # Model and data directories; the logs directory is already
+        # created by setup_logging
+        directories = {self.get_model_dir(), self.get_input_folder()}
+        directories.discard('')
         
-        # Create logs directory (guard empty paths)
-        log_file = self.config.get('logging', {}).get('file', 'logs/caption_extractor.log')
-        log_dir = os.path.dirname(log_file)
-        if log_dir:
-            os.makedirs(log_dir, exist_ok=True)
-            logger.debug(f"Logs directory created/verified: {log_dir}")
+        for directory in directories:
+            if not os.path.isdir(directory):
+                Path(directory).mkdir(parents=True, exist_ok=True)
+        logger.debug(f"Directories created/verified: {sorted(directories)}")
     
     def get_model_dir(self) -> str:
         """Get model storage directory."""
-        return self.config.get('model', {}).get('model_dir', 'models')
+        return self._model.get('model_dir', 'models')
     
     def get_input_folder(self) -> str:
         """Get input folder path."""
-        return self.config.get('data', {}).get('input_folder', 'data')
+        return self._data.get('input_folder', 'data')
     
     def get_supported_formats(self) -> List[str]:
         """Get supported image formats."""
-        return self.config.get('data', {}).get('supported_formats', ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'])
+        return self._data.get('supported_formats', DEFAULT_SUPPORTED_FORMATS)
+    
+    def get_file_size_limits(self) -> Tuple[int, Optional[int]]:
+        """Get the (min, max) image file size in bytes to process.
+        
+        Files smaller than min_file_size bytes (default 1, i.e. skip empty
+        files) or larger than max_file_size_mb (default: no limit) are
+        skipped during folder scans.
+        """
+        min_size = int(self._data.get('min_file_size', 1))
+        max_size_mb = self._data.get('max_file_size_mb')
+        max_size = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+        return min_size, max_size
+    
+    def is_dedupe_enabled(self) -> bool:
+        """Check if identical image files are processed only once."""
+        return self._data.get('dedupe', False)
+    
+    def get_result_format(self) -> str:
+        """Get the format of per-image result files ('yaml' or 'json')."""
+        result_format = str(self._data.get('result_format', 'yaml')).lower()
+        if result_format not in ('yaml', 'json'):
+            logging.getLogger(__name__).warning(
+                f"Unknown result_format '{result_format}', using yaml"
+            )
+            return 'yaml'
+        return result_format
+    
+    def get_supported_format_set(self) -> FrozenSet[str]:
+        """Get supported image formats as a set of lowercase extensions."""
+        return frozenset(fmt.lower() for fmt in self.get_supported_formats())
     
     def get_num_threads(self) -> int:
         """Get number of processing threads."""
-        return self.config.get('processing', {}).get('num_threads', 4)
+        return self._processing.get('num_threads', 4)
     def get_batch_size(self) -> int:
         """Get batch size for processing."""
-        return self.config.get('processing', {}).get('batch_size', 10)
+        return self._processing.get('batch_size', 10)
+    
+    def get_prefetch_depth(self) -> int:
+        """Get number of images decoded ahead of the one being processed."""
+        return max(0, int(self._processing.get('prefetch_images', 2)))
+    
+    def get_schedule(self) -> str:
+        """Get batch scheduling order: 'lpt' (largest files first) or 'alpha'."""
+        schedule = str(self._processing.get('schedule', 'lpt')).lower()
+        return schedule if schedule in ('lpt', 'alpha') else 'lpt'
+    
+    def is_force_reprocess(self) -> bool:
+        """Check if images with up-to-date results are processed again."""
+        return self._processing.get('force_reprocess', False)
     
     def is_progress_enabled(self) -> bool:
         """Check if progress display is enabled."""
-        return self.config.get('processing', {}).get('show_progress', True)
+        return self._processing.get('show_progress', True)
     
     def is_timing_enabled(self) -> bool:
         """Check if timing is enabled."""
-        return self.config.get('processing', {}).get('enable_timing', True)
+        return self._processing.get('enable_timing', True)
     
     def get_ocr_config(self) -> Dict[str, Any]:
         """Get OCR configuration."""
-        return self.config.get('model', {})
+        return self._model
+    
+    def get_ocr_cache_dir(self) -> str:
+        """Get absolute PaddleOCR model cache directory."""
+        cache_dir = self.config.get('ocr', {}).get('model_cache_dir')
+        if cache_dir:
+            return os.path.abspath(os.path.expanduser(cache_dir))
+        return os.path.expanduser('~/.paddleocr')
     
     def get_performance_config(self) -> Dict[str, Any]:
         """Get performance configuration."""
-        return self.config.get('performance', {})
+        return self._performance
 
     def get_image_resize_spec(self) -> Dict[str, Any]:
         """Get image resize specification for the image agent.
@@ -115,10 +208,17 @@ class ConfigManager:
         Defaults to resizing to 1024x1024 while keeping aspect ratio.
         """
         pipeline = self.config.get('pipeline', {})
-        default = {
-            'enabled': True,
-            'max_size': [1024, 1024],
-            'keep_aspect': True,
-            'interpolation': 'area'
-        }
-        return pipeline.get('image_resize', default)
\ No newline at end of file
+        return pipeline.get('image_resize', DEFAULT_IMAGE_RESIZE)
+
+    def get_warmup_config(self) -> Dict[str, Any]:
+        """Get OCR warmup configuration for the API service.
+
+        Returns a dictionary with keys:
+            - enabled: bool (run a dummy inference at startup)
+            - iterations: int (number of warmup passes)
+        """
+        warmup = self.config.get('pipeline', {}).get('warmup', {}) or {}
+        return {
+            'enabled': warmup.get('enabled', True),
+            'iterations': max(1, int(warmup.get('iterations', 1)))
+        }
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""Run the image, text and translator agents as a concurrent pipeline."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ollama_client import OllamaClient
+
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class AgentPipeline:
+    """Pipeline image analysis, text correction and translation over many images.
+
+    Each stage has its own queue and workers, so while one image is being
+    translated the next is being corrected and a third is being analyzed.
+    Throughput approaches that of the slowest stage instead of the sum of
+    all three. Requests from all stages share one semaphore sized to
+    ollama_client.num_parallel, which should match the server's
+    OLLAMA_NUM_PARALLEL.
+    """
+
+    def __init__(
+        self,
+        ollama_client: OllamaClient,
+        image_agent=None,
+        text_agent=None,
+        translator_agent=None,
+        workers_per_stage: int = 1
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            ollama_client: Ollama client shared by the agents
+            image_agent: Optional ImageAgent; without it the stage is skipped
+            text_agent: Optional TextAgent; without it the stage is skipped
+            translator_agent: Optional TranslatorAgent; without it the stage
+                is skipped
+            workers_per_stage: Concurrent workers in each stage
+        """
+        self.ollama_client = ollama_client
+        self.image_agent = image_agent
+        self.text_agent = text_agent
+        self.translator_agent = translator_agent
+        self.workers_per_stage = max(1, workers_per_stage)
+        self.logger = logging.getLogger(__name__)
+
+    async def run(
+        self, items: List[Tuple[str, Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """Process images through all enabled stages.
+
+        The client's async HTTP connections are closed before returning,
+        since they cannot be reused once the event loop ends.
+
+        Args:
+            items: (image_path, ocr_text) tuples
+
+        Returns:
+            One dict per item, in input order, with 'image_path' and the
+            'image_analysis', 'text_processing' and 'translation_result'
+            of each stage (None if skipped or failed)
+        """
+        if not items:
+            return []
+
+        semaphore = asyncio.Semaphore(max(1, self.ollama_client.num_parallel))
+        queue_size = 2 * self.workers_per_stage
+        vision_q = asyncio.Queue(maxsize=queue_size)
+        text_q = asyncio.Queue(maxsize=queue_size)
+        translate_q = asyncio.Queue(maxsize=queue_size)
+        out_q = asyncio.Queue()
+
+        stages = [
+            (vision_q, text_q, self._analyze),
+            (text_q, translate_q, self._correct),
+            (translate_q, out_q, self._translate),
+        ]
+        tasks = []
+        for in_q, out, handler in stages:
+            workers = [
+                asyncio.create_task(self._worker(in_q, out, handler, semaphore))
+                for _ in range(self.workers_per_stage)
+            ]
+            tasks.extend(workers)
+            # Close the next stage once every worker of this one has finished
+            tasks.append(asyncio.create_task(self._close_stage(workers, out)))
+
+        try:
+            for index, (image_path, ocr_text) in enumerate(items):
+                await vision_q.put((index, {
+                    'image_path': image_path,
+                    'ocr_text': ocr_text,
+                    'image_analysis': None,
+                    'text_processing': None,
+                    'translation_result': None
+                }))
+            for _ in range(self.workers_per_stage):
+                await vision_q.put(_DONE)
+
+            # Items finish out of order; slot each one back into place
+            results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+            while True:
+                entry = await out_q.get()
+                if entry is _DONE:
+                    break
+                index, item = entry
+                results[index] = item
+            return results
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.ollama_client.aclose()
+
+    async def _worker(self, in_q, out_q, handler, semaphore) -> None:
+        """Pull items from in_q, run the stage handler and push them on."""
+        while True:
+            entry = await in_q.get()
+            if entry is _DONE:
+                return
+            index, item = entry
+            try:
+                await handler(item, semaphore)
+            except Exception as e:
+                self.logger.error(
+                    f"Pipeline stage failed for {item['image_path']}: {e}",
+                    exc_info=True
+                )
+            await out_q.put((index, item))
+
+    async def _close_stage(self, workers, out_q) -> None:
+        """Signal the downstream stage once all workers of a stage are done."""
+        await asyncio.gather(*workers)
+        for _ in range(self.workers_per_stage):
+            await out_q.put(_DONE)
+
+    async def _analyze(self, item: Dict[str, Any], semaphore) -> None:
+        """Vision stage: analyze the image."""
+        if self.image_agent is None:
+            return
+        async with semaphore:
+            item['image_analysis'] = await self.image_agent.aanalyze_image(
+                item['image_path'], item['ocr_text']
+            )
+
+    async def _correct(self, item: Dict[str, Any], semaphore) -> None:
+        """Text stage: correct the OCR text using the image analysis."""
+        if self.text_agent is None or not item['ocr_text']:
+            return
+        async with semaphore:
+            item['text_processing'] = await self.text_agent.aprocess_text(
+                item['ocr_text'], item['image_analysis']
+            )
+
+    async def _translate(self, item: Dict[str, Any], semaphore) -> None:
+        """Translation stage: translate corrected text that needs it."""
+        text_processing = item['text_processing']
+        if self.translator_agent is None or not text_processing:
+            return
+        if not text_processing.get('needTranslation', False):
+            return
+        primary_text = (
+            text_processing.get('primary_text') or
+            text_processing.get('corrected_text', '')
+        )
+        if not primary_text:
+            return
+        async with semaphore:
+            item['translation_result'] = (
+                await self.translator_agent.atranslate_to_english(
+                    primary_text, text_processing.get('language_code')
+                )
+            )
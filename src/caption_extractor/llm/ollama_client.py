@@ -1,11 +1,58 @@
 """Ollama client for connecting to local Ollama instance."""
 
+import os
+import asyncio
 import logging
 import base64
+import time
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Awaitable, Iterable, List, Optional
 from pathlib import Path
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    # SIMD base64 (libbase64); several times faster on multi-MB images
+    import pybase64 as _base64
+except ImportError:
+    _base64 = base64
+
+
+def b64encode_image(image_bytes: bytes) -> str:
+    """Base64-encode image bytes for the Ollama API.
+
+    Args:
+        image_bytes: Encoded image file content
+
+    Returns:
+        Base64 encoded image string
+    """
+    return _base64.b64encode(image_bytes).decode('ascii')
+
+
+async def gather_bounded(awaitables: Iterable[Awaitable], limit: int) -> List[Any]:
+    """Await all awaitables concurrently, at most `limit` at a time.
+
+    Args:
+        awaitables: Awaitables to run
+        limit: Maximum number running at once
+
+    Returns:
+        Results in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(awaitable):
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*[_run(a) for a in awaitables])
+
 
 class OllamaClient:
     """Client for interacting with local Ollama API."""
@@ -22,6 +69,26 @@ class OllamaClient:
         ollama_config = config.get('ollama', {})
         self.host = ollama_config.get('host', 'http://localhost:11434')
         self.timeout = ollama_config.get('timeout', 120)
+        # Concurrent requests used by the async fan-out helpers; match the
+        # server's OLLAMA_NUM_PARALLEL
+        self.num_parallel = int(
+            ollama_config.get('num_parallel')
+            or os.environ.get('OLLAMA_NUM_PARALLEL', 4)
+        )
+        # httpx.AsyncClient is bound to the event loop it was created on
+        self._async_client = None
+        self._async_loop = None
+        
+        # One pooled keep-alive session shared by every agent using this
+        # client, instead of a new connection per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate'
+        })
         
         self.logger.info(f"Initialized Ollama client with host: {self.host}")
         
@@ -36,7 +103,7 @@ class OllamaClient:
             True if connection successful, False otherwise
         """
         try:
-            response = requests.get(f"{self.host}/api/tags", timeout=5)
+            response = self.session.get(f"{self.host}/api/tags", timeout=5)
             if response.status_code == 200:
                 self.logger.info("Successfully connected to Ollama")
                 return True
@@ -57,26 +124,28 @@ class OllamaClient:
             Base64 encoded image string
         """
         with open(image_path, 'rb') as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+            return b64encode_image(image_file.read())
     
     def generate_with_image(
         self, 
         model: str, 
         prompt: str, 
-        image_path: str,
+        image_path: Optional[str],
         system_prompt: Optional[str] = None,
         temperature: float = 0.7,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        image_b64: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Generate text response based on image and prompt.
         
         Args:
             model: Model name to use
             prompt: User prompt
-            image_path: Path to image file
+            image_path: Path to image file (ignored if image_b64 is given)
             system_prompt: System prompt (optional)
             temperature: Generation temperature
             max_tokens: Maximum tokens to generate
+            image_b64: Already base64-encoded image (optional)
             
         Returns:
             Dict with response, model, and processing_time, or None if failed
@@ -85,7 +154,8 @@ class OllamaClient:
             self.logger.debug(f"Generating with image using model: {model}")
             
             # Encode image
-            image_b64 = self._encode_image(image_path)
+            if image_b64 is None:
+                image_b64 = self._encode_image(image_path)
             
             # Prepare request payload
             payload = {
@@ -103,9 +173,8 @@ class OllamaClient:
                 payload["system"] = system_prompt
             
             # Make request and track time
-            import time
             start_time = time.perf_counter()
-            response = requests.post(
+            response = self.session.post(
                 f"{self.host}/api/generate",
                 json=payload,
                 timeout=self.timeout
@@ -119,7 +188,8 @@ class OllamaClient:
                 return {
                     'response': generated_text,
                     'model': model,
-                    'processing_time': round(processing_time, 3)
+                    'processing_time': round(processing_time, 3),
+                    'tokens': result.get('eval_count', 0)
                 }
             else:
                 self.logger.error(f"Ollama API returned status {response.status_code}: {response.text}")
@@ -170,9 +240,8 @@ class OllamaClient:
                 payload["system"] = system_prompt
             
             # Make request and track time
-            import time
             start_time = time.perf_counter()
-            response = requests.post(
+            response = self.session.post(
                 f"{self.host}/api/generate",
                 json=payload,
                 timeout=self.timeout
@@ -186,7 +255,8 @@ class OllamaClient:
                 return {
                     'response': generated_text,
                     'model': model,
-                    'processing_time': round(processing_time, 3)
+                    'processing_time': round(processing_time, 3),
+                    'tokens': result.get('eval_count', 0)
                 }
             else:
                 self.logger.error(f"Ollama API returned status {response.status_code}: {response.text}")
@@ -199,6 +269,181 @@ class OllamaClient:
             self.logger.error(f"Error generating text: {e}", exc_info=True)
             return None
     
+    async def _get_async_client(self):
+        """Get the httpx AsyncClient for the running event loop.
+        
+        A client left over from an earlier event loop is closed when it is
+        replaced, so its connection pool is not leaked.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_client
+        if client is None or self._async_loop is not loop:
+            stale = client
+            client = self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers={'Accept-Encoding': 'gzip, deflate'},
+                limits=httpx.Limits(
+                    max_connections=max(self.num_parallel, 1) * 2,
+                    max_keepalive_connections=40,
+                    keepalive_expiry=30
+                )
+            )
+            self._async_loop = loop
+            if stale is not None:
+                try:
+                    await stale.aclose()
+                except Exception as e:
+                    # Its connections may belong to a loop that is already closed
+                    self.logger.debug(f"Error closing stale async client: {e}")
+        return client
+    
+    async def _apost_generate(
+        self, payload: Dict[str, Any], model: str
+    ) -> Optional[Dict[str, Any]]:
+        """POST a generate payload without blocking the event loop.
+        
+        Args:
+            payload: Request payload for /api/generate
+            model: Model name, reported in the result
+            
+        Returns:
+            Dict with response, model, and processing_time, or None if failed
+        """
+        try:
+            client = await self._get_async_client()
+            start_time = time.perf_counter()
+            response = await client.post(f"{self.host}/api/generate", json=payload)
+            processing_time = time.perf_counter() - start_time
+            
+            if response.status_code == 200:
+                result = response.json()
+                generated_text = result.get('response', '')
+                self.logger.debug(f"Successfully generated response ({len(generated_text)} chars) in {processing_time:.2f}s")
+                return {
+                    'response': generated_text,
+                    'model': model,
+                    'processing_time': round(processing_time, 3),
+                    'tokens': result.get('eval_count', 0)
+                }
+            self.logger.error(f"Ollama API returned status {response.status_code}: {response.text}")
+            return None
+            
+        except httpx.TimeoutException:
+            self.logger.error(f"Request timed out after {self.timeout}s")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error in async generate request: {e}", exc_info=True)
+            return None
+    
+    async def agenerate_text(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 2000
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of generate_text.
+        
+        Uses httpx when installed; otherwise runs generate_text in the
+        event loop's default executor.
+        
+        Returns:
+            Dict with response, model, and processing_time, or None if failed
+        """
+        if not HTTPX_AVAILABLE:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, lambda: self.generate_text(
+                    model, prompt, system_prompt, temperature, max_tokens
+                )
+            )
+        
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
+        }
+        if system_prompt:
+            payload["system"] = system_prompt
+        return await self._apost_generate(payload, model)
+    
+    async def agenerate_with_image(
+        self,
+        model: str,
+        prompt: str,
+        image_path: Optional[str],
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        image_b64: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of generate_with_image.
+        
+        Uses httpx when installed; otherwise runs generate_with_image in the
+        event loop's default executor.
+        
+        Returns:
+            Dict with response, model, and processing_time, or None if failed
+        """
+        loop = asyncio.get_running_loop()
+        if not HTTPX_AVAILABLE:
+            return await loop.run_in_executor(
+                None, lambda: self.generate_with_image(
+                    model, prompt, image_path, system_prompt,
+                    temperature, max_tokens, image_b64
+                )
+            )
+        
+        if image_b64 is None:
+            try:
+                image_b64 = await loop.run_in_executor(
+                    None, self._encode_image, image_path
+                )
+            except Exception as e:
+                self.logger.error(f"Error encoding image {image_path}: {e}")
+                return None
+        
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "images": [image_b64],
+            "stream": False,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
+        }
+        if system_prompt:
+            payload["system"] = system_prompt
+        return await self._apost_generate(payload, model)
+    
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self.session.close()
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created.
+        
+        Call this before the event loop that used the client ends (e.g. at
+        the end of the coroutine passed to asyncio.run).
+        """
+        client, self._async_client = self._async_client, None
+        self._async_loop = None
+        if client is not None:
+            await client.aclose()
+    
+    async def __aenter__(self) -> 'OllamaClient':
+        """Use the client for the duration of an async block."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the async HTTP client when the block exits."""
+        await self.aclose()
+    
     def list_models(self) -> Optional[list]:
         """List available models in Ollama.
         
@@ -206,7 +451,7 @@ class OllamaClient:
             List of available models or None if failed
         """
         try:
-            response = requests.get(f"{self.host}/api/tags", timeout=10)
+            response = self.session.get(f"{self.host}/api/tags", timeout=10)
             if response.status_code == 200:
                 result = response.json()
                 models = result.get('models', [])
@@ -1,8 +1,137 @@
 """Text agent for processing and correcting OCR-extracted text using LLM."""
 
+import asyncio
+import hashlib
+import json
 import logging
+import re
+import threading
 from typing import Dict, Any, Optional, List
 from ..ollama_client import OllamaClient
+from ...performance.latency_recorder import LatencyRecorder
+
+
+# Language detection results kept per TextAgent (oldest evicted first)
+LANGUAGE_CACHE_SIZE = 2048
+
+# Delimiter the model is asked to emit between rows of a batched prompt
+ROW_DELIMITER = re.compile(r'^\s*=+\s*ROW\s+(\d+)\s*=+\s*$', re.MULTILINE)
+
+RESPONSE_FORMAT = """CORRECTED TEXT:
+[your corrected text here]
+
+CHANGES:
+[list of changes made]
+
+CONFIDENCE:
+[low/medium/high]
+
+LANGUAGE:
+{"language": "<Language Name>", "code": "<ISO 639-1 Code>", "needs_translation": "<true/false>", "text_to_translate": "<Extracted text that needs translation or empty>"}"""
+
+# Constant parts of the prompts, built once. The variable payload goes
+# after a fixed preamble so requests share a byte-identical prefix, which
+# lets Ollama reuse its prompt KV cache between requests.
+TEXT_PROMPT_PREFIX = "I have extracted text from an image using OCR. Please review and correct any errors, complete incomplete words or sentences, and improve readability while maintaining the original meaning.\n"
+
+TEXT_PROMPT_SUFFIX = """
+
+Please provide:
+1. The corrected and completed text
+2. A brief summary of changes made (if any)
+3. Confidence level in the corrections (low/medium/high)
+4. The primary language of the corrected text, noting any text in another language even if it is written in the English alphabet
+
+Format your response as:
+""" + RESPONSE_FORMAT
+
+BATCH_PROMPT_PREFIX = "I have extracted text from several images using OCR. For each row below, review and correct any errors, complete incomplete words or sentences, and improve readability while maintaining the original meaning. Treat every row independently.\n"
+
+BATCH_PROMPT_SUFFIX = """For each row k, start a block with the line "=== ROW k ===" followed by:
+""" + RESPONSE_FORMAT
+
+DETECT_PROMPT_PREFIX = """
+            Analyze the following text and identify if it has any text in different language even though the words/sentences are written in English alphabet.
+            Provide the primary language name and its ISO 639-1 code in JSON format as follows:
+            {
+                "language": "<Language Name>",
+                "code": "<ISO 639-1 Code>",
+                "needs_translation": "<true/false>",
+                "text_to_translate": "<Extracted text that needs translation or empty>"
+            }
+Text:
+"""
+
+CORRECT_PROMPT_PREFIX = "Please correct any spelling, grammar, or OCR errors in the following text. Return only the corrected text without explanations:\n\n"
+
+COMBINE_PROMPT_PREFIX = "I have two sources of text from the same image:\n\nOCR Text:\n"
+
+COMBINE_PROMPT_SUFFIX = """
+
+Please combine and reconcile these two sources to produce the most accurate and complete text. Consider that:
+- OCR might have spelling errors but captures text structure
+- Vision model might miss some text but can provide context
+- Look for complementary information
+
+Return only the final combined and corrected text."""
+
+# CORRECTED TEXT, CHANGES and CONFIDENCE sections, in order
+RESPONSE_SECTIONS = re.compile(
+    r'CORRECTED TEXT:\s*(.*?)\s*CHANGES:\s*(.*?)\s*CONFIDENCE:\s*(.*?)\s*(?:LANGUAGE:|$)',
+    re.DOTALL
+)
+
+# Fields of the language-detection JSON object
+LANGUAGE_FIELD_NAMES = ('language', 'code', 'needs_translation', 'text_to_translate')
+
+# Any of the language-detection JSON fields, quoted or bare value
+LANGUAGE_FIELD = re.compile(
+    r'"(language|code|needs_translation|text_to_translate)"\s*:\s*'
+    r'(?:"([^"]*)"|([^\s,}]*))'
+)
+
+
+def scan_language_fields(text: str) -> Dict[str, str]:
+    """Collect the language-detection JSON fields from text in one pass.
+
+    Args:
+        text: Model output containing the JSON-like language fields
+
+    Returns:
+        Dict of field name to value for the fields found (first occurrence)
+    """
+    fields = {}
+    for match in LANGUAGE_FIELD.finditer(text):
+        fields.setdefault(match.group(1), (match.group(2) or match.group(3) or '').strip())
+    return fields
+
+
+def parse_language_fields(text: str) -> Dict[str, str]:
+    """Read the language-detection fields from the JSON object in text.
+
+    The outermost {...} is parsed with json.loads; if that is not valid
+    JSON, the fields are picked out with scan_language_fields instead.
+
+    Args:
+        text: Model output containing the language JSON object
+
+    Returns:
+        Dict of field name to string value for the fields found
+    """
+    start = text.find('{')
+    end = text.rfind('}')
+    if 0 <= start < end:
+        try:
+            data = json.loads(text[start:end + 1])
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            return {
+                field: str(data[field]).lower() if isinstance(data[field], bool) else str(data[field]).strip()
+                for field in LANGUAGE_FIELD_NAMES
+                if data.get(field) is not None
+            }
+    return scan_language_fields(text)
 
 
 class TextAgent:
@@ -28,6 +157,23 @@ class TextAgent:
         self.temperature = agent_config.get('temperature', 0.3)
         self.max_tokens = agent_config.get('max_tokens', 2000)
         self.system_prompt = agent_config.get('system_prompt', '')
+        # Texts corrected per LLM request by process_texts, and the prompt
+        # size (in characters of input text) at which a batch is split
+        self.batch_size = min(max(int(agent_config.get('batch_size', 8)), 1), 32)
+        self.max_batch_chars = int(agent_config.get('max_batch_chars', 8000))
+        # Batch size currently used: halved when a batched request fails,
+        # grown back by one per successful batch (up to batch_size). Shared
+        # by the threads of a batch step, so updated under a lock
+        self._recent_batch_size = float(self.batch_size)
+        self._batch_size_lock = threading.Lock()
+        
+        # detect_language results keyed by a digest of the text, so repeated
+        # OCR output (e.g. consecutive video frames) costs one LLM call
+        self._lang_cache: Dict[bytes, Dict[str, str]] = {}
+        self._lang_cache_lock = threading.Lock()
+        # Treat pure-ASCII text as English without asking the LLM. Off by
+        # default: romanized non-English text (e.g. Hinglish) is ASCII too
+        self.fast_english_shortcut = agent_config.get('fast_english_shortcut', False)
         
         self.logger.info(f"Initialized Text Agent with model: {self.text_model}")
         
@@ -56,97 +202,27 @@ class TextAgent:
         try:
             self.logger.info("Processing text with LLM for correction and completion")
             
-            # Build context from image analysis if available
-            context = ""
-            if vl_model_data:
-                context = f"\n\nImage Context:\n"
-                if vl_model_data.get('description'):
-                    context += f"- Description: {vl_model_data['description']}\n"
-                if vl_model_data.get('scene'):
-                    context += f"- Scene: {vl_model_data['scene']}\n"
-                if vl_model_data.get('text'):
-                    context += f"- Visible text (from vision model): {vl_model_data['text']}\n"
-            
-            # Prepare prompt
-            prompt = f"""I have extracted text from an image using OCR. Please review and correct any errors, complete incomplete words or sentences, and improve readability while maintaining the original meaning.
-{context}
-OCR Extracted Text:
-{ocr_text}
-
-Please provide:
-1. The corrected and completed text
-2. A brief summary of changes made (if any)
-3. Confidence level in the corrections (low/medium/high)
-
-Format your response as:
-CORRECTED TEXT:
-[your corrected text here]
-
-CHANGES:
-[list of changes made]
-
-CONFIDENCE:
-[low/medium/high]"""
-            
             # Call Ollama for text processing
             response_data = self.ollama_client.generate_text(
                 model=self.text_model,
-                prompt=prompt,
+                prompt=self._build_prompt(ocr_text, vl_model_data),
                 system_prompt=self.system_prompt,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens
             )
+            LatencyRecorder.record_response('text_agent', response_data)
             
             if not response_data:
                 self.logger.error("Failed to get response from text model")
                 return None
             
-            # Extract response text and metadata
-            response = response_data.get('response', '')
-            model = response_data.get('model', self.text_model)
-            processing_time = response_data.get('processing_time', 0.0)
-            
-            # Parse the response
-            result = self._parse_response(response, ocr_text)
-            
-            # Add model and timing info
-            result['model'] = model
-            result['processing_time'] = processing_time
-
-            # Set primary_text for downstream use
-            primary_text = result.get('corrected_text') or ocr_text or ''
-            result['primary_text'] = primary_text
-
-            # Detect language of the primary text and mark if translation is needed
-            try:
-                lang_info = self.detect_language(primary_text)
-                self.logger.debug(f"Detected language info: {lang_info}")
-                result['language'] = lang_info.get('language', 'unknown')
-                result['language_code'] = lang_info.get('code', '')
-                # Mark needTranslation = True when detected language is not English
-                need_translation = False
-                code = (lang_info.get('code') or '').lower()
-                name = (lang_info.get('language') or '').lower()
-                if code and code != 'en' and code != 'eng':
-                    need_translation = True
-                elif name and 'english' not in name and name != 'en':
-                    need_translation = True
-
-                needs_translation_str = lang_info.get('needs_translation', 'false')
-                if isinstance(needs_translation_str, bool):
-                    need_translation = needs_translation_str
-                else:
-                    need_translation = needs_translation_str.lower() == 'true'
-                text_to_translate = lang_info.get('text_to_translate', '')
-
-                result['needTranslation'] = need_translation
-                result['textToTranslate'] = text_to_translate
-            except Exception:
-                # If detection fails, be conservative and assume no translation
-                result['language'] = 'unknown'
-                result['language_code'] = ''
-                result['needTranslation'] = False
-                result['textToTranslate'] = ''
+            # Parse the response and detect the language of the result
+            result = self._build_result(
+                response_data.get('response', ''),
+                ocr_text,
+                response_data.get('model', self.text_model),
+                response_data.get('processing_time', 0.0)
+            )
             
             self.logger.info("Successfully processed text with LLM")
             self.logger.debug(f"Text processing result: {result}")
@@ -157,6 +233,286 @@ CONFIDENCE:
             self.logger.error(f"Error processing text: {e}", exc_info=True)
             return None
     
+    async def aprocess_text(
+        self,
+        ocr_text: str,
+        vl_model_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of process_text.
+        
+        The correction request is awaited; the fallback language detection
+        request (only made if the response lacks a LANGUAGE section) runs in
+        the event loop's default executor.
+        
+        Args:
+            ocr_text: Raw OCR-extracted text
+            vl_model_data: Optional image analysis data for context
+            
+        Returns:
+            Dictionary containing corrected text and metadata or None if failed
+        """
+        try:
+            response_data = await self.ollama_client.agenerate_text(
+                model=self.text_model,
+                prompt=self._build_prompt(ocr_text, vl_model_data),
+                system_prompt=self.system_prompt,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens
+            )
+            LatencyRecorder.record_response('text_agent', response_data)
+            
+            if not response_data:
+                self.logger.error("Failed to get response from text model")
+                return None
+            
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._build_result,
+                response_data.get('response', ''),
+                ocr_text,
+                response_data.get('model', self.text_model),
+                response_data.get('processing_time', 0.0)
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error processing text: {e}", exc_info=True)
+            return None
+    
+    def process_texts(
+        self,
+        ocr_texts: List[str],
+        vl_datas: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Process and correct several OCR-extracted texts.
+        
+        Texts are sent up to batch_size at a time in a single prompt with
+        numbered rows, so a batch costs one LLM round-trip instead of one per
+        text. A batch whose request fails is split in half and retried, and
+        later batches are kept smaller until requests succeed again. Rows
+        the model's response does not cover are retried individually with
+        process_text.
+        
+        Args:
+            ocr_texts: Raw OCR-extracted texts
+            vl_datas: Optional image analysis data per text, for context
+            
+        Returns:
+            List of processing results (None for failures), in input order
+            
+        Raises:
+            ValueError: If vl_datas and ocr_texts differ in length
+        """
+        if vl_datas is None:
+            vl_datas = [None] * len(ocr_texts)
+        elif len(vl_datas) != len(ocr_texts):
+            raise ValueError(
+                f"Got {len(vl_datas)} image analyses for {len(ocr_texts)} texts"
+            )
+        items = list(zip(ocr_texts, vl_datas))
+        
+        results = []
+        start = 0
+        while start < len(items):
+            batch = self._next_batch(items, start)
+            start += len(batch)
+            results.extend(self._process_batch(batch))
+        return results
+    
+    def _next_batch(self, items: List[tuple], start: int) -> List[tuple]:
+        """Take the next batch of (text, vl_data) items, bounded in count and size."""
+        limit = max(1, int(self._recent_batch_size))
+        batch = [items[start]]
+        batch_chars = len(items[start][0] or '')
+        for item in items[start + 1:start + limit]:
+            batch_chars += len(item[0] or '')
+            if batch_chars > self.max_batch_chars:
+                break
+            batch.append(item)
+        return batch
+    
+    def _process_batch(
+        self, batch: List[tuple]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Correct a batch of texts with one LLM request.
+        
+        Args:
+            batch: List of (ocr_text, vl_model_data) tuples
+            
+        Returns:
+            List of processing results, one per batch item
+        """
+        if len(batch) == 1:
+            return [self.process_text(*batch[0])]
+        
+        self.logger.info(f"Processing {len(batch)} texts with LLM in one request")
+        
+        rows = []
+        for index, (ocr_text, vl_model_data) in enumerate(batch, 1):
+            rows.append(
+                f"--- ROW {index} ---{self._build_context(vl_model_data)}\n"
+                f"OCR Extracted Text:\n{ocr_text}\n"
+            )
+        rows_text = "\n".join(rows)
+        
+        prompt = ''.join((
+            BATCH_PROMPT_PREFIX, f"There are {len(batch)} rows.\n\n",
+            rows_text, "\n", BATCH_PROMPT_SUFFIX
+        ))
+        
+        response_data = None
+        try:
+            response_data = self.ollama_client.generate_text(
+                model=self.text_model,
+                prompt=prompt,
+                system_prompt=self.system_prompt,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens * len(batch)
+            )
+            LatencyRecorder.record_response('text_agent', response_data, items=len(batch))
+        except Exception as e:
+            self.logger.error(f"Error processing text batch: {e}", exc_info=True)
+        
+        if not response_data:
+            # Likely a timeout or an overflowing context: retry as two halves
+            # and keep following batches smaller
+            half = len(batch) // 2
+            with self._batch_size_lock:
+                self._recent_batch_size = max(1.0, min(self._recent_batch_size, half))
+            self.logger.warning(
+                f"Batched request for {len(batch)} texts failed, "
+                f"retrying as batches of {half} and {len(batch) - half}"
+            )
+            return self._process_batch(batch[:half]) + self._process_batch(batch[half:])
+        
+        with self._batch_size_lock:
+            self._recent_batch_size = min(
+                float(self.batch_size), self._recent_batch_size + 1
+            )
+        blocks = self._split_rows(response_data.get('response', ''))
+        
+        # Share the request time evenly between the rows it produced
+        processing_time = 0.0
+        if blocks:
+            processing_time = round(
+                response_data.get('processing_time', 0.0) / len(blocks), 3
+            )
+        
+        results = []
+        for index, (ocr_text, vl_model_data) in enumerate(batch, 1):
+            block = blocks.get(index)
+            if block is None:
+                self.logger.warning(
+                    f"Row {index} missing from batched response, retrying alone"
+                )
+                results.append(self.process_text(ocr_text, vl_model_data))
+                continue
+            results.append(self._build_result(
+                block, ocr_text,
+                response_data.get('model', self.text_model), processing_time
+            ))
+        return results
+    
+    @staticmethod
+    def _split_rows(response: str) -> Dict[int, str]:
+        """Split a batched response into its per-row blocks, keyed by row number."""
+        parts = ROW_DELIMITER.split(response)
+        # parts = [preamble, row_number, block, row_number, block, ...]
+        return {
+            int(parts[i]): parts[i + 1]
+            for i in range(1, len(parts) - 1, 2)
+            if 'CORRECTED TEXT:' in parts[i + 1]
+        }
+    
+    def _build_prompt(
+        self, ocr_text: str, vl_model_data: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Build the correction prompt for a single OCR text."""
+        # Build context from image analysis if available
+        context = self._build_context(vl_model_data)
+        
+        return ''.join((
+            TEXT_PROMPT_PREFIX, context, "\nOCR Extracted Text:\n", ocr_text,
+            TEXT_PROMPT_SUFFIX
+        ))
+    
+    @staticmethod
+    def _build_context(vl_model_data: Optional[Dict[str, Any]]) -> str:
+        """Build the image-analysis context section of a correction prompt."""
+        context = ""
+        if vl_model_data:
+            context = f"\n\nImage Context:\n"
+            if vl_model_data.get('description'):
+                context += f"- Description: {vl_model_data['description']}\n"
+            if vl_model_data.get('scene'):
+                context += f"- Scene: {vl_model_data['scene']}\n"
+            if vl_model_data.get('text'):
+                context += f"- Visible text (from vision model): {vl_model_data['text']}\n"
+        return context
+    
+    def _build_result(
+        self,
+        response: str,
+        ocr_text: str,
+        model: str,
+        processing_time: float
+    ) -> Dict[str, Any]:
+        """Turn a correction response into a processing result.
+        
+        Args:
+            response: Raw correction response for one text
+            ocr_text: Original OCR text
+            model: Model that produced the response
+            processing_time: LLM time attributed to this text
+            
+        Returns:
+            Processing result with language detection fields
+        """
+        # Parse the response
+        result = self._parse_response(response, ocr_text)
+        
+        # Add model and timing info
+        result['model'] = model
+        result['processing_time'] = processing_time
+
+        # Set primary_text for downstream use
+        primary_text = result.get('corrected_text') or ocr_text or ''
+        result['primary_text'] = primary_text
+
+        # Language comes from the LANGUAGE section of the same response;
+        # only ask separately if the model left it out
+        try:
+            lang_info = self._parse_language(response)
+            if lang_info is None:
+                lang_info = self.detect_language(primary_text)
+            self.logger.debug(f"Detected language info: {lang_info}")
+            result['language'] = lang_info.get('language', 'unknown')
+            result['language_code'] = lang_info.get('code', '')
+            # Mark needTranslation = True when detected language is not English
+            need_translation = False
+            code = (lang_info.get('code') or '').lower()
+            name = (lang_info.get('language') or '').lower()
+            if code and code != 'en' and code != 'eng':
+                need_translation = True
+            elif name and 'english' not in name and name != 'en':
+                need_translation = True
+
+            needs_translation_str = lang_info.get('needs_translation', 'false')
+            if isinstance(needs_translation_str, bool):
+                need_translation = needs_translation_str
+            else:
+                need_translation = needs_translation_str.lower() == 'true'
+            text_to_translate = lang_info.get('text_to_translate', '')
+
+            result['needTranslation'] = need_translation
+            result['textToTranslate'] = text_to_translate
+        except Exception:
+            # If detection fails, be conservative and assume no translation
+            result['language'] = 'unknown'
+            result['language_code'] = ''
+            result['needTranslation'] = False
+            result['textToTranslate'] = ''
+        
+        return result
+    
     def _parse_response(self, response: str, original_text: str) -> Dict[str, Any]:
         """Parse the LLM response into structured data.
         
@@ -175,29 +531,35 @@ CONFIDENCE:
         }
         
         try:
-            # Extract corrected text
-            corrected_match = response.split('CORRECTED TEXT:')
-            if len(corrected_match) > 1:
-                # Get text after "CORRECTED TEXT:" and before next section
-                corrected_section = corrected_match[1].split('CHANGES:')[0]
-                result['corrected_text'] = corrected_section.strip()
-            
-            # Extract changes
-            changes_match = response.split('CHANGES:')
-            if len(changes_match) > 1:
-                changes_section = changes_match[1].split('CONFIDENCE:')[0]
-                result['changes'] = changes_section.strip()
+            match = RESPONSE_SECTIONS.search(response)
+            if match:
+                # All three sections present: one scan picks them out
+                result['corrected_text'], result['changes'], confidence_text = (
+                    match.groups()
+                )
+            else:
+                # Sections missing or out of order; take whichever are there.
+                # partition stops at the first occurrence of each header
+                _, found, rest = response.partition('CORRECTED TEXT:')
+                if found:
+                    # Get text after "CORRECTED TEXT:" and before next section
+                    result['corrected_text'] = rest.partition('CHANGES:')[0].strip()
+                
+                _, found, rest = response.partition('CHANGES:')
+                if found:
+                    result['changes'] = rest.partition('CONFIDENCE:')[0].strip()
+                
+                _, found, rest = response.partition('CONFIDENCE:')
+                confidence_text = rest.partition('LANGUAGE:')[0] if found else ''
             
             # Extract confidence
-            confidence_match = response.split('CONFIDENCE:')
-            if len(confidence_match) > 1:
-                confidence_text = confidence_match[1].strip().lower()
-                if 'high' in confidence_text:
-                    result['confidence'] = 'high'
-                elif 'medium' in confidence_text:
-                    result['confidence'] = 'medium'
-                elif 'low' in confidence_text:
-                    result['confidence'] = 'low'
+            confidence_text = confidence_text.lower()
+            if 'high' in confidence_text:
+                result['confidence'] = 'high'
+            elif 'medium' in confidence_text:
+                result['confidence'] = 'medium'
+            elif 'low' in confidence_text:
+                result['confidence'] = 'low'
             
             # Fallback: if no structured output, use the whole response as corrected text
             if not result['corrected_text']:
@@ -215,26 +577,52 @@ CONFIDENCE:
         
         return result
 
+    @staticmethod
+    def _parse_language(response: str) -> Optional[Dict[str, str]]:
+        """Parse the LANGUAGE section of a correction response.
+        
+        Args:
+            response: Raw response from LLM
+            
+        Returns:
+            Dict in the detect_language format, or None if the response has
+            no usable LANGUAGE section
+        """
+        parts = response.split('LANGUAGE:')
+        if len(parts) < 2:
+            return None
+        section = parts[-1]
+        
+        fields = parse_language_fields(section)
+        if not fields.get('language') and not fields.get('code'):
+            return None
+        
+        return {
+            'language': fields.get('language') or 'unknown',
+            'code': fields.get('code', ''),
+            'needs_translation': fields.get('needs_translation') or 'false',
+            'text_to_translate': fields.get('text_to_translate', '')
+        }
+
     def detect_language(self, text: str) -> Dict[str, str]:
         """Detect the primary language of the given text using the LLM.
 
         Returns a dict with keys: 'language' (name) and 'code' (iso code, e.g., 'en').
+        Results are cached per text, so repeated texts cost one LLM call.
         """
         try:
             if not text or not text.strip():
                 return {'language': 'unknown', 'code': ''}
 
-            prompt = f"""
-            Analyze the following text and identify if it has any text in different language even though the words/sentences are written in English alphabet.
-            Provide the primary language name and its ISO 639-1 code in JSON format as follows:
-            {{
-                "language": "<Language Name>",
-                "code": "<ISO 639-1 Code>",
-                "needs_translation": "<true/false>",
-                "text_to_translate": "<Extracted text that needs translation or empty>"
-            }}
-Text:
-""" + text
+            if self.fast_english_shortcut and text.isascii():
+                return {'language': 'English', 'code': 'en', 'needs_translation': 'false', 'text_to_translate': ''}
+
+            key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+            cached = self._lang_cache.get(key)
+            if cached is not None:
+                return dict(cached)
+
+            prompt = DETECT_PROMPT_PREFIX + text
 
             response_data = self.ollama_client.generate_text(
                 model=self.text_model,
@@ -243,6 +631,7 @@ Text:
                 temperature=0.0,
                 max_tokens=50
             )
+            LatencyRecorder.record_response('language_detection', response_data)
 
             if not response_data:
                 return {'language': 'unknown', 'code': ''}
@@ -251,39 +640,28 @@ Text:
 
             # Try to parse JSON-like output
             resp = response.strip()
-            # crude parse: look for code and language
-            lang = ''
-            code = ''
-            needs_translation = ''
-            text_to_translate = ''
-            # attempt to find iso code in response
-            low = resp.lower()
-            # common tokens
-            if 'english' in low or 'en' in low.split():
-                lang = 'English'
-                code = 'en'
-            else:
-                # try to extract JSON-like fields
-                try:
-                    import re
-
-                    needs_translation = re.search(r'"needs_translation"\s*:\s*"([^"]+)"', resp)
-                    text_to_translate = re.search(r'"text_to_translate"\s*:\s*"([^"]+)"', resp)
-                    m_lang = re.search(r'"language"\s*:\s*"([^"]+)"', resp)
-                    m_code = re.search(r'"code"\s*:\s*"([^"]+)"', resp)
-                    if m_lang:
-                        lang = m_lang.group(1)
-                    if m_code:
-                        code = m_code.group(1)
-                except Exception:
-                    pass
+            fields = parse_language_fields(resp)
+            if not fields.get('language') and not fields.get('code') and 'english' in resp.lower():
+                # no JSON at all, but the model named the language
+                fields = {'language': 'English', 'code': 'en'}
 
+            lang = fields.get('language', '')
             # fallback: if nothing parsed, return full response as language field
             if not lang and resp:
                 # take first token
                 lang = resp.split('\n')[0].strip()
 
-            return {'language': lang or 'unknown', 'code': code or '', 'needs_translation': needs_translation.group(1) if needs_translation else 'false', 'text_to_translate': text_to_translate.group(1) if text_to_translate else ''}
+            lang_info = {
+                'language': lang or 'unknown',
+                'code': fields.get('code', ''),
+                'needs_translation': fields.get('needs_translation') or 'false',
+                'text_to_translate': fields.get('text_to_translate', '')
+            }
+            with self._lang_cache_lock:
+                if len(self._lang_cache) >= LANGUAGE_CACHE_SIZE:
+                    del self._lang_cache[next(iter(self._lang_cache))]
+                self._lang_cache[key] = lang_info
+            return dict(lang_info)
         except Exception:
             return {'language': 'unknown', 'code': ''}
 
@@ -298,9 +676,7 @@ Text:
             Corrected text or None if failed
         """
         try:
-            prompt = f"""Please correct any spelling, grammar, or OCR errors in the following text. Return only the corrected text without explanations:
-
-{text}"""
+            prompt = CORRECT_PROMPT_PREFIX + text
             
             response_data = self.ollama_client.generate_text(
                 model=self.text_model,
@@ -369,20 +745,11 @@ Please {task} for the above text. Return only the enhanced text."""
             Combined and corrected text or None if failed
         """
         try:
-            prompt = f"""I have two sources of text from the same image:
-
-OCR Text:
-{ocr_text}
-
-Vision Model Text:
-{vision_text}
-
-Please combine and reconcile these two sources to produce the most accurate and complete text. Consider that:
-- OCR might have spelling errors but captures text structure
-- Vision model might miss some text but can provide context
-- Look for complementary information
-
-Return only the final combined and corrected text."""
+            prompt = ''.join((
+                COMBINE_PROMPT_PREFIX, ocr_text,
+                "\n\nVision Model Text:\n", vision_text,
+                COMBINE_PROMPT_SUFFIX
+            ))
             
             response_data = self.ollama_client.generate_text(
                 model=self.text_model,
@@ -1,8 +1,13 @@
 """Translator agent to translate text to English using an LLM (Ollama)."""
 
 import logging
-from typing import Dict, Any, Optional
-from ..ollama_client import OllamaClient
+from typing import Dict, Any, List, Optional
+from ..ollama_client import OllamaClient, gather_bounded
+from ...performance.latency_recorder import LatencyRecorder
+
+
+# Language codes for which no translation request is made
+ENGLISH_CODES = frozenset({'en', 'eng'})
 
 
 class TranslatorAgent:
@@ -26,43 +31,103 @@ class TranslatorAgent:
         if not self.ollama_client.check_model_available(self.model):
             self.logger.warning(f"Translator model '{self.model}' not available")
 
-    def translate_to_english(self, text: str) -> Optional[Dict[str, Any]]:
+    def translate_to_english(self, text: str, source_lang_code: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Translate given text to English. Returns a dict with translated_text, model, processing_time and optional metadata.
 
         If the text appears already English, the translator may return the original text.
+        When source_lang_code (e.g. TextAgent's language_code) says the text
+        is English, it is returned as is without calling the LLM.
         """
         try:
-            if not text:
-                return {'translated_text': '', 'note': 'empty input', 'model': self.model, 'processing_time': 0.0}
+            skipped = self._skip_result(text, source_lang_code)
+            if skipped:
+                return skipped
 
-            prompt = (
-                "Translate the following text to fluent, natural English. "
-                "If the text is already English, return it unchanged. Return ONLY the translation.\n\n"
-                f"Text:\n{text}"
+            response_data = self.ollama_client.generate_text(
+                model=self.model,
+                prompt=self._build_prompt(text),
+                system_prompt=self.system_prompt,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens
             )
+            LatencyRecorder.record_response('translator_agent', response_data)
 
-            response_data = self.ollama_client.generate_text(
+            if response_data is None:
+                self.logger.error("Translator agent failed to get a response")
+                return None
+
+            return self._build_result(response_data)
+
+        except Exception as e:
+            self.logger.error(f"Error translating text: {e}", exc_info=True)
+            return None
+
+    async def atranslate_to_english(self, text: str, source_lang_code: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Async variant of translate_to_english."""
+        try:
+            skipped = self._skip_result(text, source_lang_code)
+            if skipped:
+                return skipped
+
+            response_data = await self.ollama_client.agenerate_text(
                 model=self.model,
-                prompt=prompt,
+                prompt=self._build_prompt(text),
                 system_prompt=self.system_prompt,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens
             )
+            LatencyRecorder.record_response('translator_agent', response_data)
 
             if response_data is None:
                 self.logger.error("Translator agent failed to get a response")
                 return None
 
-            translated = response_data.get('response', '').strip()
-            model = response_data.get('model', self.model)
-            processing_time = response_data.get('processing_time', 0.0)
-            
-            return {
-                'translated_text': translated,
-                'model': model,
-                'processing_time': processing_time
-            }
+            return self._build_result(response_data)
 
         except Exception as e:
             self.logger.error(f"Error translating text: {e}", exc_info=True)
             return None
+
+    async def translate_many(
+        self,
+        texts: List[str],
+        source_lang_codes: Optional[List[Optional[str]]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Translate several texts concurrently, at most ollama_client.num_parallel at a time.
+
+        Returns results (None for failures) in input order. Run it inside
+        ``async with ollama_client:`` so the HTTP connections are closed
+        before the event loop ends.
+        """
+        if source_lang_codes is None:
+            source_lang_codes = [None] * len(texts)
+        return await gather_bounded(
+            [self.atranslate_to_english(text, code)
+             for text, code in zip(texts, source_lang_codes)],
+            self.ollama_client.num_parallel
+        )
+
+    def _skip_result(self, text: str, source_lang_code: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Result for text that needs no LLM call (empty or already English), else None."""
+        if not text:
+            return {'translated_text': '', 'note': 'empty input', 'model': self.model, 'processing_time': 0.0}
+        if source_lang_code and source_lang_code.lower() in ENGLISH_CODES:
+            return {'translated_text': text, 'note': 'already english', 'model': self.model, 'processing_time': 0.0}
+        return None
+
+    @staticmethod
+    def _build_prompt(text: str) -> str:
+        """Build the translation prompt for the given text."""
+        return (
+            "Translate the following text to fluent, natural English. "
+            "If the text is already English, return it unchanged. Return ONLY the translation.\n\n"
+            f"Text:\n{text}"
+        )
+
+    def _build_result(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the translation result from a model response."""
+        return {
+            'translated_text': response_data.get('response', '').strip(),
+            'model': response_data.get('model', self.model),
+            'processing_time': response_data.get('processing_time', 0.0)
+        }
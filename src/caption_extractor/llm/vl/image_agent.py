@@ -1,9 +1,63 @@
 """Image agent for analyzing images using visual LLM models."""
 
+import asyncio
 import logging
+import os
 import re
-from typing import Dict, Any, Optional
-from ..ollama_client import OllamaClient
+import threading
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from ..ollama_client import OllamaClient, b64encode_image, gather_bounded
+from ...performance.latency_recorder import LatencyRecorder
+
+
+# Analyses kept per ImageAgent for reuse by get_quick_description
+ANALYSIS_CACHE_SIZE = 64
+
+
+# Encodings can be tens of MB each; keep only the last couple, enough for
+# repeat calls on the image being worked on
+@lru_cache(maxsize=2)
+def _encode_image_file(image_path: str, mtime_ns: int) -> str:
+    """Base64-encode an image file; cached per (path, mtime)."""
+    with open(image_path, 'rb') as image_file:
+        return b64encode_image(image_file.read())
+
+
+# Section patterns for _parse_response, compiled once
+SECTION_PATTERNS = {
+    key: re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for key, pattern in {
+        'description': r'(?:\*\*)?Description(?:\*\*)?:?\s*(.*?)(?=(?:\*\*)?(?:Scene|Text|Story)(?:\*\*)?:|$)',
+        'scene': r'(?:\*\*)?Scene(?:\*\*)?:?\s*(.*?)(?=(?:\*\*)?(?:Description|Text|Story)(?:\*\*)?:|$)',
+        'text': r'(?:\*\*)?Text(?:\*\*)?:?\s*(.*?)(?=(?:\*\*)?(?:Description|Scene|Story)(?:\*\*)?:|$)',
+        'story': r'(?:\*\*)?Story(?:\*\*)?:?\s*(.*?)(?=(?:\*\*)?(?:Description|Scene|Text)(?:\*\*)?:|$)'
+    }.items()
+}
+BLANK_LINES = re.compile(r'\n\s*\n')
+# Section header at the start of a line, e.g. "**Scene**:" or "2. Text:"
+SECTION_HEADER_LINE = re.compile(
+    r'^[ \t]*(?:#+[ \t]*|\d+\.[ \t]*)?\*{0,2}[ \t]*(description|scene|text|story)\b'
+    r'[ \t]*\*{0,2}[ \t]*:?[ \t]*',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+# Image analysis prompt, split around the optional OCR section so requests
+# share a byte-identical prefix (lets Ollama reuse its prompt KV cache)
+ANALYZE_PROMPT_PREFIX = """Analyze this image and provide a detailed analysis with the following sections:
+1. **Description**: Provide a comprehensive description of what you see in the image (objects, people, colors, composition, etc.)
+2. **Scene**: Identify the type of scene or setting (e.g., indoor/outdoor, document, nature/urban, etc.)
+3. **Text**: List any visible text in the image, make sure you do not translate or change or provide any other commentary. Only provide text word 2 word exact as extracted. If there's no text, state "No visible text"
+4. **Story**: Create a brief narrative or context about what might be happening in the image or its purpose
+
+"""
+ANALYZE_PROMPT_SUFFIX = """
+
+Please structure your response with clear section headers."""
+ANALYZE_PROMPT = ANALYZE_PROMPT_PREFIX + ANALYZE_PROMPT_SUFFIX
+
+QUICK_DESCRIPTION_PROMPT = "Provide a brief, one-paragraph description of this image."
 
 
 class ImageAgent:
@@ -30,6 +84,11 @@ class ImageAgent:
         self.max_tokens = agent_config.get('max_tokens', 1000)
         self.system_prompt = agent_config.get('system_prompt', '')
         
+        # Recent analyses keyed by source file path and mtime (oldest
+        # evicted first), so a quick description needs no second request
+        self._analysis_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._analysis_cache_lock = threading.Lock()
+        
         self.logger.info(f"Initialized Image Agent with model: {self.vision_model}")
         
         # Verify model availability
@@ -40,6 +99,21 @@ class ImageAgent:
                 f"Pull the model using: ollama pull {self.vision_model}"
             )
     
+    def encode_image(self, image_path: str) -> str:
+        """Base64-encode an image file for the vision model.
+        
+        Encodings of recently used files are cached, so analyzing the same
+        image more than once (e.g. full analysis and quick description)
+        reads and encodes it once.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            Base64 encoded image string
+        """
+        return _encode_image_file(image_path, os.stat(image_path).st_mtime_ns)
+    
     def analyze_image(self, image_path: str, ocr_text: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Analyze image to extract description, scene, text, and story.
         
@@ -52,62 +126,189 @@ class ImageAgent:
         """
         try:
             self.logger.info(f"Analyzing image with vision model: {image_path}")
+            return self._analyze_b64(
+                self.encode_image(image_path), ocr_text, self._image_key(image_path)
+            )
+        except Exception as e:
+            self.logger.error(f"Error analyzing image: {e}", exc_info=True)
+            return None
+    
+    def analyze_image_bytes(
+        self,
+        image_bytes: bytes,
+        ocr_text: Optional[str] = None,
+        image_path: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Analyze an encoded image (e.g. JPEG/PNG bytes) held in memory.
+        
+        Args:
+            image_bytes: Encoded image file content
+            ocr_text: Optional text extracted from the image via OCR
+            image_path: File the bytes were produced from (e.g. a resized
+                copy); when given, the analysis is cached for that file
             
-            # Prepare prompt
-            ocr_section = ""
-            if ocr_text:
-                ocr_section = f"""
-Here is the OCR text extracted:  
-<ocr>
-  {ocr_text}
-</ocr>
-"""
-
-            prompt = f"""Analyze this image and provide a detailed analysis with the following sections:
-1. **Description**: Provide a comprehensive description of what you see in the image (objects, people, colors, composition, etc.)
-2. **Scene**: Identify the type of scene or setting (e.g., indoor/outdoor, document, nature/urban, etc.)
-3. **Text**: List any visible text in the image, make sure you do not translate or change or provide any other commentary. Only provide text word 2 word exact as extracted. If there's no text, state "No visible text"
-4. **Story**: Create a brief narrative or context about what might be happening in the image or its purpose
-
-{ocr_section}
-
-Please structure your response with clear section headers."""
+        Returns:
+            Dictionary containing analysis results with model and timing info, or None if failed
+        """
+        try:
+            self.logger.info(f"Analyzing in-memory image ({len(image_bytes)} bytes) with vision model")
+            image_b64 = b64encode_image(image_bytes)
+            cache_key = self._image_key(image_path) if image_path else None
+            return self._analyze_b64(image_b64, ocr_text, cache_key)
+        except Exception as e:
+            self.logger.error(f"Error analyzing image: {e}", exc_info=True)
+            return None
+    
+    def _analyze_b64(
+        self,
+        image_b64: str,
+        ocr_text: Optional[str] = None,
+        cache_key: Optional[Tuple[str, int]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Run the image analysis request for a base64-encoded image."""
+        # Call Ollama with image
+        response_data = self.ollama_client.generate_with_image(
+            model=self.vision_model,
+            prompt=self._build_prompt(ocr_text),
+            image_path=None,
+            system_prompt=self.system_prompt,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            image_b64=image_b64
+        )
+        LatencyRecorder.record_response('image_agent', response_data)
+        
+        if not response_data:
+            self.logger.error("Failed to get response from vision model")
+            return None
+        
+        analysis = self._build_analysis(response_data)
+        if cache_key is not None:
+            self._remember_analysis(cache_key, analysis)
+        
+        self.logger.info(f"Successfully analyzed image with vision model in {analysis['processing_time']}s")
+        self.logger.debug(f"Analysis result: {analysis}")
+        
+        return analysis
+    
+    async def aanalyze_image(
+        self, image_path: str, ocr_text: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of analyze_image.
+        
+        Args:
+            image_path: Path to the image file
+            ocr_text: Optional text extracted from the image via OCR
             
-            # Call Ollama with image
-            response_data = self.ollama_client.generate_with_image(
+        Returns:
+            Dictionary containing analysis results with model and timing info, or None if failed
+        """
+        try:
+            self.logger.info(f"Analyzing image with vision model: {image_path}")
+            image_b64 = await asyncio.get_running_loop().run_in_executor(
+                None, self.encode_image, image_path
+            )
+            response_data = await self.ollama_client.agenerate_with_image(
                 model=self.vision_model,
-                prompt=prompt,
-                image_path=image_path,
+                prompt=self._build_prompt(ocr_text),
+                image_path=None,
                 system_prompt=self.system_prompt,
                 temperature=self.temperature,
-                max_tokens=self.max_tokens
+                max_tokens=self.max_tokens,
+                image_b64=image_b64
             )
+            LatencyRecorder.record_response('image_agent', response_data)
             
             if not response_data:
                 self.logger.error("Failed to get response from vision model")
                 return None
             
-            # Extract response text and metadata
-            response = response_data.get('response', '')
-            model = response_data.get('model', self.vision_model)
-            processing_time = response_data.get('processing_time', 0.0)
-            
-            # Parse the response
-            analysis = self._parse_response(response)
-            
-            # Add model and timing info
-            analysis['model'] = model
-            analysis['processing_time'] = processing_time
-            
-            self.logger.info(f"Successfully analyzed image with vision model in {processing_time}s")
-            self.logger.debug(f"Analysis result: {analysis}")
-            
+            analysis = self._build_analysis(response_data)
+            self._remember_analysis(self._image_key(image_path), analysis)
             return analysis
             
         except Exception as e:
             self.logger.error(f"Error analyzing image: {e}", exc_info=True)
             return None
     
+    async def analyze_images(
+        self,
+        image_paths: List[str],
+        ocr_texts: Optional[List[Optional[str]]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several images concurrently.
+        
+        At most ollama_client.num_parallel requests are in flight at once,
+        which should match the server's OLLAMA_NUM_PARALLEL. Run it inside
+        ``async with ollama_client:`` so the HTTP connections are closed
+        before the event loop ends.
+        
+        Args:
+            image_paths: Paths to the image files
+            ocr_texts: Optional OCR text per image
+            
+        Returns:
+            List of analysis results (None for failures), in input order
+        """
+        if ocr_texts is None:
+            ocr_texts = [None] * len(image_paths)
+        return await gather_bounded(
+            [self.aanalyze_image(path, text)
+             for path, text in zip(image_paths, ocr_texts)],
+            self.ollama_client.num_parallel
+        )
+    
+    @staticmethod
+    def _image_key(image_path: str) -> Tuple[str, int]:
+        """Key identifying a source image file in the analysis cache."""
+        return os.path.abspath(image_path), os.stat(image_path).st_mtime_ns
+    
+    def _remember_analysis(self, key: Tuple[str, int], analysis: Dict[str, Any]) -> None:
+        """Keep a copy of a successful analysis for later quick descriptions."""
+        with self._analysis_cache_lock:
+            if len(self._analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                del self._analysis_cache[next(iter(self._analysis_cache))]
+            self._analysis_cache[key] = dict(analysis)
+    
+    def get_cached_analysis(self, image_path: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached analysis of an image file, if any.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            Analysis dictionary, or None if the file was not recently analyzed
+        """
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(self._image_key(image_path))
+        return dict(cached) if cached is not None else None
+    
+    @staticmethod
+    def _build_prompt(ocr_text: Optional[str] = None) -> str:
+        """Build the image analysis prompt, optionally including OCR text."""
+        if not ocr_text:
+            return ANALYZE_PROMPT
+        return ''.join((
+            ANALYZE_PROMPT_PREFIX,
+            "\nHere is the OCR text extracted:  \n<ocr>\n  ", ocr_text, "\n</ocr>\n",
+            ANALYZE_PROMPT_SUFFIX
+        ))
+    
+    def _build_analysis(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a vision model response and attach model and timing info."""
+        # Extract response text and metadata
+        response = response_data.get('response', '')
+        model = response_data.get('model', self.vision_model)
+        processing_time = response_data.get('processing_time', 0.0)
+        
+        # Parse the response
+        analysis = self._parse_response(response)
+        
+        # Add model and timing info
+        analysis['model'] = model
+        analysis['processing_time'] = processing_time
+        return analysis
+    
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """Parse the LLM response into structured data.
         
@@ -126,63 +327,40 @@ Please structure your response with clear section headers."""
         }
         
         try:
-            # Try to extract sections using common patterns
-            sections = {
-                'description': r'(?:\*\*)?Description(?:\*\*)?:?\s*(.*?)(?=(?:\*\*)?(?:Scene|Text|Story)(?:\*\*)?:|$)',
-                'scene': r'(?:\*\*)?Scene(?:\*\*)?:?\s*(.*?)(?=(?:\*\*)?(?:Description|Text|Story)(?:\*\*)?:|$)',
-                'text': r'(?:\*\*)?Text(?:\*\*)?:?\s*(.*?)(?=(?:\*\*)?(?:Description|Scene|Story)(?:\*\*)?:|$)',
-                'story': r'(?:\*\*)?Story(?:\*\*)?:?\s*(.*?)(?=(?:\*\*)?(?:Description|Scene|Text)(?:\*\*)?:|$)'
-            }
-            
-            for key, pattern in sections.items():
-                match = re.search(pattern, response, re.IGNORECASE | re.DOTALL)
+            # Try to extract sections using common patterns, skipping the
+            # regex search for sections whose name never appears
+            lowered = response.lower()
+            for key, pattern in SECTION_PATTERNS.items():
+                if lowered.find(key) < 0:
+                    continue
+                match = pattern.search(response)
                 if match:
                     content = match.group(1).strip()
                     # Clean up the content
-                    content = re.sub(r'\n\s*\n', '\n', content)  # Remove extra newlines
+                    content = BLANK_LINES.sub('\n', content)  # Remove extra newlines
                     content = content.strip()
                     analysis[key] = content
             
             # If parsing fails, try simpler approach
             if not any([analysis['description'], analysis['scene'], analysis['text'], analysis['story']]):
-                # Split by double newlines and try to find sections
-                lines = response.split('\n')
-                current_section = None
-                content_buffer = []
-                
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    # Check if this is a section header
-                    lower_line = line.lower()
-                    if any(keyword in lower_line for keyword in ['description', 'scene', 'text', 'story']):
-                        # Save previous section
-                        if current_section and content_buffer:
-                            analysis[current_section] = '\n'.join(content_buffer).strip()
-                            content_buffer = []
-                        
-                        # Determine new section
-                        if 'description' in lower_line:
-                            current_section = 'description'
-                        elif 'scene' in lower_line:
-                            current_section = 'scene'
-                        elif 'text' in lower_line:
-                            current_section = 'text'
-                        elif 'story' in lower_line:
-                            current_section = 'story'
-                        
-                        # Remove section header from line and add remaining content
-                        content = re.sub(r'(?:\*\*)?(?:description|scene|text|story)(?:\*\*)?:?\s*', '', line, flags=re.IGNORECASE)
-                        if content:
-                            content_buffer.append(content)
-                    elif current_section:
-                        content_buffer.append(line)
-                
-                # Save last section
-                if current_section and content_buffer:
-                    analysis[current_section] = '\n'.join(content_buffer).strip()
+                # Find section headers at line starts in one scan and take
+                # the content between consecutive headers
+                headers = [
+                    (match.group(1).lower(), match.start(), match.end())
+                    for match in SECTION_HEADER_LINE.finditer(response)
+                ]
+                for index, (key, _, content_start) in enumerate(headers):
+                    content_end = (
+                        headers[index + 1][1] if index + 1 < len(headers)
+                        else len(response)
+                    )
+                    content = '\n'.join(
+                        line.strip()
+                        for line in response[content_start:content_end].splitlines()
+                        if line.strip()
+                    )
+                    if content:
+                        analysis[key] = content
             
             # If still no content, use the whole response as description
             if not any([analysis['description'], analysis['scene'], analysis['text'], analysis['story']]):
@@ -199,6 +377,9 @@ Please structure your response with clear section headers."""
     def get_quick_description(self, image_path: str) -> Optional[str]:
         """Get a quick description of the image.
         
+        If the image was recently analyzed, the first paragraph of that
+        analysis' description is returned without another model request.
+        
         Args:
             image_path: Path to the image file
             
@@ -206,15 +387,22 @@ Please structure your response with clear section headers."""
             Description string or None if failed
         """
         try:
-            prompt = "Provide a brief, one-paragraph description of this image."
+            analysis = self.get_cached_analysis(image_path)
+            if analysis and analysis.get('description'):
+                # Blank lines are collapsed when parsing, so each line of
+                # the description is a paragraph
+                return analysis['description'].strip().split('\n', 1)[0]
             
+            image_b64 = self.encode_image(image_path)
             response_data = self.ollama_client.generate_with_image(
                 model=self.vision_model,
-                prompt=prompt,
-                image_path=image_path,
+                prompt=QUICK_DESCRIPTION_PROMPT,
+                image_path=None,
                 temperature=self.temperature,
-                max_tokens=200
+                max_tokens=200,
+                image_b64=image_b64
             )
+            LatencyRecorder.record_response('image_agent', response_data)
             
             if response_data:
                 return response_data.get('response', '').strip()
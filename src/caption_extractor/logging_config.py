@@ -6,12 +6,182 @@ ensure consistent logging behavior.
 """
 
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 
+logger = logging.getLogger(__name__)
+
+
+class BufferedFileHandler(logging.Handler):
+    """Append formatted records to a file through a 64 KB binary buffer.
+
+    Unlike FileHandler, records are not flushed one by one; data reaches the
+    file when the buffer fills or flush() is called (TimedMemoryHandler does
+    so after each batch it hands over).
+    """
+
+    terminator = '\n'
+
+    def __init__(self, filename: str, buffer_size: int = 65536):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        fd = os.open(
+            self.baseFilename,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_CLOEXEC', 0),
+            0o644
+        )
+        self.stream = os.fdopen(fd, 'wb', buffering=buffer_size)
+
+    def emit(self, record):
+        try:
+            self.stream.write((self.format(record) + self.terminator).encode('utf-8'))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if self.stream is not None and not self.stream.closed:
+                self.stream.flush()
+
+    def close(self):
+        with self.lock:
+            try:
+                if self.stream is not None:
+                    self.stream.close()
+                    self.stream = None
+            finally:
+                super().close()
+
+
+class TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes once buffered records get old.
+
+    Records are written when the buffer is full, when one at flushLevel or
+    above arrives, or when the oldest buffered record is flush_interval
+    seconds old, so a quiet run still reaches the log file promptly. The
+    age limit is enforced by a daemon thread, so it holds even when no
+    further records arrive.
+    """
+
+    def __init__(self, capacity, flushLevel=logging.ERROR, target=None,
+                 flush_interval: float = 5.0):
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self.flush_interval = flush_interval
+        self._first_buffered = None
+        self._stop_flushing = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(
+                target=self._flush_when_due, name='log-flush', daemon=True
+            ).start()
+
+    def shouldFlush(self, record):
+        if self._first_buffered is None:
+            self._first_buffered = record.created
+        return (
+            super().shouldFlush(record)
+            or record.created - self._first_buffered >= self.flush_interval
+        )
+
+    def flush(self):
+        with self.lock:
+            super().flush()
+            self._first_buffered = None
+            if self.target is not None:
+                self.target.flush()
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+    def _seconds_until_due(self) -> float:
+        """Time until the oldest buffered record reaches flush_interval."""
+        first = self._first_buffered
+        if first is None:
+            return self.flush_interval
+        return max(0.0, first + self.flush_interval - time.time())
+
+    def _flush_when_due(self) -> None:
+        """Flush records that reached flush_interval while logging is idle."""
+        while not self._stop_flushing.wait(self._seconds_until_due()):
+            with self.lock:
+                first = self._first_buffered
+                if first is not None and time.time() - first >= self.flush_interval:
+                    self.flush()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that builds the asctime seconds part once per second.
+
+    Output matches logging.Formatter; strftime only runs when a record falls
+    in a different second than the previous one.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._cached_second
+        if cached_second != second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_second = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+# Listener writing records queued by the root logger's QueueHandler
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _close_handler(handler: logging.Handler) -> None:
+    """Close a handler, flushing and closing a MemoryHandler's target too."""
+    target = getattr(handler, 'target', None)
+    handler.close()
+    if target is not None:
+        target.close()
+
+
+def _stop_queue_listener() -> None:
+    """Stop the background log writer and attach its handlers to the root logger.
+
+    Records logged after this point (e.g. by other atexit hooks) are then
+    written directly instead of being left in the queue.
+    """
+    global _queue_listener
+    listener = _queue_listener
+    if listener is None:
+        return
+    _queue_listener = None
+    listener.stop()
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
+
+
+atexit.register(_stop_queue_listener)
+
+
+def _output_handlers() -> list:
+    """Handlers that write log records, whether attached to root or the listener."""
+    handlers = list(logging.getLogger().handlers)
+    if _queue_listener is not None:
+        handlers.extend(_queue_listener.handlers)
+    return handlers
+
+
 def setup_logging(config: Optional[Dict[str, Any]] = None) -> None:
     """Setup logging configuration for the application.
     
@@ -25,50 +195,99 @@ def setup_logging(config: Optional[Dict[str, Any]] = None) -> None:
                     'logging': {
                         'level': 'INFO',  # DEBUG, INFO, WARNING, ERROR, CRITICAL
                         'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                        'file': 'logs/caption_extractor.log'
+                        'file': 'logs/caption_extractor.log',
+                        'buffer_records': 1024,  # 0 writes every record immediately
+                        'flush_interval': 5,  # Max seconds a record stays buffered
+                        'background': True,  # Write records from a listener thread
+                        'console_level': 'auto'  # WARNING+ only when stdout is not a TTY
                     }
                 }
                 If None, uses default settings.
     """
+    global _queue_listener
+    
     # Extract logging configuration
     log_config = config.get('logging', {}) if config else {}
     log_level = log_config.get('level', 'INFO').upper()
     log_format = log_config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     log_file = log_config.get('file', 'logs/caption_extractor.log')
+    buffer_records = int(log_config.get('buffer_records', 1024))
+    flush_interval = float(log_config.get('flush_interval', 5))
+    background = log_config.get('background', True)
+    console_level = str(log_config.get('console_level', 'auto')).upper()
     
     # Convert log level string to logging constant
     numeric_level = getattr(logging, log_level, logging.INFO)
     
     # Create logs directory if it doesn't exist
     log_dir = os.path.dirname(log_file)
-    if log_dir:
+    if log_dir and not os.path.isdir(log_dir):
         os.makedirs(log_dir, exist_ok=True)
     
-    # Remove any existing handlers to avoid duplicates
+    # Remove any existing handlers to avoid duplicates; stopping the
+    # listener first writes out records queued by a previous call
     root_logger = logging.getLogger()
+    previous_listener = _queue_listener
+    _stop_queue_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            # Flush records buffered by a previous setup_logging call
+            _close_handler(handler)
+    if previous_listener is not None:
+        for handler in previous_listener.handlers:
+            _close_handler(handler)
     
     # Create formatters
-    formatter = logging.Formatter(log_format)
+    formatter = CachedTimeFormatter(log_format)
     
-    # Create file handler
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # Create file handler; when records are batched, write them through a
+    # buffer instead of flushing each one
+    if buffer_records > 0:
+        file_handler = BufferedFileHandler(log_file)
+    else:
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
     
-    # Create console handler
+    # Create console handler; in non-interactive runs the log file already
+    # has every record, so by default the console only gets warnings
+    if console_level == 'AUTO':
+        console_floor = logging.NOTSET if sys.stdout.isatty() else logging.WARNING
+    else:
+        console_floor = getattr(logging, console_level, logging.NOTSET)
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(numeric_level)
+    console_handler.level_floor = console_floor
+    console_handler.setLevel(max(numeric_level, console_floor))
     console_handler.setFormatter(formatter)
     
+    if buffer_records > 0:
+        # Write the log file in batches; ERROR and above flush immediately
+        file_output = TimedMemoryHandler(
+            capacity=buffer_records,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flush_interval=flush_interval
+        )
+    else:
+        file_output = file_handler
+    
     # Configure root logger
     root_logger.setLevel(numeric_level)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    if background:
+        # Logging threads only enqueue records; formatting and I/O happen
+        # on the listener's thread
+        log_queue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_output, console_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    else:
+        root_logger.addHandler(file_output)
+        root_logger.addHandler(console_handler)
     
     # Log the initialization
-    logger = logging.getLogger(__name__)
     logger.info(f"Logging initialized - Level: {log_level}, File: {log_file}")
 
 
@@ -91,6 +310,7 @@ def reconfigure_logging(level: Optional[str] = None) -> None:
     """Reconfigure logging level at runtime.
     
     This allows changing the logging level without restarting the application.
+    Requesting the level that is already active does nothing.
     
     Args:
         level: New logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -98,9 +318,13 @@ def reconfigure_logging(level: Optional[str] = None) -> None:
     if level:
         numeric_level = getattr(logging, level.upper(), logging.INFO)
         root_logger = logging.getLogger()
+        if root_logger.level == numeric_level:
+            return
         root_logger.setLevel(numeric_level)
-        for handler in root_logger.handlers:
-            handler.setLevel(numeric_level)
+        for handler in _output_handlers():
+            handler.setLevel(max(numeric_level, getattr(handler, 'level_floor', logging.NOTSET)))
+            target = getattr(handler, 'target', None)
+            if target is not None:
+                target.setLevel(numeric_level)
         
-        logger = logging.getLogger(__name__)
         logger.info(f"Logging level changed to: {level.upper()}")
@@ -3,21 +3,30 @@
 import sys
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from .config_manager import ConfigManager
-from .ocr.ocr_processor import OCRProcessor
-from .pipeline.image_processor import ImageProcessor
-from .llm.ollama_client import OllamaClient
-from .llm.vl.image_agent import ImageAgent
-from .llm.text.text_agent import TextAgent
-from .llm.translation.translator_agent import TranslatorAgent
-from .pipeline.batch_processor.batch_processor_by_steps import BatchProcessorBySteps
+from .pipeline.image_files import scan_image_files
 
+# OCR, the agents and the batch processors are imported where they are
+# used, so `--help`/`--version` and disabled stages do not load PaddleOCR,
+# OpenCV or the HTTP clients
 
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_RULE = "=" * 60
+
+
+@lru_cache(maxsize=1)
 def setup_argument_parser() -> argparse.ArgumentParser:
     """Setup command line argument parser.
     
+    The parser is built once and reused by later calls (parse_args does not
+    modify it).
+    
     Returns:
         Configured argument parser
     """
@@ -71,6 +80,17 @@ def setup_argument_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _log_errors(errors) -> None:
+    """Log the per-image errors of a batch report as a single record."""
+    logger.error(
+        "Errors occurred during processing:\n%s",
+        "\n".join(
+            f"  - {Path(error['image']).name}: {error['error']}"
+            for error in errors
+        )
+    )
+
+
 def main() -> int:
     """Main function to run the caption extractor.
     
@@ -85,25 +105,34 @@ def main() -> int:
         # Load configuration (this will setup logging via ConfigManager)
         config_manager = ConfigManager(args.config)
         
-        # Get logger after config is loaded
-        logger = logging.getLogger(__name__)
-        
         # Setup logging level if verbose
         if args.verbose:
             from .logging_config import reconfigure_logging
             reconfigure_logging('DEBUG')
         
         logger.info("Starting Caption Extractor")
-        logger.info(f"Configuration loaded from: {args.config}")
+        logger.info("Configuration loaded from: %s", args.config)
         
         # Override config with command line arguments
         if args.input_folder:
             config_manager.config['data']['input_folder'] = args.input_folder
-            logger.info(f"Input folder overridden to: {args.input_folder}")
+            logger.info("Input folder overridden to: %s", args.input_folder)
         
         if args.threads:
             config_manager.config['processing']['num_threads'] = args.threads
-            logger.info(f"Number of threads overridden to: {args.threads}")
+            logger.info("Number of threads overridden to: %s", args.threads)
+        
+        # Scan the input folder on a background thread while the OCR model
+        # and the agents are initialized
+        input_folder = config_manager.get_input_folder()
+        logger.info("Scanning for images in: %s", input_folder)
+        min_size, max_size = config_manager.get_file_size_limits()
+        scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scan')
+        files_future = scan_pool.submit(
+            scan_image_files, input_folder,
+            config_manager.get_supported_format_set(), min_size, max_size
+        )
+        scan_pool.shutdown(wait=False)
         
         # Get pipeline configuration
         pipeline_config = config_manager.config.get('pipeline', {})
@@ -115,6 +144,7 @@ def main() -> int:
         ocr_processor = None
         if enable_ocr:
             logger.info("Initializing OCR processor...")
+            from .ocr.ocr_processor import OCRProcessor
             ocr_config = config_manager.get_ocr_config()
             ocr_processor = OCRProcessor(ocr_config)
         else:
@@ -125,9 +155,10 @@ def main() -> int:
         if enable_image_agent or enable_text_agent:
             logger.info("Initializing Ollama client...")
             try:
+                from .llm.ollama_client import OllamaClient
                 ollama_client = OllamaClient(config_manager.config)
             except Exception as e:
-                logger.warning(f"Failed to initialize Ollama client: {e}")
+                logger.warning("Failed to initialize Ollama client: %s", e)
                 logger.warning("AI agents will be disabled")
                 enable_image_agent = False
                 enable_text_agent = False
@@ -137,9 +168,10 @@ def main() -> int:
         if enable_image_agent and ollama_client:
             logger.info("Initializing Image Agent...")
             try:
+                from .llm.vl.image_agent import ImageAgent
                 image_agent = ImageAgent(config_manager.config, ollama_client)
             except Exception as e:
-                logger.warning(f"Failed to initialize Image Agent: {e}")
+                logger.warning("Failed to initialize Image Agent: %s", e)
                 image_agent = None
         
         # Initialize Text Agent
@@ -147,9 +179,10 @@ def main() -> int:
         if enable_text_agent and ollama_client:
             logger.info("Initializing Text Agent...")
             try:
+                from .llm.text.text_agent import TextAgent
                 text_agent = TextAgent(config_manager.config, ollama_client)
             except Exception as e:
-                logger.warning(f"Failed to initialize Text Agent: {e}")
+                logger.warning("Failed to initialize Text Agent: %s", e)
                 text_agent = None
 
         # Initialize Translator Agent (optional)
@@ -158,17 +191,15 @@ def main() -> int:
         if enable_translation and ollama_client:
             logger.info("Initializing Translator Agent...")
             try:
+                from .llm.translation.translator_agent import TranslatorAgent
                 translator_agent = TranslatorAgent(
                     config_manager.config, ollama_client
                 )
             except Exception as e:
-                logger.warning(f"Failed to initialize Translator Agent: {e}")
+                logger.warning("Failed to initialize Translator Agent: %s", e)
                 translator_agent = None
         
         # Determine processing mode
-        input_folder = config_manager.get_input_folder()
-        logger.info(f"Scanning for images in: {input_folder}")
-
         if args.batch_mode == 'step':
             # Allow overriding threads for per-step processing
             if args.threads:
@@ -177,6 +208,9 @@ def main() -> int:
                 ] = args.threads
 
             logger.info("Initializing step-based batch processor...")
+            from .pipeline.batch_processor.batch_processor_by_steps import (
+                BatchProcessorBySteps
+            )
             batch_processor = BatchProcessorBySteps(
                 config_manager,
                 ocr_processor,
@@ -185,10 +219,13 @@ def main() -> int:
                 translator_agent,
             )
 
-            image_files = batch_processor.get_image_files(input_folder)
+            image_files = batch_processor.get_image_files(
+                input_folder, scan=files_future
+            )
         else:
             # Initialize image processor (image-by-image)
             logger.info("Initializing image processor...")
+            from .pipeline.image_processor import ImageProcessor
             image_processor = ImageProcessor(
                 config_manager,
                 ocr_processor,
@@ -197,77 +234,86 @@ def main() -> int:
                 translator_agent,
             )
 
-            image_files = image_processor.get_image_files(input_folder)
+            image_files = image_processor.get_image_files(
+                input_folder, scan=files_future
+            )
         
         if not image_files:
             logger.warning("No image files found to process")
-            logger.info(f"No image files found in: {input_folder}")
+            logger.info("No image files found in: %s", input_folder)
             logger.info(
-                f"Supported formats: {', '.join(config_manager.get_supported_formats())}"
+                "Supported formats: %s",
+                ', '.join(config_manager.get_supported_formats())
             )
             return 1
         
         # Process images
-        logger.info(f"Found {len(image_files)} image files to process")
-        logger.info(f"Processing {len(image_files)} images from: {input_folder}")
-        logger.info(f"Using {config_manager.get_num_threads()} threads")
+        logger.info("Found %d image files to process", len(image_files))
+        logger.info("Processing %d images from: %s", len(image_files), input_folder)
+        logger.info("Using %s threads", config_manager.get_num_threads())
 
-        if args.batch_mode == 'step':
         if args.batch_mode == 'step':
             logger.info("Batch processing mode: STEP")
             report = batch_processor.process_images_batch_by_steps(image_files)
 
-            # Step-mode report (summary of steps)
-            logger.info("=" * 60)
-            logger.info("PROCESSING COMPLETED (STEP MODE)")
-            logger.info("=" * 60)
-            logger.info(f"Total images: {report['summary']['total_images']}")
-            logger.info(f"Steps completed: {', '.join(report['summary']['steps'])}")
-            total_time_val = report['timing']['total_processing_time']
-            logger.info(f"Total processing time: {total_time_val}s")
+            # Step-mode report (summary of steps), logged as one record
+            logger.info(
+                "\n".join((
+                    SUMMARY_RULE,
+                    "PROCESSING COMPLETED (STEP MODE)",
+                    SUMMARY_RULE,
+                    "Total images: %s",
+                    "Steps completed: %s",
+                    "Total processing time: %ss",
+                )),
+                report['summary']['total_images'],
+                ', '.join(report['summary']['steps']),
+                report['timing']['total_processing_time']
+            )
 
             if report.get('errors'):
-                logger.warning("Errors occurred during processing:")
-                for error in report['errors']:
-                    name = Path(error['image']).name
-                    logger.error(f"  - {name}: {error['error']}")
+                _log_errors(report['errors'])
 
         else:
             logger.info("Batch processing mode: IMAGE")
             report = image_processor.process_images_batch(image_files)
 
-            # Image-mode (original) report
-            logger.info("=" * 60)
-            logger.info("PROCESSING COMPLETED")
-            logger.info("=" * 60)
-            logger.info(f"Total images: {report['summary']['total_images']}")
-            logger.info(f"Successfully processed: {report['summary']['successful_images']}")
-            logger.info(f"Failed: {report['summary']['failed_images']}")
-            success_rate_str = f"{report['summary']['success_rate']}%"
-            logger.info(f"Success rate: {success_rate_str}")
-            logger.info(f"Average time per image: {report['timing']['average_time_per_image']}s")
-            logger.info(f"Total time: {report['timing']['batch_time']}s")
+            # Image-mode (original) report, logged as one record
+            logger.info(
+                "\n".join((
+                    SUMMARY_RULE,
+                    "PROCESSING COMPLETED",
+                    SUMMARY_RULE,
+                    "Total images: %s",
+                    "Successfully processed: %s",
+                    "Failed: %s",
+                    "Success rate: %s%%",
+                    "Average time per image: %ss",
+                    "Total time: %ss",
+                )),
+                report['summary']['total_images'],
+                report['summary']['successful_images'],
+                report['summary']['failed_images'],
+                report['summary']['success_rate'],
+                report['timing']['average_time_per_image'],
+                report['timing']['batch_time']
+            )
 
             if report['errors']:
-                logger.warning("Errors occurred during processing:")
-                for error in report['errors']:
-                    name = Path(error['image']).name
-                    logger.error(f"  - {name}: {error['error']}")
+                _log_errors(report['errors'])
 
             logger.info("Results saved as .yml files in the same folders as the images.")
         logger.info("Caption Extractor completed successfully")
         return 0
         
-        logger.info("Caption Extractor completed successfully")
-        return 0
-        
     except KeyboardInterrupt:
-        logger = logging.getLogger(__name__)
         logger.info("Processing interrupted by user")
         return 1
         
     except Exception as e:
-        logger = logging.getLogger(__name__)
-        logger.error(f"Fatal error: {e}", exc_info=True)
-        return 1__main__":
+        logger.error("Fatal error: %s", e, exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
     sys.exit(main())
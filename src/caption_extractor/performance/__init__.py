@@ -1,5 +1,6 @@
 """Performance tracking package."""
 
 from .performance_stats import PerformanceStatsManager
+from .latency_recorder import LatencyRecorder
 
-__all__ = ['PerformanceStatsManager']
+__all__ = ['PerformanceStatsManager', 'LatencyRecorder']
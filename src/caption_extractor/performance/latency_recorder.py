@@ -0,0 +1,132 @@
+"""Process-wide latency and throughput metrics for the LLM agents."""
+
+import atexit
+import logging
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+# Number of most recent request latencies kept per agent for percentiles
+RECENT_LATENCIES = 1000
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class LatencyRecorder:
+    """Record per-request latency and token throughput for each agent.
+
+    State is class-level so every agent instance in the process reports into
+    the same place; a summary is logged at interpreter exit.
+    """
+
+    _lock = threading.Lock()
+    _agents: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def record(
+        cls,
+        agent: str,
+        latency_s: float,
+        tokens: int = 0,
+        items: int = 1
+    ) -> None:
+        """Record one LLM request.
+
+        Args:
+            agent: Agent name (e.g. 'text_agent')
+            latency_s: Request time in seconds
+            tokens: Tokens generated by the request (0 if unknown)
+            items: Texts/images covered by the request (batched calls)
+        """
+        with cls._lock:
+            stats = cls._agents.get(agent)
+            if stats is None:
+                stats = cls._agents[agent] = {
+                    'requests': 0,
+                    'items': 0,
+                    'tokens': 0,
+                    'total_time': 0.0,
+                    'latencies': deque(maxlen=RECENT_LATENCIES)
+                }
+            stats['requests'] += 1
+            stats['items'] += items
+            stats['tokens'] += tokens
+            stats['total_time'] += latency_s
+            stats['latencies'].append(latency_s)
+
+    @classmethod
+    def record_response(
+        cls,
+        agent: str,
+        response_data: Optional[Dict[str, Any]],
+        items: int = 1
+    ) -> None:
+        """Record an OllamaClient result dict; failed (None) results are ignored."""
+        if response_data:
+            cls.record(
+                agent,
+                response_data.get('processing_time', 0.0),
+                response_data.get('tokens', 0),
+                items
+            )
+
+    @classmethod
+    def metrics_snapshot(cls) -> Dict[str, Dict[str, Any]]:
+        """Get current metrics per agent.
+
+        Returns:
+            Dict of agent name to request/item/token counts, p50/p95/p99
+            latency, per-item time and generated tokens per second
+        """
+        with cls._lock:
+            agents = {
+                agent: (dict(stats), sorted(stats['latencies']))
+                for agent, stats in cls._agents.items()
+            }
+
+        snapshot = {}
+        for agent, (stats, latencies) in agents.items():
+            total_time = stats['total_time']
+            snapshot[agent] = {
+                'requests': stats['requests'],
+                'items': stats['items'],
+                'tokens': stats['tokens'],
+                'p50_s': round(_percentile(latencies, 0.50), 3),
+                'p95_s': round(_percentile(latencies, 0.95), 3),
+                'p99_s': round(_percentile(latencies, 0.99), 3),
+                'per_item_s': round(total_time / stats['items'], 3) if stats['items'] else 0.0,
+                'tokens_per_s': round(stats['tokens'] / total_time, 1) if total_time else 0.0
+            }
+        return snapshot
+
+    @classmethod
+    def log_summary(cls) -> None:
+        """Log the metrics snapshot at INFO level, if anything was recorded."""
+        snapshot = cls.metrics_snapshot()
+        if not snapshot:
+            return
+        logger = logging.getLogger(__name__)
+        for agent, metrics in sorted(snapshot.items()):
+            logger.info(
+                "%s: %d requests, %d items, p50=%.2fs p95=%.2fs p99=%.2fs, "
+                "%.2fs/item, %.1f tokens/s",
+                agent, metrics['requests'], metrics['items'],
+                metrics['p50_s'], metrics['p95_s'], metrics['p99_s'],
+                metrics['per_item_s'], metrics['tokens_per_s']
+            )
+
+    @classmethod
+    def reset(cls) -> None:
+        """Clear all recorded metrics."""
+        with cls._lock:
+            cls._agents.clear()
+
+
+atexit.register(LatencyRecorder.log_summary)
@@ -7,22 +7,41 @@ import threading
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from collections import defaultdict
+from typing import Dict, Any, Optional
+from collections import defaultdict, deque
 from dataclasses import dataclass, field, asdict
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+
+# Number of most recent request times kept per model
+RECENT_REQUEST_TIMES = 100
+
 
 @dataclass
 class ModelStats:
-    """Statistics for a specific model."""
+    """Statistics for a specific model.
+    
+    Aggregates are kept as running values; only the most recent
+    RECENT_REQUEST_TIMES individual timings are retained.
+    """
     model_name: str
     request_count: int = 0
-    request_times: List[float] = field(default_factory=list)
+    request_times: deque = field(
+        default_factory=lambda: deque(maxlen=RECENT_REQUEST_TIMES)
+    )
     total_time: float = 0.0
-    avg_time: float = 0.0
     min_time: float = float('inf')
     max_time: float = 0.0
     
+    @property
+    def avg_time(self) -> float:
+        """Average request time in seconds."""
+        return self.total_time / self.request_count if self.request_count else 0.0
+    
     def add_request(self, processing_time: float):
         """Add a new request timing.
         
@@ -32,9 +51,10 @@ class ModelStats:
         self.request_count += 1
         self.request_times.append(processing_time)
         self.total_time += processing_time
-        self.avg_time = self.total_time / self.request_count
-        self.min_time = min(self.min_time, processing_time)
-        self.max_time = max(self.max_time, processing_time)
+        if processing_time < self.min_time:
+            self.min_time = processing_time
+        if processing_time > self.max_time:
+            self.max_time = processing_time
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -148,10 +168,11 @@ class PerformanceStatsManager:
             
             self.stats[request_type].add_request(model_name, processing_time)
             
-            self.logger.info(
-                f"Tracked request: type={request_type}, "
-                f"model={model_name}, time={processing_time:.3f}s, "
-                f"total_for_type={self.stats[request_type].total_requests}"
+            self.logger.debug(
+                "Tracked request: type=%s, model=%s, time=%.3fs, "
+                "total_for_type=%s",
+                request_type, model_name, processing_time,
+                self.stats[request_type].total_requests
             )
     
     def get_stats(self, request_type: Optional[str] = None) -> Dict[str, Any]:
@@ -248,7 +269,8 @@ class PerformanceStatsManager:
             
             # Create directory if it doesn't exist
             log_dir = Path(self.log_location)
-            log_dir.mkdir(parents=True, exist_ok=True)
+            if not log_dir.is_dir():
+                log_dir.mkdir(parents=True, exist_ok=True)
             
             # Use a single fixed filename that gets overwritten
             filepath = log_dir / "performance_stats.yml"
@@ -258,7 +280,7 @@ class PerformanceStatsManager:
         
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(stats_data, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(stats_data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
             
             self.logger.info(f"Performance statistics saved to: {filepath}")
         except Exception as e:
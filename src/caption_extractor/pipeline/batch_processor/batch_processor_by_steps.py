@@ -8,9 +8,8 @@ model once, processing all images, then unloading before loading the next.
 import os
 import time
 import logging
-from pathlib import Path
-from typing import List, Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from threading import Lock
 
 try:
@@ -19,9 +18,10 @@ try:
 except ImportError:
     TQDM_AVAILABLE = False
 
+from ..image_files import scan_image_files
 from ..pipeline_state_manager import PipelineStateManager
 from ..step_processor.step_processor import StepProcessor
-from ..metadata_combiner.metadata_combiner import MetadataCombiner
+from ..metadata_combiner.metadata_combiner import MetadataCombiner, now_string
 
 
 class BatchProcessorBySteps:
@@ -51,10 +51,14 @@ class BatchProcessorBySteps:
         self.translator_agent = translator_agent
         self.metadata_combiner = MetadataCombiner()
         self.logger = logging.getLogger(__name__)
+        # Lowercase extensions (with leading dot) matched by folder scans
+        self._image_extensions = config_manager.get_supported_format_set()
         self.stats_lock = Lock()
 
         # Initialize pipeline state manager
-        self.state_manager = PipelineStateManager()
+        self.state_manager = PipelineStateManager(
+            result_format=config_manager.get_result_format()
+        )
         self.step_processor = StepProcessor(
             config_manager, self.state_manager
         )
@@ -92,11 +96,15 @@ class BatchProcessorBySteps:
             'errors': []
         }
 
-    def get_image_files(self, folder_path: str) -> List[str]:
+    def get_image_files(
+        self, folder_path: str, scan: Optional[Future] = None
+    ) -> List[str]:
         """Get list of image files from folder.
 
         Args:
             folder_path: Path to the folder containing images
+            scan: Optional future of a scan_image_files call for folder_path
+                already started elsewhere (e.g. while models load)
 
         Returns:
             List of image file paths
@@ -107,22 +115,30 @@ class BatchProcessorBySteps:
             )
             return []
 
-        supported_formats = (
-            self.config_manager.get_supported_formats()
-        )
-        image_files = []
-
         try:
-            for file_path in Path(folder_path).rglob('*'):
-                if (file_path.is_file() and
-                        file_path.suffix.lower() in supported_formats):
-                    image_files.append(str(file_path))
+            if scan is None:
+                min_size, max_size = self.config_manager.get_file_size_limits()
+                image_files, file_sizes, skipped = scan_image_files(
+                    folder_path, self._image_extensions, min_size, max_size
+                )
+            else:
+                image_files, file_sizes, skipped = scan.result()
 
             self.logger.info(
                 "Found %s image files in %s",
                 len(image_files), folder_path
             )
-            return sorted(image_files)
+            if skipped:
+                self.logger.warning(
+                    "Skipped %s image files outside the configured "
+                    "size limits", skipped
+                )
+            image_files.sort()
+            if self.config_manager.get_schedule() == 'lpt':
+                # Largest files first so threads don't idle on a last
+                # long-running image (stable sort keeps name order on ties)
+                image_files.sort(key=file_sizes.get, reverse=True)
+            return image_files
 
         except Exception as err:
             self.logger.error(
@@ -132,14 +148,20 @@ class BatchProcessorBySteps:
 
     def _process_step_for_images(self, step_name: str,
                                  image_files: List[str],
-                                 step_function, *args) -> Dict[str, Any]:
+                                 step_function, *args,
+                                 batch_size: Optional[int] = None
+                                 ) -> Dict[str, Any]:
         """Process a single step for all images.
 
         Args:
             step_name: Name of the step (for logging)
             image_files: List of image files to process
-            step_function: Function to call for each image
+            step_function: Function to call for each image, or with
+                batch_size for each list of up to batch_size images
+                (returning one result per image)
             *args: Arguments for step function
+            batch_size: Images per step_function call (default: one image
+                per call)
 
         Returns:
             Step statistics
@@ -178,69 +200,35 @@ class BatchProcessorBySteps:
             with ThreadPoolExecutor(
                 max_workers=self.num_threads
             ) as executor:
-                future_to_image = {
-                    executor.submit(step_function, image_path,
-                                    *args): image_path
-                    for image_path in image_files
-                }
-
-                for future in as_completed(future_to_image):
-                    image_path = future_to_image[future]
-
+                if batch_size:
+                    future_to_images = {
+                        executor.submit(step_function, chunk, *args): chunk
+                        for chunk in (
+                            image_files[i:i + batch_size]
+                            for i in range(0, len(image_files), batch_size)
+                        )
+                    }
+                else:
+                    future_to_images = {
+                        executor.submit(step_function, image_path,
+                                        *args): [image_path]
+                        for image_path in image_files
+                    }
+
+                for future in as_completed(future_to_images):
+                    chunk = future_to_images[future]
                     try:
-                        success, state, proc_time = future.result()
-                        step_stats['processing_times'].append(proc_time)
-
-                        if success:
-                            step_status = (
-                                state.get('pipeline_status', {})
-                                .get('steps', {})
-                                .get(step_name, {})
-                            )
-                            if (step_status.get('status') ==
-                                    'skipped'):
-                                step_stats['skipped'] += 1
-                                status = "SKIPPED"
-                            else:
-                                step_stats['successful'] += 1
-                                status = "OK"
-                        else:
-                            step_stats['failed'] += 1
-                            status = "FAILED"
-                            error_msg = (
-                                state.get('pipeline_status', {})
-                                .get('steps', {})
-                                .get(step_name, {})
-                                .get('error', 'Unknown error')
-                            )
-                            step_stats['errors'].append({
-                                'image': image_path,
-                                'error': error_msg,
-                                'time': proc_time
-                            })
-
-                        if progress_bar:
-                            progress_bar.set_postfix({
-                                'file': os.path.basename(image_path),
-                                'time': f'{proc_time:.2f}s',
-                                'status': status
-                            })
-                            progress_bar.update(1)
-
+                        results = future.result()
+                        if not batch_size:
+                            results = [results]
                     except Exception as err:
-                        self.logger.error(
-                            "Error processing %s: %s",
-                            image_path, err
-                        )
-                        step_stats['failed'] += 1
-                        step_stats['errors'].append({
-                            'image': image_path,
-                            'error': str(err),
-                            'time': 0.0
-                        })
+                        results = [err] * len(chunk)
 
-                        if progress_bar:
-                            progress_bar.update(1)
+                    for image_path, result in zip(chunk, results):
+                        self._record_step_result(
+                            step_stats, step_name, image_path, result,
+                            progress_bar
+                        )
 
         finally:
             if progress_bar:
@@ -253,6 +241,106 @@ class BatchProcessorBySteps:
 
         return step_stats
 
+    def _record_step_result(self, step_stats: Dict[str, Any],
+                            step_name: str, image_path: str, result,
+                            progress_bar=None) -> None:
+        """Add one image's step result to the step statistics.
+
+        Args:
+            step_stats: Statistics of the running step
+            step_name: Name of the step
+            image_path: Path to the image
+            result: (success, state, proc_time) tuple, or the exception
+                raised while processing the image
+            progress_bar: Progress bar to advance (optional)
+        """
+        if isinstance(result, Exception):
+            self.logger.error(
+                "Error processing %s: %s",
+                image_path, result
+            )
+            step_stats['failed'] += 1
+            step_stats['errors'].append({
+                'image': image_path,
+                'error': str(result),
+                'time': 0.0
+            })
+
+            if progress_bar:
+                progress_bar.update(1)
+            return
+
+        success, state, proc_time = result
+        step_stats['processing_times'].append(proc_time)
+
+        if success:
+            step_status = (
+                state.get('pipeline_status', {})
+                .get('steps', {})
+                .get(step_name, {})
+            )
+            if (step_status.get('status') ==
+                    'skipped'):
+                step_stats['skipped'] += 1
+                status = "SKIPPED"
+            else:
+                step_stats['successful'] += 1
+                status = "OK"
+        else:
+            step_stats['failed'] += 1
+            status = "FAILED"
+            error_msg = (
+                state.get('pipeline_status', {})
+                .get('steps', {})
+                .get(step_name, {})
+                .get('error', 'Unknown error')
+            )
+            step_stats['errors'].append({
+                'image': image_path,
+                'error': error_msg,
+                'time': proc_time
+            })
+
+        if progress_bar:
+            progress_bar.set_postfix({
+                'file': os.path.basename(image_path),
+                'time': f'{proc_time:.2f}s',
+                'status': status
+            })
+            progress_bar.update(1)
+
+    def _process_step_for_chunk(
+        self, image_paths: List[str], batch_step, *args
+    ) -> List[Tuple[bool, Dict[str, Any], float]]:
+        """Process a step for several images with one batch_step call.
+
+        Args:
+            image_paths: Paths to the images
+            batch_step: StepProcessor batch method taking (image_paths,
+                states, *args) and returning (success, state) per image
+            *args: Arguments for batch_step
+
+        Returns:
+            List of (success, state, proc_time) tuples, one per image
+        """
+        batch_start = time.time()
+
+        # Load or create states
+        states = [
+            self.state_manager.load_state(image_path) or
+            self.state_manager.create_initial_state(image_path)
+            for image_path in image_paths
+        ]
+
+        results = batch_step(image_paths, states, *args)
+
+        # Save states
+        for image_path, (_, state) in zip(image_paths, results):
+            self.state_manager.save_state(image_path, state)
+
+        proc_time = (time.time() - batch_start) / len(image_paths)
+        return [(success, state, proc_time) for success, state in results]
+
     def _process_ocr_for_image(self, image_path: str
                                ) -> Tuple[bool, Dict[str, Any], float]:
         """Process OCR step for single image."""
@@ -321,40 +409,6 @@ class BatchProcessorBySteps:
             state = {}
             return False, state, proc_time
 
-    def _process_text_agent_for_image(
-        self, image_path: str
-    ) -> Tuple[bool, Dict[str, Any], float]:
-        """Process text agent step for single image."""
-        batch_start = time.time()
-
-        try:
-            # Load state
-            state = self.state_manager.load_state(image_path)
-            if not state:
-                state = self.state_manager.create_initial_state(
-                    image_path
-                )
-
-            # Process text agent step
-            success, state = self.step_processor.process_text_agent_step(
-                image_path, state, self.text_agent
-            )
-
-            # Save state
-            self.state_manager.save_state(image_path, state)
-
-            proc_time = time.time() - batch_start
-            return success, state, proc_time
-
-        except Exception as err:
-            self.logger.error(
-                "Error in text agent processing for %s: %s",
-                image_path, err
-            )
-            proc_time = time.time() - batch_start
-            state = {}
-            return False, state, proc_time
-
     def _process_translation_for_image(
         self, image_path: str
     ) -> Tuple[bool, Dict[str, Any], float]:
@@ -389,44 +443,20 @@ class BatchProcessorBySteps:
             state = {}
             return False, state, proc_time
 
-    def _process_metadata_for_image(
-        self, image_path: str
-    ) -> Tuple[bool, Dict[str, Any], float]:
-        """Process metadata combination step for single image."""
-        batch_start = time.time()
-
-        try:
-            # Load state
-            state = self.state_manager.load_state(image_path)
-            if not state:
-                state = self.state_manager.create_initial_state(
-                    image_path
-                )
-
-            # Process metadata combination step
-            success, state = (
-                self.step_processor.process_metadata_combination_step(
-                    image_path, state, self.metadata_combiner
-                )
-            )
-
-            # Mark pipeline as completed
-            state = self.state_manager.mark_pipeline_completed(state)
-
-            # Save state
-            self.state_manager.save_state(image_path, state)
-
-            proc_time = time.time() - batch_start
-            return success, state, proc_time
-
-        except Exception as err:
-            self.logger.error(
-                "Error in metadata processing for %s: %s",
-                image_path, err
-            )
-            proc_time = time.time() - batch_start
-            state = {}
-            return False, state, proc_time
+    def _combine_metadata_for_chunk(
+        self, image_paths: List[str], states: List[Dict[str, Any]],
+        processed_at: Optional[str] = None
+    ) -> List[Tuple[bool, Dict[str, Any]]]:
+        """Combine metadata for several images and mark their pipelines done."""
+        results = self.step_processor.process_metadata_combination_step_batch(
+            image_paths, states, self.metadata_combiner,
+            processed_at=processed_at
+        )
+        # Mark pipeline as completed
+        return [
+            (success, self.state_manager.mark_pipeline_completed(state))
+            for success, state in results
+        ]
 
     def process_images_batch_by_steps(
         self, image_files: List[str]
@@ -467,11 +497,22 @@ class BatchProcessorBySteps:
         if self.enable_ocr and self.ocr_processor:
             self.logger.info("STEP 1: OCR PROCESSING")
 
-            step_stats = self._process_step_for_images(
-                'ocr_processing',
-                image_files,
-                self._process_ocr_for_image
-            )
+            if self.ocr_processor.supports_batch_ocr:
+                # PaddleOCR 3.x: several images per OCR call
+                step_stats = self._process_step_for_images(
+                    'ocr_processing',
+                    image_files,
+                    self._process_step_for_chunk,
+                    self.step_processor.process_ocr_step_batch,
+                    self.ocr_processor,
+                    batch_size=self.config_manager.get_batch_size()
+                )
+            else:
+                step_stats = self._process_step_for_images(
+                    'ocr_processing',
+                    image_files,
+                    self._process_ocr_for_image
+                )
             self.processing_stats['step_stats']['ocr'] = step_stats
             self.processing_stats['steps_completed'].append('ocr')
 
@@ -496,10 +537,14 @@ class BatchProcessorBySteps:
         if self.enable_text_agent and self.text_agent:
             self.logger.info("STEP 3: TEXT AGENT PROCESSING")
 
+            # Several texts are corrected per LLM request
             step_stats = self._process_step_for_images(
                 'text_agent_processing',
                 image_files,
-                self._process_text_agent_for_image
+                self._process_step_for_chunk,
+                self.step_processor.process_text_agent_step_batch,
+                self.text_agent,
+                batch_size=self.text_agent.batch_size
             )
             self.processing_stats['step_stats']['text_agent'] = (
                 step_stats
@@ -524,13 +569,17 @@ class BatchProcessorBySteps:
                 'translation'
             )
 
-        # Step 5: Metadata Combination
+        # Step 5: Metadata Combination; all images of the batch share one
+        # processed_at timestamp
         self.logger.info("STEP 5: METADATA COMBINATION")
 
         step_stats = self._process_step_for_images(
             'metadata_combination',
             image_files,
-            self._process_metadata_for_image
+            self._process_step_for_chunk,
+            self._combine_metadata_for_chunk,
+            now_string(),
+            batch_size=self.config_manager.get_batch_size()
         )
         self.processing_stats['step_stats']['metadata'] = step_stats
         self.processing_stats['steps_completed'].append('metadata')
@@ -0,0 +1,55 @@
+"""Discovery of image files to process."""
+
+import os
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+
+def scan_image_files(
+    folder_path: str,
+    extensions: FrozenSet[str],
+    min_size: int = 1,
+    max_size: Optional[int] = None
+) -> Tuple[List[str], Dict[str, int], int]:
+    """Recursively find image files in a folder.
+
+    Walks with os.scandir: DirEntry caches the file type, and only matching
+    names are turned into path strings.
+
+    Args:
+        folder_path: Folder to scan
+        extensions: Lowercase extensions (with leading dot) to match
+        min_size: Smallest file size in bytes to include
+        max_size: Largest file size in bytes to include (None: no limit)
+
+    Returns:
+        Tuple of (image paths in scan order, size per path, number of
+        matching files skipped for their size)
+
+    Raises:
+        OSError: If the folder cannot be read
+    """
+    image_files = []
+    file_sizes = {}
+    skipped = 0
+
+    pending = [folder_path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                dot = entry.name.rfind('.')
+                if not (dot > 0 and
+                        entry.name[dot:].lower() in extensions
+                        and entry.is_file()):
+                    continue
+                # Skip empty/truncated and oversized files
+                size = entry.stat().st_size
+                if size < min_size or (max_size and size > max_size):
+                    skipped += 1
+                    continue
+                image_files.append(entry.path)
+                file_sizes[entry.path] = size
+
+    return image_files, file_sizes, skipped
@@ -1,20 +1,29 @@
 """Image processing with pipeline state management."""
 
 import os
+import copy
+import hashlib
+import math
+import queue
 import time
 import yaml
 import logging
+from array import array
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from typing import List, Dict, Any, Iterator, Tuple, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Thread
 from tqdm import tqdm
+import numpy as np
 
 from ..ocr.ocr_processor import OCRProcessor
 from ..llm.vl.image_agent import ImageAgent
 from ..llm.text.text_agent import TextAgent
+from .image_files import scan_image_files
 from .metadata_combiner.metadata_combiner import MetadataCombiner
-from .pipeline_state_manager import PipelineStateManager
+from .pipeline_state_manager import PipelineStateManager, YamlDumper
 from .step_processor.step_processor import StepProcessor
 
 
@@ -45,10 +54,21 @@ class ImageProcessor:
         self.translator_agent = translator_agent
         self.metadata_combiner = MetadataCombiner()
         self.logger = logging.getLogger(__name__)
-        self.stats_lock = Lock()
+        # Lowercase extensions (with leading dot) matched by folder scans
+        self._image_extensions = config_manager.get_supported_format_set()
+        self._debug_on = self.logger.isEnabledFor(logging.DEBUG)
+
+        # File sizes recorded by the last get_image_files scan, used to
+        # order images for the 'lpt' processing.schedule
+        self._file_sizes: Dict[str, int] = {}
+
+        # State writes are handed to a writer thread during batch runs
+        self._write_queue: Optional[queue.Queue] = None
 
         # Initialize pipeline state manager
-        self.state_manager = PipelineStateManager()
+        self.state_manager = PipelineStateManager(
+            result_format=config_manager.get_result_format()
+        )
         self.step_processor = StepProcessor(
             config_manager, self.state_manager
         )
@@ -76,16 +96,24 @@ class ImageProcessor:
             'total_images': 0,
             'processed_images': 0,
             'failed_images': 0,
+            'skipped_images': 0,
+            'duplicate_images': 0,
             'total_time': 0.0,
-            'processing_times': [],
+            'processing_times': array('d'),
+            'min_time': 0.0,
+            'max_time': 0.0,
             'errors': []
         }
 
-    def get_image_files(self, folder_path: str) -> List[str]:
+    def get_image_files(
+        self, folder_path: str, scan: Optional[Future] = None
+    ) -> List[str]:
         """Get list of image files from folder.
 
         Args:
             folder_path: Path to the folder containing images
+            scan: Optional future of a scan_image_files call for folder_path
+                already started elsewhere (e.g. while models load)
 
         Returns:
             List of image file paths
@@ -96,21 +124,26 @@ class ImageProcessor:
             )
             return []
 
-        supported_formats = (
-            self.config_manager.get_supported_formats()
-        )
-        image_files = []
-
         try:
-            for file_path in Path(folder_path).rglob('*'):
-                if (file_path.is_file() and
-                        file_path.suffix.lower() in supported_formats):
-                    image_files.append(str(file_path))
+            if scan is None:
+                min_size, max_size = self.config_manager.get_file_size_limits()
+                image_files, file_sizes, skipped = scan_image_files(
+                    folder_path, self._image_extensions, min_size, max_size
+                )
+            else:
+                image_files, file_sizes, skipped = scan.result()
+            self._file_sizes = file_sizes
 
             self.logger.info(
                 "Found %s image files in %s",
                 len(image_files), folder_path
             )
+            self.processing_stats['skipped_images'] = skipped
+            if skipped:
+                self.logger.warning(
+                    "Skipped %s image files outside the configured "
+                    "size limits", skipped
+                )
             return sorted(image_files)
 
         except Exception as e:
@@ -120,17 +153,18 @@ class ImageProcessor:
             return []
 
     def process_single_image(
-        self, image_path: str
+        self, image_path: str, image: Optional[np.ndarray] = None
     ) -> Tuple[str, bool, float, Dict[str, Any]]:
         """Process single image using pipeline state management.
 
         Args:
             image_path: Path to the image file
+            image: Already decoded image for the OCR step (optional)
 
         Returns:
             Tuple of (image_path, success, processing_time, result_data)
         """
-        batch_start = time.time()
+        batch_start = time.perf_counter()
 
         try:
             # Load or create state
@@ -161,10 +195,11 @@ class ImageProcessor:
             if self.enable_ocr and self.ocr_processor:
                 step_success, state = (
                     self.step_processor.process_ocr_step(
-                        image_path, state, self.ocr_processor
+                        image_path, state, self.ocr_processor,
+                        image=image
                     )
                 )
-                self.state_manager.save_state(image_path, state)
+                self._save_state(image_path, state)
                 if not step_success:
                     self.logger.warning(
                         "OCR step failed for %s",
@@ -180,7 +215,7 @@ class ImageProcessor:
                         resize_spec=resize_spec
                     )
                 )
-                self.state_manager.save_state(image_path, state)
+                self._save_state(image_path, state)
                 if not step_success:
                     self.logger.warning(
                         "Image agent step failed for %s",
@@ -195,7 +230,7 @@ class ImageProcessor:
                         image_path, state, self.text_agent
                     )
                 )
-                self.state_manager.save_state(image_path, state)
+                self._save_state(image_path, state)
                 if not step_success:
                     self.logger.warning(
                         "Text agent step failed for %s",
@@ -210,7 +245,7 @@ class ImageProcessor:
                         image_path, state, self.translator_agent
                     )
                 )
-                self.state_manager.save_state(image_path, state)
+                self._save_state(image_path, state)
                 success = success and step_success
 
             # Step 5: Metadata Combination
@@ -221,11 +256,11 @@ class ImageProcessor:
             )
             # Do not allow metadata step to overwrite previous failures
             success = success and step_success
-            self.state_manager.save_state(image_path, state)
+            self._save_state(image_path, state)
 
             # Mark pipeline as completed
             state = self.state_manager.mark_pipeline_completed(state)
-            self.state_manager.save_state(image_path, state)
+            self._save_state(image_path, state)
 
             # Get combined result
             combined_metadata = state['results'].get(
@@ -263,7 +298,7 @@ class ImageProcessor:
                 except Exception:
                     combined_metadata['error'] = 'One or more steps failed'
 
-            proc_time = time.time() - batch_start
+            proc_time = time.perf_counter() - batch_start
 
             self.logger.info(
                 "Successfully processed %s in %.2fs",
@@ -272,7 +307,7 @@ class ImageProcessor:
             return image_path, success, proc_time, combined_metadata
 
         except Exception as e:
-            proc_time = time.time() - batch_start
+            proc_time = time.perf_counter() - batch_start
             self.logger.error(
                 "Error processing %s: %s", image_path, e,
                 exc_info=True
@@ -287,6 +322,301 @@ class ImageProcessor:
 
             return image_path, False, proc_time, result_data
 
+    def filter_pending(self, image_files: List[str]) -> List[str]:
+        """Drop images whose result file is newer and fully successful.
+
+        The checks run on a thread pool: each up-to-date image costs a
+        state file read and parse, which adds up on a re-run over a large
+        folder.
+
+        Args:
+            image_files: Image file paths
+
+        Returns:
+            Image file paths that still need processing
+        """
+        num_threads = self.config_manager.get_num_threads()
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            up_to_date_flags = executor.map(
+                self.state_manager.is_up_to_date, image_files
+            )
+            pending = [
+                image_path
+                for image_path, up_to_date in zip(
+                    image_files, up_to_date_flags
+                )
+                if not up_to_date
+            ]
+        up_to_date = len(image_files) - len(pending)
+        if up_to_date:
+            self.logger.info(
+                "Skipping %s images with up-to-date results "
+                "(set processing.force_reprocess to redo them)",
+                up_to_date
+            )
+        return pending
+
+    @staticmethod
+    def _file_digest(image_path: str) -> str:
+        """Return a 128-bit BLAKE2b hex digest of a file's contents."""
+        with open(image_path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(
+                    f, lambda: hashlib.blake2b(digest_size=16)
+                ).hexdigest()
+            digest = hashlib.blake2b(digest_size=16)
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+            return digest.hexdigest()
+
+    def _find_duplicates(
+        self, image_files: List[str], num_threads: int
+    ) -> Tuple[List[str], Dict[str, str]]:
+        """Group images with identical contents.
+
+        Args:
+            image_files: Image file paths
+            num_threads: Number of threads used for hashing
+
+        Returns:
+            Tuple of (unique image paths, {duplicate path: original path})
+        """
+        first_by_digest = {}
+        unique_files = []
+        duplicates = {}
+
+        def digest_or_path(image_path):
+            try:
+                return self._file_digest(image_path)
+            except OSError as e:
+                self.logger.warning(
+                    "Could not hash %s: %s", image_path, e
+                )
+                # Unreadable files are never treated as duplicates
+                return image_path
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            digests = executor.map(digest_or_path, image_files)
+            for image_path, digest in zip(image_files, digests):
+                primary_path = first_by_digest.setdefault(digest, image_path)
+                if primary_path == image_path:
+                    unique_files.append(image_path)
+                else:
+                    duplicates[image_path] = primary_path
+
+        if duplicates:
+            self.logger.info(
+                "Skipping %s duplicate images; their results are copied "
+                "from the first identical file", len(duplicates)
+            )
+        return unique_files, duplicates
+
+    def _copy_state(self, source_path: str, image_path: str) -> bool:
+        """Save the state of source_path as the state of image_path.
+
+        Args:
+            source_path: Image whose results are reused
+            image_path: Duplicate image receiving the results
+
+        Returns:
+            True if the state was copied
+        """
+        state = self.state_manager.load_state(source_path)
+        if not state:
+            return False
+
+        image_name = Path(image_path).name
+        state['image_path'] = str(image_path)
+        state['image_name'] = image_name
+        state.setdefault('metadata', {})['duplicate_of'] = str(source_path)
+
+        combined = state.get('results', {}).get('combined_metadata')
+        if isinstance(combined, dict):
+            combined['image_file'] = image_name
+            combined['image_path'] = str(image_path)
+
+        return self.state_manager.save_state(image_path, state)
+
+    def _iter_decoded_images(
+        self, image_files: List[str]
+    ) -> Iterator[Tuple[str, Optional[np.ndarray]]]:
+        """Yield (image_path, image) pairs, decoding upcoming images ahead.
+
+        Up to processing.prefetch_images images are read and decoded on a
+        helper thread while the caller runs the pipeline on the current
+        one, hiding disk latency on slow storage. Images that fail to
+        decode are yielded as None so the OCR step reads and reports them
+        itself.
+
+        Args:
+            image_files: Image file paths
+
+        Yields:
+            Tuples of (image_path, decoded image or None)
+        """
+        if not (self.enable_ocr and self.ocr_processor):
+            for image_path in image_files:
+                yield image_path, None
+            return
+
+        depth = self.config_manager.get_prefetch_depth()
+        with ThreadPoolExecutor(max_workers=1) as decoder:
+            pending = deque()
+            upcoming = iter(image_files)
+            for image_path in islice(upcoming, depth + 1):
+                pending.append((image_path, decoder.submit(
+                    self.ocr_processor.read_image, image_path
+                )))
+
+            while pending:
+                image_path, future = pending.popleft()
+                next_path = next(upcoming, None)
+                if next_path is not None:
+                    pending.append((next_path, decoder.submit(
+                        self.ocr_processor.read_image, next_path
+                    )))
+                try:
+                    image = future.result()
+                except Exception as e:
+                    self.logger.debug(
+                        "Prefetch failed for %s: %s", image_path, e
+                    )
+                    image = None
+                yield image_path, image
+
+    def _process_chunk(
+        self, image_files: List[str], progress_bar=None
+    ) -> List[Tuple[str, bool, float, Dict[str, Any]]]:
+        """Process a chunk of images sequentially with decode-ahead.
+
+        Args:
+            image_files: Image file paths in this chunk
+            progress_bar: Progress bar to advance per image (optional)
+
+        Returns:
+            List of process_single_image results, one per image; an image
+            that raises is reported as failed instead of aborting the chunk
+        """
+        results = []
+        try:
+            for image_path, image in self._iter_decoded_images(image_files):
+                try:
+                    result = self.process_single_image(
+                        image_path, image=image
+                    )
+                except Exception as err:
+                    self.logger.error(
+                        "Unexpected error processing %s: %s",
+                        image_path, err
+                    )
+                    result = (image_path, False, 0.0, {'error': str(err)})
+                results.append(result)
+
+                if progress_bar:
+                    # set_postfix reformats the whole bar; refresh it only
+                    # every 32 images and let update() handle the redraw
+                    if (len(results) & 31) == 1:
+                        progress_bar.set_postfix({
+                            'current': os.path.basename(image_path),
+                            'time': f'{result[2]:.2f}s'
+                        }, refresh=False)
+                    progress_bar.update(1)
+        except Exception as err:
+            # Decode-ahead broke down; fail the images not reached yet
+            remaining = image_files[len(results):]
+            self.logger.error(
+                "Error processing chunk, %s images not processed: %s",
+                len(remaining), err
+            )
+            results.extend(
+                (image_path, False, 0.0, {'error': str(err)})
+                for image_path in remaining
+            )
+            if progress_bar:
+                progress_bar.update(len(remaining))
+        return results
+
+    def _make_chunks(
+        self, image_files: List[str], chunk_size: int
+    ) -> List[List[str]]:
+        """Split images into per-thread chunks in processing.schedule order.
+
+        With the 'lpt' schedule the largest files come first, dealt
+        round-robin so every chunk starts on a slow image and the batch
+        does not end on a straggler. With 'alpha' the chunks are
+        contiguous runs of the given order.
+
+        Args:
+            image_files: Image file paths to process
+            chunk_size: Maximum images per chunk
+
+        Returns:
+            List of chunks
+        """
+        if self.config_manager.get_schedule() != 'lpt':
+            return [
+                image_files[i:i + chunk_size]
+                for i in range(0, len(image_files), chunk_size)
+            ]
+
+        def file_size(image_path):
+            # Sizes from the last scan; stat files that were not scanned
+            size = self._file_sizes.get(image_path)
+            if size is None:
+                try:
+                    size = os.path.getsize(image_path)
+                except OSError:
+                    size = 0
+            return size
+
+        num_chunks = math.ceil(len(image_files) / chunk_size)
+        by_size = sorted(image_files, key=file_size, reverse=True)
+        return [by_size[i::num_chunks] for i in range(num_chunks)]
+
+    def _save_state(self, image_path: str, state: Dict[str, Any]) -> None:
+        """Persist pipeline state, via the writer thread when one is running.
+
+        Args:
+            image_path: Path to the image file
+            state: State dictionary to save
+        """
+        if self._write_queue is None:
+            self.state_manager.save_state(image_path, state)
+        else:
+            # Snapshot: later steps keep mutating the same state dict
+            self._write_queue.put((image_path, copy.deepcopy(state)))
+
+    def _writer_loop(self, write_queue: queue.Queue) -> None:
+        """Write queued states to disk until a None sentinel is received.
+
+        Items waiting in the queue are drained together and only the latest
+        state per image is written.
+
+        Args:
+            write_queue: Queue of (image_path, state) items
+        """
+        running = True
+        while running:
+            pending = {}
+            items = [write_queue.get()]
+            while True:
+                try:
+                    items.append(write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in items:
+                if item is None:
+                    running = False
+                else:
+                    pending[item[0]] = item[1]
+
+            for image_path, state in pending.items():
+                self.state_manager.save_state(image_path, state)
+
+            for _ in items:
+                write_queue.task_done()
+
     def _save_result_to_yaml(
         self, image_path: str, result_data: Dict[str, Any]
     ) -> None:
@@ -306,7 +636,8 @@ class ImageProcessor:
             # Save to YAML file
             with open(output_path, 'w', encoding='utf-8') as f:
                 yaml.dump(
-                    result_data, f, default_flow_style=False,
+                    result_data, f, Dumper=YamlDumper,
+                    default_flow_style=False,
                     allow_unicode=True, indent=2
                 )
 
@@ -325,32 +656,48 @@ class ImageProcessor:
     ) -> None:
         """Update processing statistics.
 
+        Only called from the thread consuming batch results, so no lock
+        is needed. Min/max are kept incrementally for O(1) reporting.
+
         Args:
             image_path: Path to the processed image
             success: Whether processing was successful
             processing_time: Time taken to process the image
             error: Error message if processing failed
         """
-        with self.stats_lock:
-            self.processing_stats['processed_images'] += 1
-            self.processing_stats['total_time'] += processing_time
-            self.processing_stats['processing_times'].append(
-                processing_time
-            )
-
-            if success:
+        stats = self.processing_stats
+        index = stats['processed_images']
+        if index == 0:
+            stats['min_time'] = stats['max_time'] = processing_time
+        elif processing_time < stats['min_time']:
+            stats['min_time'] = processing_time
+        elif processing_time > stats['max_time']:
+            stats['max_time'] = processing_time
+
+        # process_images_batch preallocates one slot per image
+        times = stats['processing_times']
+        if index < len(times):
+            times[index] = processing_time
+        else:
+            times.append(processing_time)
+
+        stats['processed_images'] += 1
+        stats['total_time'] += processing_time
+
+        if success:
+            if self._debug_on:
                 self.logger.debug(
                     "Successfully processed %s in %.3fs",
                     os.path.basename(image_path), processing_time
                 )
-            else:
-                self.processing_stats['failed_images'] += 1
-                if error:
-                    self.processing_stats['errors'].append({
-                        'image': image_path,
-                        'error': error,
-                        'time': processing_time
-                    })
+        else:
+            stats['failed_images'] += 1
+            if error:
+                stats['errors'].append({
+                    'image': image_path,
+                    'error': error,
+                    'time': processing_time
+                })
 
     def process_images_batch(
         self, image_files: List[str]
@@ -363,6 +710,9 @@ class ImageProcessor:
         Returns:
             Processing statistics and results
         """
+        if image_files and not self.config_manager.is_force_reprocess():
+            image_files = self.filter_pending(image_files)
+
         if not image_files:
             self.logger.warning("No image files to process")
             return self.get_processing_report()
@@ -371,8 +721,10 @@ class ImageProcessor:
         self.processing_stats['total_images'] = len(image_files)
         self.processing_stats['processed_images'] = 0
         self.processing_stats['failed_images'] = 0
+        self.processing_stats['duplicate_images'] = 0
         self.processing_stats['total_time'] = 0.0
-        self.processing_stats['processing_times'] = []
+        self.processing_stats['min_time'] = 0.0
+        self.processing_stats['max_time'] = 0.0
         self.processing_stats['errors'] = []
 
         num_threads = self.config_manager.get_num_threads()
@@ -384,7 +736,20 @@ class ImageProcessor:
             len(image_files), num_threads
         )
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+
+        # Only the first copy of identical files goes through the pipeline
+        duplicates = {}
+        if self.config_manager.is_dedupe_enabled():
+            image_files, duplicates = self._find_duplicates(
+                image_files, num_threads
+            )
+        primary_results = {}
+
+        # One timing slot per image that goes through the pipeline
+        self.processing_stats['processing_times'] = (
+            array('d', [0.0]) * len(image_files)
+        )
 
         # Setup progress bar if enabled
         progress_bar = None
@@ -392,37 +757,40 @@ class ImageProcessor:
             progress_bar = tqdm(
                 total=len(image_files),
                 desc="Processing images",
-                unit="img"
+                unit="img",
+                mininterval=0.25,
+                smoothing=0.1,
+                disable=None  # no bar when stderr is not a terminal
             )
 
+        # Move state YAML writes off the processing threads
+        self._write_queue = queue.Queue(maxsize=4 * max(num_threads, 1))
+        writer = Thread(
+            target=self._writer_loop, args=(self._write_queue,),
+            name="state-writer", daemon=True
+        )
+        writer.start()
+
+        # Split into one or more chunks per thread; each thread works
+        # through a chunk sequentially, decoding the next image ahead
+        chunk_size = max(1, min(
+            self.config_manager.get_batch_size(),
+            math.ceil(len(image_files) / max(num_threads, 1))
+        ))
+        chunks = self._make_chunks(image_files, chunk_size)
+
         try:
-            # Process images concurrently
+            # Process chunks concurrently; _process_chunk turns every
+            # failure into a result, so map never raises and a bad image
+            # only fails itself
             with ThreadPoolExecutor(max_workers=num_threads) as executor:
-                # Submit all tasks
-                future_to_image = {
-                    executor.submit(
-                        self.process_single_image, image_path
-                    ): image_path
-                    for image_path in image_files
-                }
-
-                # Process completed tasks
-                for future in as_completed(future_to_image):
-                    image_path = future_to_image[future]
-
-                    try:
-                        (img_path, success, proc_time,
-                         result_data) = future.result()
-
-                        # Update progress bar
-                        if progress_bar:
-                            progress_bar.set_postfix({
-                                'current': os.path.basename(img_path),
-                                'time': f'{proc_time:.2f}s'
-                            })
-                            progress_bar.update(1)
-
-                        # Update statistics
+                for chunk_results in executor.map(
+                    self._process_chunk, chunks,
+                    [progress_bar] * len(chunks)
+                ):
+                    # Update statistics
+                    for (img_path, success, proc_time,
+                         result_data) in chunk_results:
                         error_msg = (
                             result_data.get('error')
                             if not success else None
@@ -430,24 +798,36 @@ class ImageProcessor:
                         self._update_stats(
                             img_path, success, proc_time, error_msg
                         )
-
-                    except Exception as e:
-                        self.logger.error(
-                            "Unexpected error processing %s: %s",
-                            image_path, e
-                        )
-                        self._update_stats(
-                            image_path, False, 0.0, str(e)
-                        )
-
-                        if progress_bar:
-                            progress_bar.update(1)
+                        if duplicates:
+                            primary_results[img_path] = (success, error_msg)
 
         finally:
             if progress_bar:
                 progress_bar.close()
 
-        total_batch_time = time.time() - start_time
+            # Flush pending state writes before reporting
+            self._write_queue.put(None)
+            writer.join()
+            self._write_queue = None
+
+        # Duplicates are counted apart from the timed images so they do
+        # not pull down min_time and the average
+        for image_path, primary_path in duplicates.items():
+            self.processing_stats['duplicate_images'] += 1
+            success, error_msg = primary_results.get(
+                primary_path, (False, 'Original image was not processed')
+            )
+            if not self._copy_state(primary_path, image_path):
+                success, error_msg = False, 'Could not copy duplicate result'
+            if not success:
+                self.processing_stats['failed_images'] += 1
+                self.processing_stats['errors'].append({
+                    'image': image_path,
+                    'error': error_msg,
+                    'time': 0.0
+                })
+
+        total_batch_time = time.perf_counter() - start_time
         self.processing_stats['batch_time'] = total_batch_time
 
         # Generate and log final report
@@ -464,26 +844,30 @@ class ImageProcessor:
         """
         stats = self.processing_stats
 
-        # Calculate averages
+        # Calculate averages; only processed images were timed
         avg_time = (
-            (sum(stats['processing_times']) /
-             len(stats['processing_times']))
-            if stats['processing_times'] else 0.0
+            stats['total_time'] / stats['processed_images']
+            if stats['processed_images'] else 0.0
         )
 
+        # Duplicates count as processed, sharing their original's result
+        duplicate_images = stats.get('duplicate_images', 0)
+        processed_images = stats['processed_images'] + duplicate_images
         success_rate = (
-            ((stats['processed_images'] - stats['failed_images']) /
-             max(stats['processed_images'], 1)) * 100
+            ((processed_images - stats['failed_images']) /
+             max(processed_images, 1)) * 100
         )
 
         report = {
             'summary': {
                 'total_images': stats['total_images'],
-                'processed_images': stats['processed_images'],
+                'processed_images': processed_images,
                 'successful_images': (
-                    stats['processed_images'] - stats['failed_images']
+                    processed_images - stats['failed_images']
                 ),
                 'failed_images': stats['failed_images'],
+                'skipped_images': stats.get('skipped_images', 0),
+                'duplicate_images': duplicate_images,
                 'success_rate': round(success_rate, 2)
             },
             'timing': {
@@ -494,14 +878,8 @@ class ImageProcessor:
                     stats.get('batch_time', 0.0), 3
                 ),
                 'average_time_per_image': round(avg_time, 3),
-                'min_time': (
-                    round(min(stats['processing_times']), 3)
-                    if stats['processing_times'] else 0.0
-                ),
-                'max_time': (
-                    round(max(stats['processing_times']), 3)
-                    if stats['processing_times'] else 0.0
-                )
+                'min_time': round(stats['min_time'], 3),
+                'max_time': round(stats['max_time'], 3)
             },
             'errors': stats['errors']
         }
@@ -526,6 +904,15 @@ class ImageProcessor:
             summary['successful_images']
         )
         self.logger.info("Failed: %s", summary['failed_images'])
+        if summary['skipped_images']:
+            self.logger.info(
+                "Skipped (size limits): %s", summary['skipped_images']
+            )
+        if summary['duplicate_images']:
+            self.logger.info(
+                "Duplicates (results copied): %s",
+                summary['duplicate_images']
+            )
         self.logger.info(
             "Success rate: %s%%", summary['success_rate']
         )
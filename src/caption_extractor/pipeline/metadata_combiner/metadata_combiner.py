@@ -1,17 +1,69 @@
 """Metadata combiner to merge data from OCR, image agent, and text agent."""
 
 import logging
+import os
+import threading
 import time
-from typing import Dict, Any, Optional
-from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+_timestamp_cache = threading.local()
+
+# Sections recorded for a stage that was disabled or failed; copied per
+# image (text_lines gets a fresh list, the other values are immutable)
+# so records never share a section
+_OCR_DISABLED = {
+    'full_text': '',
+    'text_lines': None,
+    'total_elements': 0,
+    'note': 'OCR processing was disabled or failed'
+}
+_VL_MODEL_DISABLED = {
+    'description': '',
+    'scene': '',
+    'text': '',
+    'story': '',
+    'note': 'Image analysis was disabled or failed'
+}
+_TEXT_PROCESSING_DISABLED = {
+    'corrected_text': '',
+    'changes': '',
+    'confidence': 'unknown',
+    'note': 'Text processing was disabled or failed'
+}
+_TRANSLATION_DISABLED = {
+    'translated_text': '',
+    'note': 'Translation was disabled or not needed'
+}
+
+# Keys every metadata record must have
+_REQUIRED_FIELDS = frozenset(('image_file', 'image_path', 'processed_at'))
+
+
+def now_string() -> str:
+    """Return the current local time as 'YYYY-mm-dd HH:MM:SS'.
+
+    The formatted string is cached per thread and only rebuilt when the
+    second changes.
+    """
+    now = int(time.time())
+    if getattr(_timestamp_cache, 'second', None) != now:
+        _timestamp_cache.second = now
+        _timestamp_cache.value = time.strftime(
+            '%Y-%m-%d %H:%M:%S', time.localtime(now)
+        )
+    return _timestamp_cache.value
 
 
 class MetadataCombiner:
     """Combines metadata from multiple sources into a comprehensive object."""
     
+    __slots__ = ('logger', '_debug_on')
+    
     def __init__(self):
         """Initialize the metadata combiner."""
         self.logger = logging.getLogger(__name__)
+        self._debug_on = self.logger.isEnabledFor(logging.DEBUG)
     
     def combine_metadata(
         self,
@@ -20,7 +72,8 @@ class MetadataCombiner:
         vl_model_data: Optional[Dict[str, Any]] = None,
         text_processing: Optional[Dict[str, Any]] = None,
         translation_result: Optional[Dict[str, Any]] = None,
-        processing_time: float = 0.0
+        processing_time: float = 0.0,
+        processed_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """Combine metadata from all sources.
         
@@ -30,139 +83,219 @@ class MetadataCombiner:
             vl_model_data: Image agent analysis results
             text_processing: Text agent processing results
             translation_result: Translation results (optional)
-            processing_time: Total processing time
+            processing_time: Total processing time, stored as given (callers
+                round it; the pipeline state already keeps 3 decimals)
+            processed_at: Timestamp to record (default: now); batch callers
+                can pass one timestamp for all their images
             
         Returns:
             Combined metadata dictionary
         """
+        if processed_at is None:
+            processed_at = now_string()
+        if self._debug_on:
+            self.logger.debug("Combining metadata for image: %s", image_path)
+        
+        # Base metadata
+        metadata = {
+            'image_file': os.path.basename(image_path),
+            'image_path': str(image_path),
+            'processed_at': processed_at,
+            'processing_time': processing_time
+        }
+        
+        # Add OCR data. Producers do not always set every key (OCR
+        # results omit text_lines, saved states may predate a field),
+        # so each field keeps its default; .get is bound once per source
+        if ocr_data:
+            get = ocr_data.get
+            metadata['ocr'] = ocr_section = {
+                'full_text': get('full_text', ''),
+                'text_lines': get('text_lines') or [],
+                'total_elements': get('total_elements', 0),
+                'avg_confidence': get('avg_confidence', 0.0),
+                'min_confidence': get('min_confidence', 0.0),
+                'max_confidence': get('max_confidence', 0.0),
+                'model': get('model', 'PaddleOCR'),
+                'processing_time': get('processing_time', 0.0)
+            }
+        else:
+            ocr_section = _OCR_DISABLED.copy()
+            ocr_section['text_lines'] = []
+            metadata['ocr'] = ocr_section
+        
+        # Add image analysis
+        if vl_model_data:
+            get = vl_model_data.get
+            metadata['vl_model_data'] = vl_section = {
+                'description': get('description', ''),
+                'scene': get('scene', ''),
+                'text': get('text', ''),
+                'story': get('story', ''),
+                'model': get('model', ''),
+                'processing_time': get('processing_time', 0.0)
+            }
+        else:
+            metadata['vl_model_data'] = vl_section = _VL_MODEL_DISABLED.copy()
+        
+        # Add text processing
+        if text_processing:
+            get = text_processing.get
+            metadata['text_processing'] = text_section = {
+                'corrected_text': get('corrected_text', ''),
+                'changes': get('changes', ''),
+                'confidence': get('confidence', 'unknown'),
+                # Optional translation fields
+                'translated_text': get('translated_text', ''),
+                'translation': get('translation') or {},
+                'language': get('language', ''),
+                'language_code': get('language_code', ''),
+                'needTranslation': get('needTranslation', False),
+                'model': get('model', ''),
+                'processing_time': get('processing_time', 0.0)
+            }
+        else:
+            metadata['text_processing'] = text_section = (
+                _TEXT_PROCESSING_DISABLED.copy()
+            )
+        
+        # Add translation result if available
+        if translation_result:
+            get = translation_result.get
+            metadata['translation'] = translation_section = {
+                'translated_text': get('translated_text', ''),
+                'source_language': get('source_language', ''),
+                'target_language': get('target_language', ''),
+                'translation_model': get('translation_model', ''),
+                'model': get('model', ''),
+                'processing_time': get('processing_time', 0.0)
+            }
+        else:
+            translation_section = _TRANSLATION_DISABLED.copy()
+            if text_processing:
+                translation_section['translated_text'] = text_processing.get('corrected_text', '')
+            metadata['translation'] = translation_section
+        
         try:
-            self.logger.debug(f"Combining metadata for image: {image_path}")
+            # Create a unified text section combining all sources
+            metadata['unified_text'] = unified = self._create_unified_text(
+                ocr_data, vl_model_data, text_processing
+            )
             
-            # Base metadata
-            image_file = Path(image_path)
-            metadata = {
-                'image_file': image_file.name,
-                'image_path': str(image_path),
-                'processed_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'processing_time': round(processing_time, 3)
-            }
+            # Add summary statistics from the sections built above
+            breakdown = {}
+            text_sources_count = 0
             
-            # Add OCR data
-            if ocr_data:
-                metadata['ocr'] = {
-                    'full_text': ocr_data.get('full_text', ''),
-                    'text_lines': ocr_data.get('text_lines', []),
-                    'total_elements': ocr_data.get('total_elements', 0),
-                    'avg_confidence': ocr_data.get('avg_confidence', 0.0),
-                    'min_confidence': ocr_data.get('min_confidence', 0.0),
-                    'max_confidence': ocr_data.get('max_confidence', 0.0),
-                    'model': ocr_data.get('model', 'PaddleOCR'),
-                    'processing_time': ocr_data.get('processing_time', 0.0)
-                }
-            else:
-                metadata['ocr'] = {
-                    'full_text': '',
-                    'text_lines': [],
-                    'total_elements': 0,
-                    'note': 'OCR processing was disabled or failed'
-                }
+            has_ocr_data = ocr_section['total_elements'] > 0
+            if has_ocr_data:
+                text_sources_count += 1
+                if ocr_section['processing_time']:
+                    breakdown['ocr'] = {
+                        'time': ocr_section['processing_time'],
+                        'model': ocr_section['model']
+                    }
             
-            # Add image analysis
-            if vl_model_data:
-                metadata['vl_model_data'] = {
-                    'description': vl_model_data.get('description', ''),
-                    'scene': vl_model_data.get('scene', ''),
-                    'text': vl_model_data.get('text', ''),
-                    'story': vl_model_data.get('story', ''),
-                    'model': vl_model_data.get('model', ''),
-                    'processing_time': vl_model_data.get('processing_time', 0.0)
-                }
-            else:
-                metadata['vl_model_data'] = {
-                    'description': '',
-                    'scene': '',
-                    'text': '',
-                    'story': '',
-                    'note': 'Image analysis was disabled or failed'
-                }
+            vl_text = vl_section['text']
+            has_vl_model_data = bool(vl_section['description'] or vl_text)
+            if has_vl_model_data:
+                if vl_text:
+                    text_sources_count += 1
+                if vl_section.get('processing_time'):
+                    breakdown['vl_model'] = {
+                        'time': vl_section['processing_time'],
+                        'model': vl_section['model']
+                    }
             
-            # Add text processing
-            if text_processing:
-                metadata['text_processing'] = {
-                    'corrected_text': text_processing.get(
-                        'corrected_text', ''
-                    ),
-                    'changes': text_processing.get('changes', ''),
-                    'confidence': text_processing.get('confidence',
-                                                      'unknown'),
-                    # Optional translation fields
-                    'translated_text': text_processing.get(
-                        'translated_text', ''
-                    ),
-                    'translation': text_processing.get('translation', {}),
-                    'language': text_processing.get('language', ''),
-                    'language_code': text_processing.get(
-                        'language_code', ''
-                    ),
-                    'needTranslation': text_processing.get(
-                        'needTranslation', False
-                    ),
-                    'model': text_processing.get('model', ''),
-                    'processing_time': text_processing.get('processing_time', 0.0)
-                }
-            else:
-                metadata['text_processing'] = {
-                    'corrected_text': '',
-                    'changes': '',
-                    'confidence': 'unknown',
-                    'note': 'Text processing was disabled or failed'
+            has_text_processing = bool(text_section['corrected_text'])
+            if has_text_processing and text_section.get('processing_time'):
+                breakdown['text_processing'] = {
+                    'time': text_section['processing_time'],
+                    'model': text_section['model']
                 }
             
-            # Add translation result if available
-            if translation_result:
-                metadata['translation'] = {
-                    'translated_text': translation_result.get(
-                        'translated_text', ''
-                    ),
-                    'source_language': translation_result.get(
-                        'source_language', ''
-                    ),
-                    'target_language': translation_result.get(
-                        'target_language', ''
-                    ),
-                    'translation_model': translation_result.get(
-                        'translation_model', ''
-                    ),
-                    'model': translation_result.get('model', ''),
-                    'processing_time': translation_result.get('processing_time', 0.0)
-                }
-            else:
-                metadata['translation'] = {
-                    'translated_text': text_processing.get('corrected_text', '') if text_processing else '',
-                    'note': 'Translation was disabled or not needed'
+            if (translation_section['translated_text'] and
+                    translation_section.get('processing_time')):
+                breakdown['translation'] = {
+                    'time': translation_section['processing_time'],
+                    'model': translation_section['model']
                 }
             
-            # Create a unified text section combining all sources
-            metadata['unified_text'] = self._create_unified_text(
-                ocr_data, vl_model_data, text_processing
-            )
-            
-            # Add summary statistics
-            metadata['summary'] = self._create_summary(metadata)
+            summary = {
+                'has_ocr_data': has_ocr_data,
+                'has_vl_model_data': has_vl_model_data,
+                'has_text_processing': has_text_processing,
+                'text_sources_count': text_sources_count,
+                'processing_stages': [
+                    stage for stage, present in (
+                        ('ocr', has_ocr_data),
+                        ('vl_model_data', has_vl_model_data),
+                        ('text_processing', has_text_processing)
+                    ) if present
+                ],
+                'performance': {
+                    'total_time': metadata['processing_time'],
+                    'breakdown': breakdown
+                }
+            }
             
-            self.logger.debug("Successfully combined metadata")
-            return metadata
+            # Add quality indicators
+            if ocr_section.get('avg_confidence'):
+                summary['ocr_avg_confidence'] = ocr_section['avg_confidence']
+            if text_section['confidence']:
+                summary['text_processing_confidence'] = text_section['confidence']
             
+            # Add content indicators
+            primary_text = unified['primary_text']
+            summary['has_extracted_text'] = bool(primary_text)
+            summary['text_length'] = len(primary_text)
         except Exception as e:
             self.logger.error(f"Error combining metadata: {e}", exc_info=True)
             # Return minimal metadata on error
-            return {
-                'image_file': Path(image_path).name,
-                'image_path': str(image_path),
-                'processed_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'processing_time': round(processing_time, 3),
-                'error': str(e)
-            }
+            metadata = self.create_minimal_metadata(
+                image_path, error=str(e), processed_at=processed_at
+            )
+            metadata['processing_time'] = processing_time
+            return metadata
+        
+        metadata['summary'] = summary
+        
+        if self._debug_on:
+            self.logger.debug("Successfully combined metadata")
+        return metadata
+    
+    def combine_metadata_batch(
+        self,
+        records: List[Dict[str, Any]],
+        processed_at: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Combine metadata for several images at once.
+        
+        All images share one processed_at timestamp.
+        
+        Args:
+            records: One dict per image holding combine_metadata keyword
+                arguments (image_path is required; processed_at is not
+                allowed, the batch timestamp is used)
+            processed_at: Timestamp to record (default: now)
+            
+        Returns:
+            Combined metadata dictionaries, in the order of records
+            
+        Raises:
+            ValueError: If a record sets its own processed_at
+        """
+        for record in records:
+            if 'processed_at' in record:
+                raise ValueError(
+                    f"Record for {record.get('image_path')} sets processed_at; "
+                    "pass it to combine_metadata_batch instead"
+                )
+        if processed_at is None:
+            processed_at = now_string()
+        combine = self.combine_metadata
+        return [
+            combine(processed_at=processed_at, **record) for record in records
+        ]
     
     def _create_unified_text(
         self,
@@ -180,146 +313,56 @@ class MetadataCombiner:
         Returns:
             Unified text dictionary
         """
-        unified = {
-            'primary_text': '',
-            'alternative_texts': [],
-            'recommended_source': 'none'
-        }
-        
-        # Determine primary text source based on availability and quality
-        if text_processing and text_processing.get('corrected_text'):
-            unified['primary_text'] = text_processing['corrected_text']
-            unified['recommended_source'] = 'text_processing'
-        elif ocr_data and ocr_data.get('full_text'):
-            unified['primary_text'] = ocr_data['full_text']
-            unified['recommended_source'] = 'ocr'
-        elif vl_model_data and vl_model_data.get('text'):
-            unified['primary_text'] = vl_model_data['text']
-            unified['recommended_source'] = 'vl_model_data'
+        # Fetch each source text once, in order of preference
+        corrected_text = text_processing.get('corrected_text') if text_processing else None
+        ocr_text = ocr_data.get('full_text') if ocr_data else None
+        vl_text = vl_model_data.get('text') if vl_model_data else None
         
-        # Add alternative text sources
-        if (ocr_data and ocr_data.get('full_text') and
-                unified['recommended_source'] != 'ocr'):
-            unified['alternative_texts'].append({
-                'source': 'ocr',
-                'text': ocr_data['full_text']
-            })
+        primary_text = ''
+        recommended_source = 'none'
+        for source, text in (
+            ('text_processing', corrected_text),
+            ('ocr', ocr_text),
+            ('vl_model_data', vl_text)
+        ):
+            if text:
+                primary_text = text
+                recommended_source = source
+                break
         
-        if (vl_model_data and vl_model_data.get('text') and
-                unified['recommended_source'] != 'vl_model_data'):
-            unified['alternative_texts'].append({
-                'source': 'vl_model_data',
-                'text': vl_model_data['text']
-            })
+        # Other sources are listed as alternatives (OCR and vision only)
+        alternative_texts = []
+        if ocr_text and recommended_source != 'ocr':
+            alternative_texts.append({'source': 'ocr', 'text': ocr_text})
+        if vl_text and recommended_source != 'vl_model_data':
+            alternative_texts.append({'source': 'vl_model_data', 'text': vl_text})
         
-        return unified
-    
-    def _create_summary(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Create summary statistics.
-        
-        Args:
-            metadata: Combined metadata
-            
-        Returns:
-            Summary dictionary
-        """
-        summary = {
-            'has_ocr_data': False,
-            'has_vl_model_data': False,
-            'has_text_processing': False,
-            'text_sources_count': 0,
-            'processing_stages': [],
-            'performance': {
-                'total_time': metadata.get('processing_time', 0.0),
-                'breakdown': {}
-            }
+        return {
+            'primary_text': primary_text,
+            'alternative_texts': alternative_texts,
+            'recommended_source': recommended_source
         }
-        
-        # Check what data we have
-        ocr_data = metadata.get('ocr', {})
-        if ocr_data.get('total_elements', 0) > 0:
-            summary['has_ocr_data'] = True
-            summary['text_sources_count'] += 1
-            summary['processing_stages'].append('ocr')
-            # Add OCR performance
-            if ocr_data.get('processing_time'):
-                summary['performance']['breakdown']['ocr'] = {
-                    'time': ocr_data['processing_time'],
-                    'model': ocr_data.get('model', 'PaddleOCR')
-                }
-        
-        vl_model_data = metadata.get('vl_model_data', {})
-        if vl_model_data.get('description') or vl_model_data.get('text'):
-            summary['has_vl_model_data'] = True
-            if vl_model_data.get('text'):
-                summary['text_sources_count'] += 1
-            summary['processing_stages'].append('vl_model_data')
-            # Add VL model performance
-            if vl_model_data.get('processing_time'):
-                summary['performance']['breakdown']['vl_model'] = {
-                    'time': vl_model_data['processing_time'],
-                    'model': vl_model_data.get('model', '')
-                }
-        
-        text_processing = metadata.get('text_processing', {})
-        if text_processing.get('corrected_text'):
-            summary['has_text_processing'] = True
-            summary['processing_stages'].append('text_processing')
-            # Add text processing performance
-            if text_processing.get('processing_time'):
-                summary['performance']['breakdown']['text_processing'] = {
-                    'time': text_processing['processing_time'],
-                    'model': text_processing.get('model', '')
-                }
-        
-        # Add translation performance if available
-        translation = metadata.get('translation', {})
-        if translation.get('translated_text'):
-            if translation.get('processing_time'):
-                summary['performance']['breakdown']['translation'] = {
-                    'time': translation['processing_time'],
-                    'model': translation.get('model', '')
-                }
-        
-        # Add quality indicators
-        if ocr_data.get('avg_confidence'):
-            summary['ocr_avg_confidence'] = ocr_data['avg_confidence']
-        
-        if text_processing.get('confidence'):
-            summary['text_processing_confidence'] = (
-                text_processing['confidence']
-            )
-        
-        # Add content indicators
-        unified_text = metadata.get('unified_text', {})
-        if unified_text.get('primary_text'):
-            summary['has_extracted_text'] = True
-            summary['text_length'] = len(unified_text['primary_text'])
-        else:
-            summary['has_extracted_text'] = False
-            summary['text_length'] = 0
-        
-        return summary
     
     def create_minimal_metadata(
         self,
         image_path: str,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        processed_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create minimal metadata for failed processing.
         
         Args:
             image_path: Path to the image file
             error: Error message if any
+            processed_at: Timestamp to record (default: now)
             
         Returns:
             Minimal metadata dictionary
         """
-        image_file = Path(image_path)
         metadata = {
-            'image_file': image_file.name,
+            'image_file': os.path.basename(image_path),
             'image_path': str(image_path),
-            'processed_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'processed_at': processed_at or now_string(),
             'processing_time': 0.0,
             'status': 'failed'
         }
@@ -339,11 +382,12 @@ class MetadataCombiner:
             True if valid, False otherwise
         """
         try:
-            required_fields = ['image_file', 'image_path', 'processed_at']
-            for field in required_fields:
-                if field not in metadata:
-                    self.logger.warning(f"Missing required field: {field}")
-                    return False
+            missing = _REQUIRED_FIELDS.difference(metadata)
+            if missing:
+                self.logger.warning(
+                    "Missing required fields: %s", ', '.join(sorted(missing))
+                )
+                return False
             
             return True
             
@@ -1,6 +1,7 @@
 """Pipeline state management for image processing with YAML persistence."""
 
 import os
+import json
 import yaml
 import logging
 from pathlib import Path
@@ -8,6 +9,43 @@ from typing import Dict, Any, List, Optional
 from enum import Enum
 from datetime import datetime
 
+import numpy as np
+
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _SafeDumper
+
+
+class YamlDumper(_SafeDumper):
+    """Safe YAML dumper that also writes numpy scalars as plain values.
+
+    OCR engines may hand back numpy scalars (e.g. confidence scores); they
+    are written as their Python equivalents so states load with the safe
+    loader.
+    """
+
+
+YamlDumper.add_multi_representer(
+    np.generic, lambda dumper, value: dumper.represent_data(value.item())
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Supported state file formats and their extensions
+STATE_FILE_EXTENSIONS = {'yaml': '.yml', 'json': '.json'}
+
+
+def _json_default(value):
+    """Serialize numpy scalars/arrays for the stdlib json encoder."""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 class StepStatus(Enum):
     """Pipeline step status enumeration."""
@@ -21,14 +59,21 @@ class StepStatus(Enum):
 class PipelineStateManager:
     """Manages pipeline state persistence in YAML files."""
     
-    def __init__(self, state_file_path: str = None):
+    def __init__(self, state_file_path: str = None,
+                 result_format: str = 'yaml'):
         """Initialize the pipeline state manager.
         
         Args:
             state_file_path: Optional path to save state YAML file
+            result_format: State file format next to each image,
+                'yaml' (<stem>.yml) or 'json' (<stem>.json)
         """
         self.logger = logging.getLogger(__name__)
         self.state_file_path = state_file_path
+        self.result_format = (
+            result_format if result_format in STATE_FILE_EXTENSIONS else 'yaml'
+        )
+        self._state_extension = STATE_FILE_EXTENSIONS[self.result_format]
         
         # Define pipeline steps in order
         self.pipeline_steps = [
@@ -84,7 +129,7 @@ class PipelineStateManager:
         }
     
     def load_state(self, image_path: str) -> Optional[Dict[str, Any]]:
-        """Load state from YAML file for an image.
+        """Load state from the YAML/JSON file for an image.
         
         Args:
             image_path: Path to the image file
@@ -92,22 +137,27 @@ class PipelineStateManager:
         Returns:
             State dictionary or None if file doesn't exist
         """
-        yaml_path = self._get_yaml_path(image_path)
+        state_path = self.get_state_path(image_path)
         
-        if not os.path.exists(yaml_path):
+        if not os.path.exists(state_path):
             return None
         
         try:
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                state = yaml.safe_load(f)
-                self.logger.debug(f"Loaded state from {yaml_path}")
-                return state
+            if self.result_format == 'json':
+                with open(state_path, 'rb') as f:
+                    data = f.read()
+                state = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            else:
+                with open(state_path, 'r', encoding='utf-8') as f:
+                    state = yaml.load(f, Loader=_YamlLoader)
+            self.logger.debug("Loaded state from %s", state_path)
+            return state
         except Exception as e:
-            self.logger.error(f"Error loading state from {yaml_path}: {e}")
+            self.logger.error(f"Error loading state from {state_path}: {e}")
             return None
     
     def save_state(self, image_path: str, state: Dict[str, Any]) -> bool:
-        """Save state to YAML file.
+        """Save state to the YAML/JSON file for an image.
         
         Args:
             image_path: Path to the image file
@@ -116,36 +166,89 @@ class PipelineStateManager:
         Returns:
             True if save was successful, False otherwise
         """
-        yaml_path = self._get_yaml_path(image_path)
+        state_path = self.get_state_path(image_path)
         
         try:
             # Update timestamp
             state['updated_at'] = datetime.now().isoformat()
             
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(yaml_path), exist_ok=True)
+            # Ensure directory exists (normally the image's own folder)
+            state_dir = os.path.dirname(state_path)
+            if not os.path.isdir(state_dir):
+                os.makedirs(state_dir, exist_ok=True)
             
-            with open(yaml_path, 'w', encoding='utf-8') as f:
-                yaml.dump(state, f, default_flow_style=False,
-                          allow_unicode=True, indent=2)
+            if self.result_format == 'json':
+                self._write_json(state_path, state)
+            else:
+                with open(state_path, 'w', encoding='utf-8') as f:
+                    yaml.dump(state, f, Dumper=YamlDumper,
+                              default_flow_style=False,
+                              allow_unicode=True, indent=2)
             
-            self.logger.debug(f"Saved state to {yaml_path}")
+            self.logger.debug("Saved state to %s", state_path)
             return True
         except Exception as e:
-            self.logger.error(f"Error saving state to {yaml_path}: {e}")
+            self.logger.error(f"Error saving state to {state_path}: {e}")
             return False
     
-    def _get_yaml_path(self, image_path: str) -> str:
-        """Get the YAML file path for an image.
+    @staticmethod
+    def _write_json(state_path: str, state: Dict[str, Any]) -> None:
+        """Write state as indented JSON, using orjson when installed."""
+        if ORJSON_AVAILABLE:
+            with open(state_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    state,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            # json.dump writes every encoder chunk separately; with indent
+            # set the encoder is pure Python, so encode first, write once
+            data = json.dumps(state, ensure_ascii=False, indent=2,
+                              default=_json_default)
+            with open(state_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+    
+    def get_state_path(self, image_path: str) -> str:
+        """Get the state file path for an image.
         
         Args:
             image_path: Path to the image file
             
         Returns:
-            Path to the corresponding YAML file
+            Path to the corresponding YAML/JSON file
         """
         image_file = Path(image_path)
-        return str(image_file.parent / f"{image_file.stem}.yml")
+        return str(image_file.parent / f"{image_file.stem}{self._state_extension}")
+    
+    def is_up_to_date(self, image_path: str) -> bool:
+        """Check if an image already has a fully successful result.
+        
+        The state file must be newer than the image (cheap stat check) and
+        record a completed pipeline without failed steps.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            True if the image does not need processing again
+        """
+        try:
+            state_mtime = os.stat(self.get_state_path(image_path)).st_mtime_ns
+            if state_mtime < os.stat(image_path).st_mtime_ns:
+                return False
+        except OSError:
+            return False
+        
+        state = self.load_state(image_path)
+        if not state:
+            return False
+        status = state.get('pipeline_status', {})
+        if status.get('overall_status') != 'completed':
+            return False
+        return not any(
+            step.get('status') == StepStatus.FAILED.value
+            for step in status.get('steps', {}).values()
+        )
     
     def get_step_status(self, state: Dict[str, Any], step: str) -> StepStatus:
         """Get the status of a specific step.
@@ -7,12 +7,14 @@ import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional, TYPE_CHECKING
 
+import numpy as np
+
 from ...config_manager import ConfigManager
 from ...ocr.ocr_processor import OCRProcessor
 from ...llm.vl.image_agent import ImageAgent
 from ...llm.text.text_agent import TextAgent
 from ...llm.translation.translator_agent import TranslatorAgent
-from ..metadata_combiner.metadata_combiner import MetadataCombiner
+from ..metadata_combiner.metadata_combiner import MetadataCombiner, now_string
 from .step_processor import StepProcessor
 from ..pipeline_state_manager import PipelineStateManager
 
@@ -38,7 +40,9 @@ class SingleImageProcessor:
         self.performance_stats = performance_stats
         self.logger = logging.getLogger(__name__)
         self.metadata_combiner = MetadataCombiner()
-        self.state_manager = PipelineStateManager()
+        self.state_manager = PipelineStateManager(
+            result_format=config_manager.get_result_format()
+        )
         self.step_processor = StepProcessor(config_manager, self.state_manager)
         
         # Initialize processors (lazy loading)
@@ -46,6 +50,7 @@ class SingleImageProcessor:
         self._image_agent = None
         self._text_agent = None
         self._translator_agent = None
+        self._ollama_client = None
         
         if self.performance_stats:
             self.logger.info("SingleImageProcessor initialized WITH performance tracking")
@@ -63,12 +68,18 @@ class SingleImageProcessor:
             self._ocr_processor = OCRProcessor(self.config_manager.config)
         return self._ocr_processor
 
+    def _get_ollama_client(self):
+        """Get or create the Ollama client shared by all agents (lazy loading)."""
+        if self._ollama_client is None:
+            from ...llm.ollama_client import OllamaClient
+            self._ollama_client = OllamaClient(self.config_manager.config)
+        return self._ollama_client
+
     def _get_image_agent(self) -> ImageAgent:
         """Get or create image agent instance (lazy loading)."""
         if self._image_agent is None:
             self.logger.info("Initializing Image agent")
-            from ...llm.ollama_client import OllamaClient
-            ollama_client = OllamaClient(self.config_manager.config)
+            ollama_client = self._get_ollama_client()
             self._image_agent = ImageAgent(self.config_manager.config, ollama_client)
         return self._image_agent
 
@@ -76,8 +87,7 @@ class SingleImageProcessor:
         """Get or create text agent instance (lazy loading)."""
         if self._text_agent is None:
             self.logger.info("Initializing Text agent")
-            from ...llm.ollama_client import OllamaClient
-            ollama_client = OllamaClient(self.config_manager.config)
+            ollama_client = self._get_ollama_client()
             self._text_agent = TextAgent(self.config_manager.config, ollama_client)
         return self._text_agent
 
@@ -85,11 +95,46 @@ class SingleImageProcessor:
         """Get or create translator agent instance (lazy loading)."""
         if self._translator_agent is None:
             self.logger.info("Initializing Translator agent")
-            from ...llm.ollama_client import OllamaClient
-            ollama_client = OllamaClient(self.config_manager.config)
+            ollama_client = self._get_ollama_client()
             self._translator_agent = TranslatorAgent(self.config_manager.config, ollama_client)
         return self._translator_agent
 
+    def needs_image_file(self, enable_image_agent: Optional[bool] = None) -> bool:
+        """Check whether processing requires the image to exist on disk.
+
+        Only the image agent step reads the image from a file (to resize and
+        encode it); every other step can work on an in-memory array.
+
+        Args:
+            enable_image_agent: Enable image agent (default: from config)
+
+        Returns:
+            True if the image must be passed as a file path
+        """
+        if enable_image_agent is not None:
+            return enable_image_agent
+        pipeline_config = self.config_manager.config.get('pipeline', {})
+        return pipeline_config.get('enable_image_agent', True)
+
+    def process_image_array(
+        self,
+        image: np.ndarray,
+        image_name: str,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """Process an already decoded image without writing it to disk.
+
+        Args:
+            image: Decoded BGR image
+            image_name: Name reported in the metadata (e.g. uploaded filename)
+            **options: Same options as process_image. The image agent must
+                be disabled, see needs_image_file.
+
+        Returns:
+            Combined metadata dictionary with processing results
+        """
+        return self.process_image(image_path=image_name, image=image, **options)
+
     def process_image(
         self,
         image_path: str,
@@ -98,7 +143,8 @@ class SingleImageProcessor:
         enable_text_agent: Optional[bool] = None,
         enable_translation: Optional[bool] = None,
         vision_model: Optional[str] = None,
-        text_model: Optional[str] = None
+        text_model: Optional[str] = None,
+        image: Optional[np.ndarray] = None
     ) -> Dict[str, Any]:
         """Process a single image through the pipeline.
         
@@ -110,6 +156,7 @@ class SingleImageProcessor:
             enable_translation: Enable translation (default: from config)
             vision_model: Vision model to use (default: from config)
             text_model: Text model to use (default: from config)
+            image: Already decoded image used for OCR instead of reading image_path
             
         Returns:
             Combined metadata dictionary with processing results
@@ -147,7 +194,8 @@ class SingleImageProcessor:
                     step_start = time.perf_counter()
                     ocr_processor = self._get_ocr_processor()
                     success, state = self.step_processor.process_ocr_step(
-                        image_path, state, ocr_processor, skip_if_completed=False
+                        image_path, state, ocr_processor, skip_if_completed=False,
+                        image=image
                     )
                     step_time = time.perf_counter() - step_start
                     
@@ -286,7 +334,7 @@ class SingleImageProcessor:
                 vl_model_data=vl_model_data,
                 text_processing=text_processing,
                 translation_result=translation_result,
-                processing_time=total_time
+                processing_time=round(total_time, 3)
             )
             
             self.logger.info(
@@ -302,7 +350,7 @@ class SingleImageProcessor:
                 'image_file': Path(image_path).name,
                 'image_path': str(image_path),
                 'error': str(e),
-                'processed_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'processed_at': now_string(),
                 'processing_time': time.perf_counter() - start_time,
                 'status': 'failed'
             }
@@ -3,7 +3,7 @@
 import os
 import time
 import logging
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 from pathlib import Path
 
 from ..pipeline_state_manager import PipelineStateManager
@@ -34,7 +34,8 @@ class StepProcessor:
         image_path: str,
         state: Dict[str, Any],
         ocr_processor: OCRProcessor,
-        skip_if_completed: bool = True
+        skip_if_completed: bool = True,
+        image=None
     ) -> Tuple[bool, Dict[str, Any]]:
         """Process OCR step.
 
@@ -43,6 +44,7 @@ class StepProcessor:
             state: Current pipeline state
             ocr_processor: OCR processor instance
             skip_if_completed: Skip if already completed
+            image: Already decoded image (optional, avoids reading image_path)
 
         Returns:
             Tuple of (success, updated_state)
@@ -50,9 +52,9 @@ class StepProcessor:
         step_name = 'ocr_processing'
 
         # Debug: Log entry parameters
-        self.logger.debug(f"[OCR] Entry - image_path: {image_path}")
-        self.logger.debug(f"[OCR] Entry - skip_if_completed: {skip_if_completed}")
-        self.logger.debug(f"[OCR] Entry - state keys: {state.keys() if state else 'None'}")
+        self.logger.debug("[OCR] Entry - image_path: %s", image_path)
+        self.logger.debug("[OCR] Entry - skip_if_completed: %s", skip_if_completed)
+        self.logger.debug("[OCR] Entry - state keys: %s", state.keys() if state else 'None')
         
         # Check if should skip
         if (skip_if_completed and
@@ -64,9 +66,9 @@ class StepProcessor:
             return True, state
 
         # Mark as running
-        self.logger.debug(f"[OCR] Marking step as running")
+        self.logger.debug("[OCR] Marking step as running")
         state = self.state_manager.mark_step_running(state, step_name)
-        self.logger.debug(f"[OCR] State after mark_running: {state.get('steps', {}).get(step_name, {}).get('status')}")
+        self.logger.debug("[OCR] State after mark_running: %s", state.get('steps', {}).get(step_name, {}).get('status'))
 
         try:
             start_time = time.perf_counter()
@@ -75,41 +77,42 @@ class StepProcessor:
             )
 
             # Debug: Check image path exists
-            if not os.path.exists(image_path):
-                raise FileNotFoundError(f"Image file not found: {image_path}")
-            self.logger.debug(f"[OCR] Image file exists: {image_path}")
+            if image is None:
+                if not os.path.exists(image_path):
+                    raise FileNotFoundError(f"Image file not found: {image_path}")
+                self.logger.debug("[OCR] Image file exists: %s", image_path)
 
             # Debug: Get performance config
-            self.logger.debug(f"[OCR] Getting performance config")
+            self.logger.debug("[OCR] Getting performance config")
             perf_config = (
                 self.config_manager.get_performance_config()
             )
-            self.logger.debug(f"[OCR] Performance config: {perf_config}")
+            self.logger.debug("[OCR] Performance config: %s", perf_config)
             
             # Debug: Extract text
-            self.logger.debug(f"[OCR] Calling ocr_processor.extract_text")
+            self.logger.debug("[OCR] Calling ocr_processor.extract_text")
             extracted_data = ocr_processor.extract_text(
-                image_path, perf_config
+                image_path, perf_config, image=image
             )
-            self.logger.debug(f"[OCR] Extracted data type: {type(extracted_data)}")
-            self.logger.debug(f"[OCR] Extracted data: {extracted_data if extracted_data else 'None or empty'}")
+            self.logger.debug("[OCR] Extracted data type: %s", type(extracted_data))
+            self.logger.debug("[OCR] Extracted data: %s", extracted_data if extracted_data else 'None or empty')
             
             # Debug: Format extracted text
-            self.logger.debug(f"[OCR] Calling ocr_processor.format_extracted_text")
+            self.logger.debug("[OCR] Calling ocr_processor.format_extracted_text")
             ocr_data = ocr_processor.format_extracted_text(extracted_data)
-            self.logger.debug(f"[OCR] OCR data type: {type(ocr_data)}")
-            self.logger.debug(f"[OCR] OCR data keys: {ocr_data.keys() if ocr_data else 'None'}")
-            self.logger.debug(f"[OCR] OCR data content: {ocr_data}")
+            self.logger.debug("[OCR] OCR data type: %s", type(ocr_data))
+            self.logger.debug("[OCR] OCR data keys: %s", ocr_data.keys() if ocr_data else 'None')
+            self.logger.debug("[OCR] OCR data content: %s", ocr_data)
 
             duration = time.perf_counter() - start_time
 
             # Debug: Mark as completed
-            self.logger.debug(f"[OCR] Marking step as completed with data")
+            self.logger.debug("[OCR] Marking step as completed with data")
             state = self.state_manager.mark_step_completed(
                 state, step_name, ocr_data, duration
             )
-            self.logger.debug(f"[OCR] State after mark_completed: {state.get('steps', {}).get(step_name, {}).get('status')}")
-            self.logger.debug(f"[OCR] State data present: {bool(state.get('steps', {}).get(step_name, {}).get('data'))}")
+            self.logger.debug("[OCR] State after mark_completed: %s", state.get('steps', {}).get(step_name, {}).get('status'))
+            self.logger.debug("[OCR] State data present: %s", bool(state.get('steps', {}).get(step_name, {}).get('data')))
 
             elements = ocr_data.get('total_elements', 0)
             self.logger.info(
@@ -118,21 +121,101 @@ class StepProcessor:
             )
 
             # Debug: Final return
-            self.logger.debug(f"[OCR] Returning success=True")
+            self.logger.debug("[OCR] Returning success=True")
             return True, state
 
         except Exception as e:
             error_msg = f"{step_name} failed: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
-            self.logger.debug(f"[OCR] Exception type: {type(e).__name__}")
-            self.logger.debug(f"[OCR] Exception details: {e}")
+            self.logger.debug("[OCR] Exception type: %s", type(e).__name__)
+            self.logger.debug("[OCR] Exception details: %s", e)
             state = self.state_manager.mark_step_failed(
                 state, step_name, str(e)
             )
-            self.logger.debug(f"[OCR] State after mark_failed: {state.get('steps', {}).get(step_name, {}).get('status')}")
-            self.logger.debug(f"[OCR] Returning success=False")
+            self.logger.debug("[OCR] State after mark_failed: %s", state.get('steps', {}).get(step_name, {}).get('status'))
+            self.logger.debug("[OCR] Returning success=False")
             return False, state
 
+    def process_ocr_step_batch(
+        self,
+        image_paths: List[str],
+        states: List[Dict[str, Any]],
+        ocr_processor: OCRProcessor,
+        skip_if_completed: bool = True
+    ) -> List[Tuple[bool, Dict[str, Any]]]:
+        """Process the OCR step for several images at once.
+
+        The images needing OCR go to ocr_processor.extract_text_batch, which
+        passes several of them to PaddleOCR per call.
+
+        Args:
+            image_paths: Paths to the images
+            states: Current pipeline state per image
+            ocr_processor: OCR processor instance
+            skip_if_completed: Skip images whose step is already completed
+
+        Returns:
+            List of (success, updated_state) tuples, one per image
+        """
+        step_name = 'ocr_processing'
+        results: List[Optional[Tuple[bool, Dict[str, Any]]]] = (
+            [None] * len(image_paths)
+        )
+        pending = []
+
+        for index, state in enumerate(states):
+            if (skip_if_completed and
+                    self.state_manager.is_step_completed(state, step_name)):
+                self.logger.info(f"Skipping {step_name} - already completed")
+                self.state_manager.mark_step_skipped(
+                    state, step_name, "Already completed"
+                )
+                results[index] = (True, state)
+            else:
+                states[index] = self.state_manager.mark_step_running(
+                    state, step_name
+                )
+                pending.append(index)
+
+        if pending:
+            self.logger.info(
+                f"Starting {step_name} for {len(pending)} images"
+            )
+            start_time = time.perf_counter()
+            try:
+                extracted = ocr_processor.extract_text_batch(
+                    [image_paths[index] for index in pending]
+                )
+                error = "Image could not be loaded"
+            except Exception as e:
+                self.logger.error(f"{step_name} failed: {str(e)}", exc_info=True)
+                extracted = [None] * len(pending)
+                error = str(e)
+            # One PaddleOCR call covers several images; split the time evenly
+            duration = (time.perf_counter() - start_time) / len(pending)
+
+            for index, extracted_data in zip(pending, extracted):
+                if extracted_data is None:
+                    states[index] = self.state_manager.mark_step_failed(
+                        states[index], step_name, error
+                    )
+                    results[index] = (False, states[index])
+                    continue
+                ocr_data = ocr_processor.format_extracted_text(
+                    extracted_data, processing_time=duration
+                )
+                states[index] = self.state_manager.mark_step_completed(
+                    states[index], step_name, ocr_data, duration
+                )
+                results[index] = (True, states[index])
+
+            self.logger.info(
+                f"{step_name} completed for {len(pending)} images "
+                f"in {duration * len(pending):.2f}s"
+            )
+
+        return results
+
     def process_image_agent_step(
         self,
         image_path: str,
@@ -167,31 +250,28 @@ class StepProcessor:
         # Mark as running
         state = self.state_manager.mark_step_running(state, step_name)
 
-        resized_temp_path = None
         try:
             start_time = time.perf_counter()
             self.logger.info(
                 f"Starting {step_name} for {Path(image_path).name}"
             )
 
-            # Resize image if needed
+            # Resize image if needed; the resized image is encoded in
+            # memory and sent without a temporary file
+            resized_bytes = None
             if resize_spec and resize_spec.get('enabled', True):
                 try:
-                    resized_temp_path = self._resize_image(
+                    resized_bytes = self._resize_image(
                         image_path, resize_spec
                     )
-                    if resized_temp_path:
+                    if resized_bytes:
                         self.logger.debug(
-                            f"Resized image at: {resized_temp_path}"
+                            "Resized image to %d bytes", len(resized_bytes)
                         )
                 except Exception as e:
                     self.logger.warning(
                         f"Resize failed, using original: {e}"
                     )
-
-
-            # Use resized or original image
-            image_to_send = resized_temp_path or image_path
             
             # Extract OCR text if available
             ocr_text = None
@@ -200,7 +280,13 @@ class StepProcessor:
                 if ocr_text:
                     self.logger.info(f"Adding OCR text context ({len(ocr_text)} chars) to image analysis prompt")
             
-            vl_model_data = image_agent.analyze_image(image_to_send, ocr_text)
+            # Use resized or original image
+            if resized_bytes:
+                vl_model_data = image_agent.analyze_image_bytes(
+                    resized_bytes, ocr_text, image_path
+                )
+            else:
+                vl_model_data = image_agent.analyze_image(image_path, ocr_text)
 
             if not vl_model_data:
                 raise Exception("Image agent returned no results")
@@ -226,16 +312,6 @@ class StepProcessor:
             )
             return False, state
 
-        finally:
-            # Cleanup resized image
-            if resized_temp_path and os.path.exists(resized_temp_path):
-                try:
-                    os.remove(resized_temp_path)
-                except Exception:
-                    self.logger.debug(
-                        f"Failed to remove temp: {resized_temp_path}"
-                    )
-
     def process_text_agent_step(
         self,
         image_path: str,
@@ -322,6 +398,104 @@ class StepProcessor:
             )
             return False, state
 
+    def process_text_agent_step_batch(
+        self,
+        image_paths: List[str],
+        states: List[Dict[str, Any]],
+        text_agent: TextAgent,
+        skip_if_completed: bool = True
+    ) -> List[Tuple[bool, Dict[str, Any]]]:
+        """Process the text agent step for several images at once.
+
+        The texts needing correction go to text_agent.process_texts, which
+        corrects several of them per LLM request.
+
+        Args:
+            image_paths: Paths to the images
+            states: Current pipeline state per image
+            text_agent: Text agent instance
+            skip_if_completed: Skip images whose step is already completed
+
+        Returns:
+            List of (success, updated_state) tuples, one per image
+        """
+        step_name = 'text_agent_processing'
+        results: List[Optional[Tuple[bool, Dict[str, Any]]]] = (
+            [None] * len(image_paths)
+        )
+        pending = []
+        texts = []
+        vl_datas = []
+
+        for index, state in enumerate(states):
+            if (skip_if_completed and
+                    self.state_manager.is_step_completed(state, step_name)):
+                self.logger.info(f"Skipping {step_name} - already completed")
+                self.state_manager.mark_step_skipped(
+                    state, step_name, "Already completed"
+                )
+                results[index] = (True, state)
+                continue
+
+            # Prepare text input, as in process_text_agent_step
+            ocr_data = state['results'].get('ocr_data')
+            vl_model_data = state['results'].get('vl_model_data')
+            ocr_text = ocr_data.get('full_text', '') if ocr_data else ''
+            vision_text = (
+                vl_model_data.get('text', '')
+                if vl_model_data else ''
+            )
+            base_text = ocr_text or vision_text
+
+            if not base_text:
+                self.logger.info(f"No text available for {step_name}")
+                state = self.state_manager.mark_step_skipped(
+                    state, step_name, "No text available"
+                )
+                results[index] = (True, state)
+                continue
+
+            states[index] = self.state_manager.mark_step_running(
+                state, step_name
+            )
+            pending.append(index)
+            texts.append(base_text)
+            vl_datas.append(vl_model_data)
+
+        if pending:
+            self.logger.info(
+                f"Starting {step_name} for {len(pending)} images"
+            )
+            start_time = time.perf_counter()
+            try:
+                processed = text_agent.process_texts(texts, vl_datas)
+                error = "Text agent returned no results"
+            except Exception as e:
+                self.logger.error(f"{step_name} failed: {str(e)}")
+                processed = [None] * len(pending)
+                error = str(e)
+            # Requests are shared between images; split the time evenly
+            duration = (time.perf_counter() - start_time) / len(pending)
+
+            for index, text_processing in zip(pending, processed):
+                if text_processing:
+                    states[index] = self.state_manager.mark_step_completed(
+                        states[index], step_name, text_processing, duration
+                    )
+                    results[index] = (True, states[index])
+                else:
+                    states[index] = self.state_manager.mark_step_failed(
+                        states[index], step_name, error
+                    )
+                    results[index] = (False, states[index])
+
+            self.logger.info(
+                f"{step_name} completed for {len(pending)} images "
+                f"in {duration * len(pending):.2f}s"
+            )
+
+        return results
+
     def process_translation_step(
         self,
         image_path: str,
@@ -419,7 +593,8 @@ class StepProcessor:
         image_path: str,
         state: Dict[str, Any],
         metadata_combiner,
-        skip_if_completed: bool = True
+        skip_if_completed: bool = True,
+        processed_at: Optional[str] = None
     ) -> Tuple[bool, Dict[str, Any]]:
         """Process metadata combination step.
 
@@ -428,6 +603,7 @@ class StepProcessor:
             state: Current pipeline state
             metadata_combiner: Metadata combiner instance
             skip_if_completed: Skip if already completed
+            processed_at: Timestamp to record (default: now)
 
         Returns:
             Tuple of (success, updated_state)
@@ -468,7 +644,8 @@ class StepProcessor:
                 vl_model_data=vl_model_data,
                 text_processing=text_processing,
                 translation_result=translation_result,
-                processing_time=proc_time
+                processing_time=proc_time,
+                processed_at=processed_at
             )
 
             duration = time.perf_counter() - start_time
@@ -492,9 +669,72 @@ class StepProcessor:
             )
             return False, state
 
+    def process_metadata_combination_step_batch(
+        self,
+        image_paths: List[str],
+        states: List[Dict[str, Any]],
+        metadata_combiner,
+        processed_at: Optional[str] = None
+    ) -> List[Tuple[bool, Dict[str, Any]]]:
+        """Process the metadata combination step for several images at once.
+
+        Like process_metadata_combination_step, the step always runs; the
+        images share one metadata_combiner.combine_metadata_batch call and
+        one processed_at timestamp.
+
+        Args:
+            image_paths: Paths to the images
+            states: Current pipeline state per image
+            metadata_combiner: Metadata combiner instance
+            processed_at: Timestamp to record (default: now)
+
+        Returns:
+            List of (success, updated_state) tuples, one per image
+        """
+        step_name = 'metadata_combination'
+        start_time = time.perf_counter()
+
+        records = []
+        for index, (image_path, state) in enumerate(zip(image_paths, states)):
+            states[index] = state = self.state_manager.mark_step_running(
+                state, step_name
+            )
+            results = state['results']
+            records.append({
+                'image_path': image_path,
+                'ocr_data': results.get('ocr_data'),
+                'vl_model_data': results.get('vl_model_data'),
+                'text_processing': results.get('text_processing'),
+                'translation_result': results.get('translation_result'),
+                'processing_time': (
+                    state['metadata']['total_processing_time']
+                )
+            })
+
+        try:
+            combined = metadata_combiner.combine_metadata_batch(
+                records, processed_at=processed_at
+            )
+        except Exception as e:
+            self.logger.error(f"{step_name} failed: {str(e)}")
+            return [
+                (False, self.state_manager.mark_step_failed(
+                    state, step_name, str(e)
+                ))
+                for state in states
+            ]
+
+        duration = (time.perf_counter() - start_time) / len(image_paths)
+        return [
+            (True, self.state_manager.mark_step_completed(
+                state, step_name, combined_metadata, duration
+            ))
+            for state, combined_metadata in zip(states, combined)
+        ]
+
     def _resize_image(
         self, image_path: str, spec: Dict[str, Any]
-    ) -> Optional[str]:
+    ) -> Optional[bytes]:
         """Resize image according to specification.
 
         Args:
@@ -502,10 +742,10 @@ class StepProcessor:
             spec: Resize specification
 
         Returns:
-            Path to resized image or None
+            Resized image encoded in the original file format, or None if
+            no resize was needed or possible
         """
         import cv2
-        import tempfile
 
         max_size = spec.get('max_size', [1024, 1024])
         keep_aspect = spec.get('keep_aspect', True)
@@ -542,25 +782,19 @@ class StepProcessor:
 
             resized = cv2.resize(img, (new_w, new_h), interpolation=interp)
 
-            # Write to temporary file
-            suffix = Path(image_path).suffix
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-            tmp_path = tmp.name
-            tmp.close()
-
-            # Save with quality settings
-            perf_conf = self.config_manager.get_performance_config()
-            quality = int(perf_conf.get('resize_quality', 85))
-            if suffix.lower() in ['.jpg', '.jpeg']:
-                cv2.imwrite(
-                    tmp_path, resized,
-                    [int(cv2.IMWRITE_JPEG_QUALITY), quality]
-                )
-            else:
-                cv2.imwrite(tmp_path, resized)
+            # Encode in memory with quality settings
+            suffix = Path(image_path).suffix.lower()
+            params = []
+            if suffix in ['.jpg', '.jpeg']:
+                perf_conf = self.config_manager.get_performance_config()
+                quality = int(perf_conf.get('resize_quality', 85))
+                params = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
+            ok, encoded = cv2.imencode(suffix, resized, params)
+            if not ok:
+                return None
 
-            return tmp_path
+            return encoded.tobytes()
 
         except Exception as e:
-            self.logger.debug(f"Resize error: {e}")
+            self.logger.debug("Resize error: %s", e)
             return None
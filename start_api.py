@@ -31,7 +31,7 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
-    # Note: logging will be configured by run_server -> ConfigManager
+    # Note: logging will be configured by run_server
     # These initial messages use print for startup visibility
     print("=" * 60)
     print("Caption Extractor API Server")
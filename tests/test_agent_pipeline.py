@@ -0,0 +1,74 @@
+"""Tests for AgentPipeline."""
+
+import asyncio
+import random
+import unittest
+import os
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from caption_extractor.llm.agent_pipeline import AgentPipeline
+
+
+class FakeClient:
+    num_parallel = 2
+    closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeImageAgent:
+    async def aanalyze_image(self, image_path, ocr_text=None):
+        await asyncio.sleep(random.random() / 100)
+        return {'description': f"image {image_path}"}
+
+
+class FakeTextAgent:
+    async def aprocess_text(self, ocr_text, vl_model_data=None):
+        await asyncio.sleep(random.random() / 100)
+        return {
+            'primary_text': ocr_text.upper(),
+            'needTranslation': ocr_text.startswith('hola'),
+            'language_code': 'es',
+            'context': vl_model_data['description']
+        }
+
+
+class FakeTranslatorAgent:
+    async def atranslate_to_english(self, text, source_lang_code=None):
+        return {'translated_text': f"translated {text}"}
+
+
+class TestAgentPipeline(unittest.TestCase):
+    """Test cases for AgentPipeline.run."""
+
+    def test_results_keep_input_order(self):
+        """Test that every stage runs and results come back in input order."""
+        pipeline = AgentPipeline(
+            FakeClient(), FakeImageAgent(), FakeTextAgent(),
+            FakeTranslatorAgent(), workers_per_stage=3
+        )
+        items = [(f"{i}.jpg", f"hola {i}" if i % 2 else f"hi {i}") for i in range(10)]
+        results = asyncio.run(pipeline.run(items))
+
+        self.assertEqual([r['image_path'] for r in results], [i[0] for i in items])
+        self.assertEqual(results[4]['text_processing']['context'], 'image 4.jpg')
+        self.assertIsNone(results[4]['translation_result'])
+        self.assertEqual(
+            results[3]['translation_result']['translated_text'], 'translated HOLA 3'
+        )
+
+    def test_client_closed_after_run(self):
+        """Test that the client's async connections are closed when run ends."""
+        client = FakeClient()
+        pipeline = AgentPipeline(client, FakeImageAgent())
+        asyncio.run(pipeline.run([('a.jpg', None)]))
+
+        self.assertTrue(client.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
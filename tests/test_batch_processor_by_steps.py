@@ -0,0 +1,160 @@
+"""Tests for BatchProcessorBySteps class."""
+
+import os
+import shutil
+import tempfile
+import unittest
+import yaml
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from caption_extractor.config_manager import ConfigManager
+from caption_extractor.pipeline.batch_processor.batch_processor_by_steps import (
+    BatchProcessorBySteps
+)
+
+
+class FakeTextAgent:
+    """Text agent stand-in recording process_texts calls."""
+    
+    batch_size = 8
+    
+    def __init__(self):
+        self.calls = []
+    
+    def process_texts(self, ocr_texts, vl_datas=None):
+        self.calls.append(list(ocr_texts))
+        return [
+            None if text == 'bad' else {'corrected_text': text.upper()}
+            for text in ocr_texts
+        ]
+
+
+class FakeOCRProcessor:
+    """Batch-capable OCR processor stand-in recording extract_text_batch calls."""
+    
+    supports_batch_ocr = True
+    
+    def __init__(self):
+        self.calls = []
+    
+    def extract_text_batch(self, image_paths):
+        self.calls.append(list(image_paths))
+        return [
+            None if path.endswith('missing.jpg') else [{'text': os.path.basename(path)}]
+            for path in image_paths
+        ]
+    
+    def format_extracted_text(self, extracted_data, processing_time=None):
+        return {
+            'full_text': extracted_data[0]['text'],
+            'total_elements': 1,
+            'processing_time': processing_time
+        }
+
+
+class TestBatchProcessorBySteps(unittest.TestCase):
+    """Test cases for BatchProcessorBySteps."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.temp_dir, 'test_config.yml')
+        test_config = {
+            'logging': {'level': 'INFO', 'format': '%(message)s', 'file': 'test.log'},
+            'data': {'input_folder': self.temp_dir, 'supported_formats': ['.jpg']},
+            'pipeline': {
+                'enable_ocr': False,
+                'enable_image_agent': False,
+                'enable_text_agent': True
+            },
+            'batch_processing': {'num_threads_per_step': 2, 'show_progress': False}
+        }
+        with open(self.config_file, 'w') as f:
+            yaml.dump(test_config, f)
+        
+        self.text_agent = FakeTextAgent()
+        self.processor = BatchProcessorBySteps(
+            ConfigManager(self.config_file), text_agent=self.text_agent
+        )
+        
+        # Images with completed OCR results
+        state_manager = self.processor.state_manager
+        self.image_files = []
+        for name, text in (('a.jpg', 'hello'), ('b.jpg', 'bad'), ('c.jpg', '')):
+            image_path = os.path.join(self.temp_dir, name)
+            with open(image_path, 'w') as f:
+                f.write('test content')
+            state = state_manager.create_initial_state(image_path)
+            state_manager.mark_step_completed(
+                state, 'ocr_processing', {'full_text': text}
+            )
+            state_manager.save_state(image_path, state)
+            self.image_files.append(image_path)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_text_step_batches_texts(self):
+        """Test that the text step corrects all texts with one process_texts call."""
+        report = self.processor.process_images_batch_by_steps(self.image_files)
+        
+        self.assertEqual(self.text_agent.calls, [['hello', 'bad']])
+        text_step = [s for s in report['steps'] if s['step'] == 'text_agent'][0]
+        self.assertEqual(
+            (text_step['successful'], text_step['failed'], text_step['skipped']),
+            (1, 1, 1)
+        )
+        state = self.processor.state_manager.load_state(self.image_files[0])
+        self.assertEqual(
+            state['results']['text_processing']['corrected_text'], 'HELLO'
+        )
+    
+    def test_metadata_step_shares_timestamp(self):
+        """Test that the metadata step stamps every image alike and completes it."""
+        self.processor.process_images_batch_by_steps(self.image_files)
+        
+        states = [
+            self.processor.state_manager.load_state(image_path)
+            for image_path in self.image_files
+        ]
+        processed_at = {
+            state['results']['combined_metadata']['processed_at']
+            for state in states
+        }
+        self.assertEqual(len(processed_at), 1)
+        for state in states:
+            self.assertEqual(
+                state['pipeline_status']['overall_status'], 'completed'
+            )
+
+    
+    def test_ocr_step_batches_images(self):
+        """Test that a batch-capable OCR engine gets the images in one call."""
+        ocr_dir = os.path.join(self.temp_dir, 'ocr')
+        os.makedirs(ocr_dir)
+        image_files = []
+        for name in ('x.jpg', 'missing.jpg', 'y.jpg'):
+            image_path = os.path.join(ocr_dir, name)
+            with open(image_path, 'w') as f:
+                f.write('test content')
+            image_files.append(image_path)
+        ocr_processor = FakeOCRProcessor()
+        self.processor.ocr_processor = ocr_processor
+        self.processor.enable_ocr = True
+        self.processor.enable_text_agent = False
+        
+        report = self.processor.process_images_batch_by_steps(image_files)
+        
+        self.assertEqual(ocr_processor.calls, [image_files])
+        ocr_step = [s for s in report['steps'] if s['step'] == 'ocr'][0]
+        self.assertEqual((ocr_step['successful'], ocr_step['failed']), (2, 1))
+        state = self.processor.state_manager.load_state(image_files[2])
+        self.assertEqual(state['results']['ocr_data']['full_text'], 'y.jpg')
+
+
+if __name__ == '__main__':
+    unittest.main()
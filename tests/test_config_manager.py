@@ -10,7 +10,7 @@ from pathlib import Path
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from caption_extractor.config_manager import ConfigManager
+from caption_extractor.config_manager import ConfigManager, load_config_file
 
 
 class TestConfigManager(unittest.TestCase):
@@ -78,6 +78,56 @@ class TestConfigManager(unittest.TestCase):
         self.assertIn('model_dir', ocr_config)
         self.assertEqual(ocr_config['use_gpu'], False)
     
+    def test_get_warmup_config_defaults(self):
+        """Test warmup configuration defaults when not configured."""
+        config_manager = ConfigManager(self.config_file)
+        warmup = config_manager.get_warmup_config()
+        self.assertTrue(warmup['enabled'])
+        self.assertEqual(warmup['iterations'], 1)
+
+    def test_logging_handlers_not_duplicated(self):
+        """Test that repeated initialization does not stack log handlers."""
+        import logging
+        import logging.handlers
+        from caption_extractor import logging_config
+
+        def handler_types():
+            root_types = [type(h) for h in logging.getLogger().handlers]
+            listener = logging_config._queue_listener
+            listener_types = [type(h) for h in listener.handlers] if listener else []
+            return root_types, listener_types
+
+        ConfigManager(self.config_file)
+        first = handler_types()
+        ConfigManager(self.config_file)
+        ConfigManager(self.config_file)
+        repeated = handler_types()
+
+        for types in repeated:
+            self.assertEqual(len(types), len(set(types)))
+        self.assertEqual([len(t) for t in repeated], [len(t) for t in first])
+
+        # One queue handler on the root logger feeding one file output and
+        # one console handler
+        root_types, listener_types = repeated
+        self.assertEqual(root_types, [logging.handlers.QueueHandler])
+        self.assertEqual(len(listener_types), 2)
+        self.assertIn(logging_config.TimedMemoryHandler, listener_types)
+        self.assertIn(logging.StreamHandler, listener_types)
+
+    def test_load_config_file_returns_independent_copies(self):
+        """Test that cached config parses are not shared between callers."""
+        first = load_config_file(self.config_file)
+        first['processing']['num_threads'] = 99
+        second = load_config_file(self.config_file)
+        self.assertEqual(second['processing']['num_threads'], 2)
+
+    def test_cli_override_visible_to_getters(self):
+        """Test that overriding config entries after init is reflected."""
+        config_manager = ConfigManager(self.config_file)
+        config_manager.config['processing']['num_threads'] = 8
+        self.assertEqual(config_manager.get_num_threads(), 8)
+
     def test_missing_config_file(self):
         """Test handling of missing configuration file."""
         with self.assertRaises(FileNotFoundError):
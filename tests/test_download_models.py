@@ -0,0 +1,49 @@
+"""Tests for the model index in download_models."""
+
+import unittest
+import tempfile
+import os
+import shutil
+
+# Add the repository root to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from download_models import read_model_index, write_model_index
+
+
+class TestModelIndex(unittest.TestCase):
+    """Test cases for the model index sidecar."""
+    
+    def setUp(self):
+        """Set up a cache directory with one model in a subdirectory."""
+        self.cache_dir = tempfile.mkdtemp()
+        model_dir = os.path.join(self.cache_dir, 'en_PP-OCRv3_det_infer')
+        os.makedirs(model_dir)
+        self.model_file = os.path.join(model_dir, 'inference.pdparams')
+        with open(self.model_file, 'w') as f:
+            f.write('weights')
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+    
+    def test_index_current_after_write(self):
+        """Test that a freshly written index is read back."""
+        write_model_index(self.cache_dir)
+        
+        index = read_model_index(self.cache_dir)
+        
+        self.assertEqual(index['files'], [self.model_file])
+        self.assertEqual(index['count'], 1)
+    
+    def test_index_stale_when_nested_model_removed(self):
+        """Test that deleting a model inside a subdirectory invalidates the index."""
+        write_model_index(self.cache_dir)
+        os.remove(self.model_file)
+        
+        self.assertIsNone(read_model_index(self.cache_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -172,6 +172,77 @@ class TestImageProcessor(unittest.TestCase):
         self.assertEqual(len(stats['processing_times']), 2)
         self.assertEqual(len(stats['errors']), 1)
     
+    def test_process_images_batch_keeps_results_when_image_raises(self):
+        """Test that an image raising fails only itself, not its chunk."""
+        image_files = self.image_processor.get_image_files(self.test_images_dir)
+        failing = image_files[0]
+        
+        def process_single_image(image_path, image=None):
+            if image_path == failing:
+                raise RuntimeError("image exploded")
+            return (image_path, True, 0.1, {})
+        
+        with patch.object(self.image_processor, 'filter_pending', side_effect=lambda files: files), \
+                patch.object(self.config_manager, 'get_batch_size', return_value=len(image_files)), \
+                patch.object(self.image_processor, 'process_single_image', side_effect=process_single_image):
+            report = self.image_processor.process_images_batch(image_files)
+        
+        errors = self.image_processor.processing_stats['errors']
+        self.assertEqual(report['summary']['processed_images'], len(image_files))
+        self.assertEqual(report['summary']['successful_images'], len(image_files) - 1)
+        self.assertEqual(
+            [(error['image'], error['error']) for error in errors],
+            [(failing, 'image exploded')]
+        )
+    
+    def test_duplicates_counted_apart_from_timings(self):
+        """Test that duplicate images do not enter the timing statistics."""
+        # All test files share the same contents
+        image_files = self.image_processor.get_image_files(self.test_images_dir)
+        
+        with patch.object(self.image_processor, 'filter_pending', side_effect=lambda files: files), \
+                patch.object(self.config_manager, 'is_dedupe_enabled', return_value=True), \
+                patch.object(self.image_processor, '_copy_state', return_value=True), \
+                patch.object(self.image_processor, 'process_single_image',
+                             side_effect=lambda path, image=None: (path, True, 0.5, {})):
+            report = self.image_processor.process_images_batch(image_files)
+        
+        summary = report['summary']
+        self.assertEqual(summary['duplicate_images'], len(image_files) - 1)
+        self.assertEqual(summary['processed_images'], len(image_files))
+        self.assertEqual(summary['successful_images'], len(image_files))
+        self.assertEqual(len(self.image_processor.processing_stats['processing_times']), 1)
+        self.assertEqual(report['timing']['min_time'], 0.5)
+        self.assertEqual(report['timing']['average_time_per_image'], 0.5)
+    
+    def test_filter_pending_keeps_order(self):
+        """Test that only images with a completed, newer result are dropped."""
+        image_files = self.image_processor.get_image_files(self.test_images_dir)
+        state_manager = self.image_processor.state_manager
+        done = image_files[1]
+        state = state_manager.create_initial_state(done)
+        state_manager.save_state(done, state_manager.mark_pipeline_completed(state))
+        
+        pending = self.image_processor.filter_pending(image_files)
+        
+        self.assertEqual(pending, [path for path in image_files if path != done])
+    
+    def test_make_chunks_follows_schedule(self):
+        """Test that only the lpt schedule reorders images by file size."""
+        largest = os.path.join(self.test_images_dir, 'image3.JPG')
+        with open(largest, 'w') as f:
+            f.write('much larger test content')
+        image_files = self.image_processor.get_image_files(self.test_images_dir)
+        
+        with patch.object(self.config_manager, 'get_schedule', return_value='alpha'):
+            chunks = self.image_processor._make_chunks(image_files, 2)
+        self.assertEqual(chunks, [image_files[:2], image_files[2:]])
+        
+        with patch.object(self.config_manager, 'get_schedule', return_value='lpt'):
+            chunks = self.image_processor._make_chunks(image_files, 2)
+        self.assertEqual(chunks[0][0], largest)
+        self.assertEqual(sorted(sum(chunks, [])), image_files)
+    
     def test_save_result_to_yaml(self):
         """Test saving result to YAML file."""
         test_image = os.path.join(self.test_images_dir, 'test_save.jpg')
@@ -0,0 +1,51 @@
+"""Tests for logging configuration helpers."""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from caption_extractor.logging_config import BufferedFileHandler, TimedMemoryHandler
+
+
+class TestTimedMemoryHandler(unittest.TestCase):
+    """Test cases for TimedMemoryHandler."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, 'test.log')
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_idle_buffer_flushed_after_interval(self):
+        """Test that a lone buffered record is written once flush_interval passes."""
+        target = BufferedFileHandler(self.log_file)
+        handler = TimedMemoryHandler(
+            capacity=1024, target=target, flush_interval=0.2
+        )
+        try:
+            record = logging.LogRecord(
+                'test', logging.INFO, __file__, 1, 'buffered message', None, None
+            )
+            handler.handle(record)
+            self.assertEqual(os.path.getsize(self.log_file), 0)
+
+            time.sleep(0.6)
+            with open(self.log_file, encoding='utf-8') as f:
+                self.assertIn('buffered message', f.read())
+        finally:
+            handler.close()
+            target.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Tests for MetadataCombiner class."""
+
+import unittest
+import os
+import yaml
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from caption_extractor.pipeline.metadata_combiner.metadata_combiner import MetadataCombiner
+
+
+class TestMetadataCombiner(unittest.TestCase):
+    """Test cases for MetadataCombiner."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.combiner = MetadataCombiner()
+    
+    def test_disabled_sections_not_shared(self):
+        """Test that records for disabled stages do not share section objects."""
+        first, second = self.combiner.combine_metadata_batch(
+            [{'image_path': 'a.jpg'}, {'image_path': 'b.jpg'}]
+        )
+        
+        first['ocr']['text_lines'].append({'text': 'edited'})
+        first['vl_model_data']['description'] = 'edited'
+        first['text_processing']['corrected_text'] = 'edited'
+        first['translation']['translated_text'] = 'edited'
+        
+        third = self.combiner.combine_metadata('c.jpg')
+        for record in (second, third):
+            self.assertEqual(record['ocr']['text_lines'], [])
+            self.assertEqual(record['vl_model_data']['description'], '')
+            self.assertEqual(record['text_processing']['corrected_text'], '')
+            self.assertEqual(record['translation']['translated_text'], '')
+    
+    def test_yaml_dump_has_no_anchors(self):
+        """Test that several records dumped in one YAML document use no aliases."""
+        records = self.combiner.combine_metadata_batch(
+            [{'image_path': 'a.jpg'}, {'image_path': 'b.jpg'}]
+        )
+        
+        dumped = yaml.dump(records)
+        
+        self.assertNotIn('&id', dumped)
+        self.assertNotIn('*id', dumped)
+    
+    def test_batch_rejects_record_processed_at(self):
+        """Test that a record cannot override the batch timestamp."""
+        with self.assertRaises(ValueError):
+            self.combiner.combine_metadata_batch(
+                [{'image_path': 'a.jpg', 'processed_at': '2024-01-01 00:00:00'}]
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
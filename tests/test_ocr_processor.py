@@ -0,0 +1,92 @@
+"""Tests for OCRProcessor class."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import cv2
+import numpy as np
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from caption_extractor.ocr.ocr_processor import OCRProcessor
+
+
+class TestExtractTextBatch(unittest.TestCase):
+    """Test cases for OCRProcessor.extract_text_batch."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_paths = []
+        for name in ('a.png', 'b.png'):
+            path = os.path.join(self.temp_dir, name)
+            cv2.imwrite(path, np.full((40, 80, 3), 255, dtype=np.uint8))
+            self.image_paths.append(path)
+        
+        with patch.object(OCRProcessor, '_init_paddleocr'):
+            self.processor = OCRProcessor({})
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_none_result_means_no_text(self):
+        """Test that a None result for one image gives it no text without failing the batch."""
+        result = {
+            'rec_texts': ['hello'],
+            'rec_scores': [0.9],
+            'dt_polys': [[[0, 0], [10, 0], [10, 10], [0, 10]]]
+        }
+        self.processor.ocr_engine = Mock(spec=['ocr', 'predict'])
+        self.processor.ocr_engine.ocr.return_value = [result, None]
+        
+        extracted = self.processor.extract_text_batch(self.image_paths)
+        
+        self.assertEqual(extracted[0][0]['text'], 'hello')
+        self.assertEqual(extracted[1], [])
+    
+    def test_empty_result_means_no_text(self):
+        """Test that an empty result from PaddleOCR 2.x gives no text."""
+        self.processor.ocr_engine = Mock(spec=['ocr'])
+        self.processor.ocr_engine.ocr.return_value = None
+        
+        extracted = self.processor.extract_text_batch(self.image_paths)
+        
+        self.assertEqual(extracted, [[], []])
+
+    
+    def test_results_in_input_order_with_none_for_unreadable(self):
+        """Test that results follow input order and unreadable images give None."""
+        tall = os.path.join(self.temp_dir, 'tall.png')
+        cv2.imwrite(tall, np.full((80, 40, 3), 255, dtype=np.uint8))
+        missing = os.path.join(self.temp_dir, 'missing.png')
+        
+        def ocr(images):
+            # Name each result after its image width
+            return [
+                {
+                    'rec_texts': [f"w{image.shape[1]}"],
+                    'rec_scores': [0.9],
+                    'dt_polys': [[[0, 0], [10, 0], [10, 10], [0, 10]]]
+                }
+                for image in images
+            ]
+        self.processor.ocr_engine = Mock(spec=['ocr', 'predict'])
+        self.processor.ocr_engine.ocr.side_effect = ocr
+        
+        extracted = self.processor.extract_text_batch(
+            [self.image_paths[0], missing, tall]
+        )
+        
+        self.assertEqual(extracted[0][0]['text'], 'w80')
+        self.assertIsNone(extracted[1])
+        self.assertEqual(extracted[2][0]['text'], 'w40')
+
+
+if __name__ == '__main__':
+    unittest.main()
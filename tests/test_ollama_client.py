@@ -0,0 +1,41 @@
+"""Tests for OllamaClient."""
+
+import asyncio
+import unittest
+import os
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from caption_extractor.llm import ollama_client
+from caption_extractor.llm.ollama_client import OllamaClient
+
+
+@unittest.skipUnless(ollama_client.HTTPX_AVAILABLE, "httpx not installed")
+class TestAsyncClient(unittest.TestCase):
+    """Test cases for the async HTTP client lifecycle."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Nothing listens here, so the startup connection check fails fast
+        self.client = OllamaClient({'ollama': {'host': 'http://127.0.0.1:9'}})
+
+    def test_stale_client_closed_on_new_loop(self):
+        """Test that a client from an earlier event loop is closed when replaced."""
+        first = asyncio.run(self.client._get_async_client())
+
+        async def second_loop():
+            async with self.client:
+                return await self.client._get_async_client()
+
+        second = asyncio.run(second_loop())
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.is_closed)
+        self.assertTrue(second.is_closed)
+        self.assertIsNone(self.client._async_client)
+
+
+if __name__ == '__main__':
+    unittest.main()
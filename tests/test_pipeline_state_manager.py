@@ -0,0 +1,63 @@
+"""Tests for PipelineStateManager persistence."""
+
+import unittest
+import tempfile
+import os
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from caption_extractor.pipeline.pipeline_state_manager import PipelineStateManager
+
+
+class TestPipelineStateManager(unittest.TestCase):
+    """Test cases for PipelineStateManager."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_path = os.path.join(self.temp_dir, 'image1.jpg')
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _round_trip(self, result_format, extension):
+        manager = PipelineStateManager(result_format=result_format)
+        state = manager.create_initial_state(self.image_path)
+        state['results']['ocr_data'] = {'text_lines': [{'bbox': (1, 2)}]}
+        
+        self.assertTrue(manager.save_state(self.image_path, state))
+        self.assertTrue(os.path.exists(
+            os.path.join(self.temp_dir, f'image1{extension}')
+        ))
+        
+        loaded = manager.load_state(self.image_path)
+        self.assertEqual(loaded['image_name'], 'image1.jpg')
+        self.assertEqual(
+            loaded['results']['ocr_data']['text_lines'][0]['bbox'], [1, 2]
+        )
+    
+    def test_yaml_round_trip(self):
+        """Test saving and loading state as YAML."""
+        self._round_trip('yaml', '.yml')
+    
+    def test_json_round_trip(self):
+        """Test saving and loading state as JSON."""
+        self._round_trip('json', '.json')
+    
+    def test_unknown_format_falls_back_to_yaml(self):
+        """Test that an unknown result format uses YAML."""
+        manager = PipelineStateManager(result_format='xml')
+        self.assertEqual(manager.result_format, 'yaml')
+    
+    def test_load_missing_state(self):
+        """Test loading state when no file exists."""
+        manager = PipelineStateManager()
+        self.assertIsNone(manager.load_state(self.image_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""Tests for TextAgent batched text correction."""
+
+import unittest
+import os
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from caption_extractor.llm.text.text_agent import BATCH_PROMPT_PREFIX, TextAgent
+from caption_extractor.performance.latency_recorder import LatencyRecorder
+
+
+class FakeOllamaClient:
+    """Ollama client stand-in returning canned responses."""
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.prompts = []
+    
+    def check_model_available(self, model_name):
+        return True
+    
+    def generate_text(self, model, prompt, **kwargs):
+        self.prompts.append(prompt)
+        response = self.responses.pop(0)
+        if response is None:
+            return None
+        return {
+            'response': response,
+            'model': model,
+            'processing_time': 1.0
+        }
+
+
+def _block(text):
+    return f"CORRECTED TEXT:\n{text}\n\nCHANGES:\nnone\n\nCONFIDENCE:\nhigh\n"
+
+
+class TestTextAgent(unittest.TestCase):
+    """Test cases for TextAgent.process_texts."""
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        LatencyRecorder.reset()
+    
+    def _agent(self, responses, batch_size=8):
+        config = {'ollama': {'text_agent': {'batch_size': batch_size}}}
+        agent = TextAgent(config, FakeOllamaClient(responses))
+        agent.detect_language = lambda text: {'language': 'English', 'code': 'en'}
+        return agent
+    
+    def test_batch_uses_single_request(self):
+        """Test that a batch of texts is corrected with one LLM call."""
+        agent = self._agent([
+            "=== ROW 1 ===\n" + _block("Hello") +
+            "=== ROW 2 ===\n" + _block("World")
+        ])
+        results = agent.process_texts(['Helo', 'Wrld'])
+        
+        self.assertEqual(len(agent.ollama_client.prompts), 1)
+        self.assertEqual(
+            [r['corrected_text'] for r in results], ['Hello', 'World']
+        )
+        metrics = LatencyRecorder.metrics_snapshot()['text_agent']
+        self.assertEqual((metrics['requests'], metrics['items']), (1, 2))
+        self.assertEqual(results[0]['processing_time'], 0.5)
+    
+    def test_missing_row_retried_alone(self):
+        """Test that rows absent from the batched response are retried."""
+        agent = self._agent([
+            "=== ROW 1 ===\n" + _block("Hello"),
+            _block("World")
+        ])
+        results = agent.process_texts(['Helo', 'Wrld'])
+        
+        self.assertEqual(len(agent.ollama_client.prompts), 2)
+        self.assertEqual(results[1]['corrected_text'], 'World')
+    
+    def test_batch_size_splits_requests(self):
+        """Test that texts beyond batch_size go into another request."""
+        agent = self._agent([
+            "=== ROW 1 ===\n" + _block("A") + "=== ROW 2 ===\n" + _block("B"),
+            _block("C")
+        ], batch_size=2)
+        results = agent.process_texts(['a', 'b', 'c'])
+        
+        self.assertEqual(len(agent.ollama_client.prompts), 2)
+        self.assertEqual([r['corrected_text'] for r in results], ['A', 'B', 'C'])
+
+    
+    def test_mismatched_vl_datas_rejected(self):
+        """Test that texts are not silently dropped when vl_datas is shorter."""
+        agent = self._agent([])
+        with self.assertRaises(ValueError):
+            agent.process_texts(['a', 'b'], [None])
+        self.assertEqual(agent.ollama_client.prompts, [])
+    
+    def test_failed_batch_is_bisected(self):
+        """Test that a failed batched request is retried as two halves."""
+        agent = self._agent([
+            None,
+            "=== ROW 1 ===\n" + _block("A") + "=== ROW 2 ===\n" + _block("B"),
+            "=== ROW 1 ===\n" + _block("C") + "=== ROW 2 ===\n" + _block("D"),
+        ], batch_size=4)
+        results = agent.process_texts(['a', 'b', 'c', 'd'])
+        
+        self.assertEqual(len(agent.ollama_client.prompts), 3)
+        self.assertEqual(
+            [r['corrected_text'] for r in results], ['A', 'B', 'C', 'D']
+        )
+        # Batches of different sizes share the constant prompt prefix
+        for prompt in agent.ollama_client.prompts:
+            self.assertTrue(prompt.startswith(BATCH_PROMPT_PREFIX))
+    
+    def test_language_parsed_from_correction_response(self):
+        """Test that language comes from the correction response itself."""
+        agent = self._agent([
+            _block("namaste duniya") +
+            '\nLANGUAGE:\n{"language": "Hindi", "code": "hi", '
+            '"needs_translation": "true", "text_to_translate": "namaste duniya"}'
+        ])
+        agent.detect_language = None
+        result = agent.process_text('namaste dunya')
+        
+        self.assertEqual(len(agent.ollama_client.prompts), 1)
+        self.assertEqual(result['confidence'], 'high')
+        self.assertEqual(result['language_code'], 'hi')
+        self.assertTrue(result['needTranslation'])
+        self.assertEqual(result['textToTranslate'], 'namaste duniya')
+
+    
+    def test_detect_language_cached(self):
+        """Test that detecting the same text twice makes one LLM call."""
+        response = '{"language": "Hindi", "code": "hi", "needs_translation": "true"}'
+        agent = TextAgent({}, FakeOllamaClient([response, response]))
+        
+        first = agent.detect_language('namaste')
+        second = agent.detect_language('namaste')
+        
+        self.assertEqual(len(agent.ollama_client.prompts), 1)
+        self.assertEqual(first, second)
+        self.assertEqual(second['code'], 'hi')
+
+
+if __name__ == '__main__':
+    unittest.main()